@@ -1,5 +1,9 @@
+# pylint: disable=C0412
+# Import the startup timer first, so it measures the imports as well.
+from utils.startup_timer import startup_timer
 import discord
 import os
+import asyncio
 import json
 import discord.ext
 import discord.ext.commands
@@ -9,18 +13,35 @@ from modules.general import General
 from modules.status_reel import StatusReel
 from modules.embedder.default import get_default_error_embed
 from utils.market_api import MarketApi
+from utils.loop_lag_monitor import LoopLagMonitor
+from utils.market_refresher import MarketRefresher
+from utils.cache_warmer import CacheWarmer
+from utils.chart_renderer import ChartRenderer
+from utils.expiry_scheduler import ExpiryScheduler
+from utils.write_behind_queue import WriteBehindQueue
+from utils.async_database import AsyncDatabase
+from utils.command_tree_sync import sync_command_tree
 from utils import database
 
 
+CACHE_SAVE_INTERVAL_SECONDS = 300
+COMMAND_TREE_HASH_LOCATION = os.path.join(os.path.dirname(__file__), "..", "config", "command_tree_hash.txt")
+
 class MarketBot(discord.ext.commands.AutoShardedBot):
     """A discord bot that provides information about the Tibia market."""
 
     def __init__(self, config: Dict[str, str]):
+        startup_timer.mark("imports")
         super().__init__(intents=discord.Intents.default(), command_prefix=discord.ext.commands.when_mentioned)
         self.config = config
         database.setup_database()
         self.market_api = MarketApi(config["market_api_token"])
         self.status_reel: StatusReel = StatusReel(self)
+        self.loop_lag_monitor: LoopLagMonitor = LoopLagMonitor()
+        self.market_refresher: MarketRefresher = MarketRefresher(self.market_api)
+        self.cache_warmer: CacheWarmer = CacheWarmer(self.market_api)
+        self.cache_saver_task: asyncio.Task = None
+        startup_timer.mark("initialization")
 
     async def on_command_error(self, context: discord.ext.commands.Context, exception: discord.ext.commands.errors.CommandError, /) -> None:
         """Notify the user on command errors.
@@ -43,18 +64,78 @@ class MarketBot(discord.ext.commands.AutoShardedBot):
     async def on_ready(self):
         """Start the status reel when the bot is ready."""
         print(f"Logged in as {self.user}")
+
+        # The bot gets ready again after reconnecting, only the first time is part of the startup.
+        if startup_timer.phases[-1][0] == "command tree sync":
+            startup_timer.mark("gateway")
+            print(startup_timer.format_report())
+            print(self.loop_lag_monitor.format_report())
+
         self.status_reel.start_reel()
 
     async def setup_hook(self):
-        """Add all cogs to the bot and sync the command tree."""
+        """Restore the saved caches, start warming them up, add all cogs to the bot and sync the command tree if it changed."""
+        startup_timer.mark("login")
+
+        # Restore the caches before the gateway connects, so the first commands don't wait for downloads.
+        print(f"Restored {await self.market_api.load_caches_async()} cached market data entries.")
+        startup_timer.mark("cache restore")
+
+        # Warm up the caches while the gateway connects.
+        self.cache_warmer.start()
+
+        self.cache_saver_task = asyncio.create_task(self.save_caches_periodically())
+        self.loop_lag_monitor.start()
+        ChartRenderer().start()
+        self.market_refresher.start()
         await self.load_modules()
-        await self.tree.sync()
+        startup_timer.mark("modules")
+
+        if not await sync_command_tree(self.tree, COMMAND_TREE_HASH_LOCATION):
+            print("Command tree is unchanged, skipped syncing it.")
+
+        startup_timer.mark("command tree sync")
 
     async def load_modules(self):
         """Load all module in the modules directory and add them as cogs to the bot."""
         await self.add_cog(Market(self))
         await self.add_cog(General(self))
 
+    async def save_caches_periodically(self):
+        """Save the market data caches to disk in an interval, so a crash restart can restore recent data as well, and report the event loop lag of the interval."""
+        while True:
+            await asyncio.sleep(CACHE_SAVE_INTERVAL_SECONDS)
+
+            try:
+                await self.market_api.save_caches_async()
+            except Exception as e:
+                print(f"Error saving the market data caches: {e}")
+
+            # Report the lag of each interval separately, so a recent blocking call isn't hidden by older measurements.
+            print(self.loop_lag_monitor.format_report())
+            self.loop_lag_monitor.reset()
+
+    async def close(self):
+        """Stop the background work, save the caches, write all pending settings and stop the database threads when the bot is closed."""
+        self.market_refresher.stop()
+        self.cache_warmer.stop()
+        self.loop_lag_monitor.stop()
+        ExpiryScheduler().stop()
+
+        if self.cache_saver_task:
+            self.cache_saver_task.cancel()
+
+        ChartRenderer().shutdown()
+
+        try:
+            await self.market_api.save_caches_async()
+        except Exception as e:
+            print(f"Error saving the market data caches: {e}")
+
+        await AsyncDatabase().run_async("flush", WriteBehindQueue().flush)
+        AsyncDatabase().shutdown()
+        await super().close()
+
     def run(self, *args, **kwargs):
         """Run the bot with the provided config."""
         super().run(self.config["discord_token"], *args, **kwargs)
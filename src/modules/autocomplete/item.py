@@ -3,6 +3,10 @@ from discord import app_commands
 from discord.interactions import Interaction
 from typing import List
 from utils.market_api import MarketApi
+from utils.autocomplete_sessions import AutocompleteSessions
+
+
+sessions: AutocompleteSessions = AutocompleteSessions()
 
 
 async def item_autocomplete(interaction: Interaction, current: str) -> List[app_commands.Choice]:
@@ -13,20 +17,23 @@ async def item_autocomplete(interaction: Interaction, current: str) -> List[app_
         current (str): The current string to match.
     """
     market_api: MarketApi = MarketApi()
-    normalized_current: str = market_api.normalize_identifier(current)
 
-    items = await market_api.meta_data.get_async()
+    # Make sure the meta data and with it the search index are loaded.
+    await market_api.meta_data.get_async()
 
-    # Create a list of choices that match the current string.
-    matches: List[app_commands.Choice] = []
-    for item_id in items:
-        item = items[item_id]
-        item_name = item.wiki_name if item.wiki_name else item.name
+    index = market_api.item_index.search_index
+    normalized_current = market_api.normalize_identifier(current)
+    session_key = interaction.user.id if interaction else None
 
-        if normalized_current in market_api.normalize_identifier(item_name):
-            matches.append(app_commands.Choice(name=item_name, value=item_name))
+    # Only filter the matches of the user's previous query if this one extends it.
+    # Without a session the search can stop after 25 matches, with one it keeps all of them for the next query.
+    candidates = sessions.get_candidates(session_key, index, normalized_current)
+    matches = index.get_matches(normalized_current, candidates, 25 if session_key is None else -1)
+    sessions.update(session_key, index, normalized_current, matches)
 
-    # Sort the matches by length and return the first 25.
-    matches = sorted(matches, key=lambda x: len(x.name))[:25]
+    # Get the 25 shortest names that match the current string, and fill up with the closest names in case of typos.
+    item_names = [index.names[rank] for rank in matches[:25]]
+    if len(item_names) < 25:
+        item_names += index.fuzzy_search(current, 25 - len(item_names), exclude=item_names)
 
-    return matches
+    return [app_commands.Choice(name=item_name, value=item_name) for item_name in item_names]
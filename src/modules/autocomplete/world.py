@@ -3,6 +3,10 @@ from discord import app_commands
 from discord.interactions import Interaction
 from typing import List
 from utils.market_api import MarketApi
+from utils.autocomplete_sessions import AutocompleteSessions
+
+
+sessions: AutocompleteSessions = AutocompleteSessions()
 
 
 async def world_autocomplete(interaction: Interaction, current: str) -> List[app_commands.Choice]:
@@ -16,14 +20,16 @@ async def world_autocomplete(interaction: Interaction, current: str) -> List[app
     normalized_current: str = market_api.normalize_identifier(current)
 
     worlds = await market_api.world_data.get_async()
+    session_key = interaction.user.id if interaction else None
 
-    # Create a list of choices that match the current string.
-    matches: List[app_commands.Choice] = []
-    for world_name in worlds:
-        if normalized_current in market_api.normalize_identifier(world_name):
-            matches.append(app_commands.Choice(name=world_name, value=world_name))
+    # Only filter the matches of the user's previous query if this one extends it.
+    world_names = sessions.get_candidates(session_key, worlds, normalized_current)
+    if world_names is None:
+        world_names = sorted(worlds, key=len)
 
-    # Sort the matches by length and return the first 25.
-    matches = sorted(matches, key=lambda x: len(x.name))[:25]
+    # Create a list of world names that match the current string, sorted by length.
+    world_names = [world_name for world_name in world_names if normalized_current in market_api.normalize_identifier(world_name)]
+    sessions.update(session_key, worlds, normalized_current, world_names)
 
-    return matches
+    # Return the first 25 matches.
+    return [app_commands.Choice(name=world_name, value=world_name) for world_name in world_names[:25]]
@@ -1,68 +1,54 @@
 import discord
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from datetime import datetime
 from utils.data.item_meta_data import ItemMetaData
 from utils.data.market_values import MarketValues
+from utils.data.history_series import HistorySeries, PriceStatistics
 from utils import GOLD_COIN_EMOJI
 from modules.embedder.default import get_default_embed
 from io import BytesIO
 
 
-def history_to_embedding(world: str, market_values: List[MarketValues], meta_data: ItemMetaData) -> Tuple[discord.Embed, discord.File]:
+def history_to_embedding(world: str, market_values: Union[HistorySeries, List[MarketValues]], meta_data: ItemMetaData, plot: bytes = None) -> Tuple[discord.Embed, discord.File]:
     """Converts a history to a discord.Embed object.
     
     Args:
         world (str): The name of the world.
-        market_values (List[MarketValues]): The market value history of the item.
+        market_values (Union[HistorySeries, List[MarketValues]]): The market value history of the item.
         meta_data (ItemMetaData): The meta data of the item.
+        plot (bytes, optional): The already rendered PNG image of the price history. Rendered here if None. Defaults to None.
         
     Returns:
         discord.Embed: The embed object.
     """
+    history = market_values if isinstance(market_values, HistorySeries) else HistorySeries(market_values)
+    statistics = history.get_statistics()
+
     embed = get_default_embed()
     embed.description = f"[{meta_data.wiki_name if meta_data.wiki_name else meta_data.name}]({meta_data.get_wiki_link()}) on {world}"
-    embed.timestamp = datetime.fromtimestamp(max(market_values, key=lambda x: x.time).time)
+    embed.timestamp = datetime.fromtimestamp(statistics.last_time)
     embed.set_thumbnail(url=meta_data.get_image_link())
 
-    bytesio: BytesIO = MarketValues.generate_price_history_plot(market_values)
+    bytesio: BytesIO = BytesIO(plot) if plot else MarketValues.generate_price_history_plot(history)
     file = discord.File(bytesio, filename="plot.png")
     embed.set_image(url="attachment://plot.png")
 
-    max_sell = max_sell_timestamp = min_sell = min_sell_timestamp = avg_sell = -1
-    max_buy = max_buy_timestamp = min_buy = min_buy_timestamp = avg_buy = -1
-    valid_sell_values = valid_buy_values = 0
-
-    for market_value in market_values:
-        current_sell_value = market_value.day_average_sell if market_value.day_average_sell > -1 else market_value.sell_offer
-        current_buy_value = market_value.day_average_buy if market_value.day_average_buy > -1 else market_value.buy_offer
+    if statistics.sell:
+        embed.add_field(name="Sell data", value=price_statistics_to_expression(statistics.sell))
 
-        if current_sell_value > 0:
-            valid_sell_values += 1
-            avg_sell += current_sell_value
-            if current_sell_value > max_sell:
-                max_sell = current_sell_value
-                max_sell_timestamp = int(market_value.time)
-            if min_sell == -1 or current_sell_value < min_sell:
-                min_sell = current_sell_value
-                min_sell_timestamp = int(market_value.time)
+    if statistics.buy:
+        embed.add_field(name="Buy data", value=price_statistics_to_expression(statistics.buy))
 
-        if current_buy_value > 0:
-            valid_buy_values += 1
-            avg_buy += current_buy_value
-            if current_buy_value > max_buy:
-                max_buy = current_buy_value
-                max_buy_timestamp = int(market_value.time)
-            if min_buy == -1 or current_buy_value < min_buy:
-                min_buy = current_buy_value
-                min_buy_timestamp = int(market_value.time)
+    return embed, file
 
-    avg_sell = avg_sell // valid_sell_values if valid_sell_values > 0 else 0
-    avg_buy = avg_buy // valid_buy_values if valid_buy_values > 0 else 0
 
-    if valid_sell_values:
-        embed.add_field(name="Sell data", value=f"`Max`: {max_sell:,}{GOLD_COIN_EMOJI}\n<t:{max_sell_timestamp}:R>\n`Min`: {min_sell:,}{GOLD_COIN_EMOJI}\n<t:{min_sell_timestamp}:R>\n`Avg`: {avg_sell:,}")
+def price_statistics_to_expression(statistics: PriceStatistics) -> str:
+    """Converts the statistics of a price series to a string expression.
 
-    if valid_buy_values:
-        embed.add_field(name="Buy data", value=f"`Max`: {max_buy:,}{GOLD_COIN_EMOJI}\n<t:{max_buy_timestamp}:R>\n`Min`: {min_buy:,}{GOLD_COIN_EMOJI}\n<t:{min_buy_timestamp}:R>\n`Avg`: {avg_buy:,}")
+    Args:
+        statistics (PriceStatistics): The statistics of the price series.
 
-    return embed, file
+    Returns:
+        str: The string expression.
+    """
+    return f"`Max`: {statistics.max:,}{GOLD_COIN_EMOJI}\n<t:{statistics.max_time}:R>\n`Min`: {statistics.min:,}{GOLD_COIN_EMOJI}\n<t:{statistics.min_time}:R>\n`Avg`: {statistics.mean:,}"
@@ -47,7 +47,7 @@ class General(commands.Cog):
         """
         await ctx.defer()
 
-        user = DiscordUser.from_database(ctx.author.id)[0]
+        user = (await DiscordUser.from_database_async(ctx.author.id))[0]
         default_world = MarketApi().normalize_world(default_world)
         await MarketApi().throw_if_world_not_found(default_world)
 
@@ -69,7 +69,7 @@ class General(commands.Cog):
         """
         await ctx.defer()
 
-        server =  DiscordServer.from_database(ctx.guild.id)[0]
+        server = (await DiscordServer.from_database_async(ctx.guild.id))[0]
         default_world = MarketApi().normalize_world(default_world)
         await MarketApi().throw_if_world_not_found(default_world)
 
@@ -7,7 +7,8 @@ from modules.embedder.market_values import market_value_to_embedding
 from modules.embedder.history import history_to_embedding
 from modules.embedder.market_board import market_board_to_embedding
 from utils.market_api import MarketApi
-from utils import get_default_world
+from utils.chart_renderer import ChartRenderer
+from utils import get_default_world_async
 
 if TYPE_CHECKING:
     from main import MarketBot
@@ -19,6 +20,7 @@ class Market(commands.Cog):
     def __init__(self, bot: "MarketBot"):
         self.bot = bot
         self.market_api = MarketApi()
+        self.chart_renderer = ChartRenderer()
 
     @commands.hybrid_group(invoke_without_command=False)
     async def item(self, ctx: commands.Context):
@@ -39,14 +41,14 @@ class Market(commands.Cog):
 
         # Get the default world if none is provided.
         if not world:
-            world = get_default_world(ctx)
+            world = await get_default_world_async(ctx)
 
-        # Fetch the market values from the API.
-        market_values = await self.market_api.get_market_values(world, item)
-        meta_data = await self.market_api.get_meta_data(item)
+        # Resolve the world and item once, and fetch the market values from the API.
+        context = await self.market_api.create_request_context(world, item)
+        market_values = await self.market_api.get_market_values(context=context)
 
         # Create a pretty embed with the market values.
-        embed = market_value_to_embedding(world, market_values, meta_data)
+        embed = market_value_to_embedding(context.server, market_values, context.meta_data)
 
         # Send the embed.
         await ctx.send(embed=embed)
@@ -76,14 +78,17 @@ class Market(commands.Cog):
 
         # Get the default world if none is provided.
         if not world:
-            world = get_default_world(ctx)
+            world = await get_default_world_async(ctx)
 
-        # Fetch the market history from the API.
-        market_history = await self.market_api.get_history(world, item, timespan)
-        meta_data = await self.market_api.get_meta_data(item)
+        # Resolve the world and item once, and fetch the market history from the API.
+        context = await self.market_api.create_request_context(world, item)
+        market_history = await self.market_api.get_history(timespan=timespan, context=context)
+
+        # Render the chart in a worker process, so it doesn't block the bot.
+        plot = await self.chart_renderer.render_price_history(market_history)
 
         # Create a pretty embed with the market history.
-        embed, file = history_to_embedding(world, market_history, meta_data)
+        embed, file = history_to_embedding(context.server, market_history, context.meta_data, plot)
 
         # Send the embed.
         await ctx.send(embed=embed, file=file)
@@ -103,13 +108,13 @@ class Market(commands.Cog):
 
         # Get the default world if none is provided.
         if not world:
-            world = get_default_world(ctx)
+            world = await get_default_world_async(ctx)
 
-        # Fetch the market board from the API.
-        market_board = await self.market_api.get_market_board(world, item)
-        meta_data = await self.market_api.get_meta_data(item)
+        # Resolve the world and item once, and fetch the market board from the API.
+        context = await self.market_api.create_request_context(world, item)
+        market_board = await self.market_api.get_market_board(context=context)
 
-        embed = market_board_to_embedding(world, market_board, meta_data)
+        embed = market_board_to_embedding(context.server, market_board, context.meta_data)
 
         # Send the embed.
         await ctx.send(embed=embed)
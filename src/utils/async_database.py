@@ -0,0 +1,164 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, TypeVar, Union
+import tinydb
+from utils import database
+from utils.decorators.singleton import singleton
+
+
+T = TypeVar("T")
+
+
+@singleton
+class AsyncDatabase:
+    """An async facade over the database tables, which runs every operation on a bounded pool of database threads,
+    so slow storage doesn't block the event loop. Reads of different threads run concurrently, writes are serialized by the database itself.
+
+    Args:
+        max_workers (int, optional): The maximum amount of operations running at the same time. Defaults to 4.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers: int = max_workers
+        self._executor: ThreadPoolExecutor = None
+        self._operation_counts: Dict[str, int] = {}
+        self._total_latencies: Dict[str, float] = {}
+        self._max_latencies: Dict[str, float] = {}
+
+    def get_operation_count(self, operation: str) -> int:
+        """Gets the amount of finished operations of a kind.
+
+        Args:
+            operation (str): The name of the operation, e.g. "get_data".
+
+        Returns:
+            int: The amount of finished operations.
+        """
+        return self._operation_counts.get(operation, 0)
+
+    def get_average_latency(self, operation: str) -> float:
+        """Gets the average time in seconds an operation took from being requested until it finished.
+
+        Args:
+            operation (str): The name of the operation, e.g. "get_data".
+
+        Returns:
+            float: The average latency, 0 if there were no operations of the kind yet.
+        """
+        count = self.get_operation_count(operation)
+        return self._total_latencies[operation] / count if count else 0
+
+    def get_max_latency(self, operation: str) -> float:
+        """Gets the longest time in seconds an operation took from being requested until it finished.
+
+        Args:
+            operation (str): The name of the operation, e.g. "get_data".
+
+        Returns:
+            float: The maximum latency, 0 if there were no operations of the kind yet.
+        """
+        return self._max_latencies.get(operation, 0)
+
+    async def get_data_async(self, table_type: type, query: tinydb.Query) -> List[T]:
+        """Get data from the database.
+
+        Args:
+            table_type (type): The type of the table.
+            query (tinydb.Query): The query to filter the data.
+
+        Returns:
+            List[T]: The list of data.
+        """
+        return await self.run_async("get_data", lambda: database.get_table(table_type).get_data(query))
+
+    async def insert_data_async(self, table_type: type, data: Union[T, List[T]]) -> List[int]:
+        """Insert data into the database.
+
+        Args:
+            table_type (type): The type of the table.
+            data (Union[T, List[T]]): The data to insert.
+
+        Returns:
+            List[int]: The list of inserted document IDs.
+        """
+        return await self.run_async("insert_data", lambda: database.get_table(table_type).insert_data(data))
+
+    async def update_data_async(self, table_type: type, query: tinydb.Query, data: T) -> List[int]:
+        """Update data in the database.
+
+        Args:
+            table_type (type): The type of the table.
+            query (tinydb.Query): The query to filter the data.
+            data (T): The data to update it with.
+
+        Returns:
+            List[int]: The list of updated document IDs.
+        """
+        return await self.run_async("update_data", lambda: database.get_table(table_type).update_data(query, data))
+
+    async def update_many_async(self, table_type: type, data: List[T], key: str = "id") -> List[int]:
+        """Update or insert multiple data in the database at once, each matched by its key.
+
+        Args:
+            table_type (type): The type of the table.
+            data (List[T]): The data to update it with.
+            key (str, optional): The field identifying the data. Defaults to "id".
+
+        Returns:
+            List[int]: The list of updated document IDs.
+        """
+        return await self.run_async("update_many", lambda: database.get_table(table_type).update_many(data, key))
+
+    async def delete_data_async(self, table_type: type, query: tinydb.Query) -> List[int]:
+        """Delete data from the database.
+
+        Args:
+            table_type (type): The type of the table.
+            query (tinydb.Query): The query to filter the data.
+
+        Returns:
+            List[int]: The list of removed document IDs.
+        """
+        return await self.run_async("delete_data", lambda: database.get_table(table_type).delete_data(query))
+
+    async def count_by_async(self, table_type: type, field: str) -> Dict[Any, int]:
+        """Count the data in the database grouped by the value of a field.
+
+        Args:
+            table_type (type): The type of the table.
+            field (str): The name of the field.
+
+        Returns:
+            Dict[Any, int]: The amount of data with each value of the field.
+        """
+        return await self.run_async("count_by", lambda: database.get_table(table_type).count_by(field))
+
+    async def run_async(self, operation: str, function: Callable[[], Any]) -> Any:
+        """Runs a database operation on a database thread and records its latency.
+
+        Args:
+            operation (str): The name of the operation, used for its latency statistics.
+            function (Callable[[], Any]): The function running the operation.
+
+        Returns:
+            Any: The result of the operation.
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="database")
+
+        start_time = time.monotonic()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function)
+        finally:
+            latency = time.monotonic() - start_time
+            self._operation_counts[operation] = self.get_operation_count(operation) + 1
+            self._total_latencies[operation] = self._total_latencies.get(operation, 0) + latency
+            self._max_latencies[operation] = max(self.get_max_latency(operation), latency)
+
+    def shutdown(self):
+        """Waits for the running operations and stops the database threads."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,57 @@
+from typing import Any, Hashable, List, Optional, Tuple
+from utils.bounded_cache import BoundedCache
+
+
+class AutocompleteSessions:
+    """Remembers the candidates of each user's previous autocomplete query, so a query extending it only has to filter those again.
+    A session expires once its user stopped typing for a few seconds.
+
+    Args:
+        idle_seconds (float, optional): The time in seconds after which an unused session expires. Defaults to 5.
+        max_sessions (int, optional): The maximum amount of sessions. Defaults to 10000.
+    """
+
+    def __init__(self, idle_seconds: float = 5, max_sessions: int = 10000):
+        self._sessions: BoundedCache[Hashable, Tuple[Any, str, List[Any]]] = BoundedCache(max_sessions, time_to_live_seconds=idle_seconds)
+        self.narrowed_count: int = 0
+        """The amount of queries that only filtered the candidates of the previous query."""
+
+    def get_candidates(self, session_key: Optional[Hashable], source: Any, normalized_query: str) -> Optional[List[Any]]:
+        """Gets the candidates of the previous query, if the new query extends it.
+
+        Args:
+            session_key (Optional[Hashable]): The key of the session, e.g. the id of the user. None if there is no session.
+            source (Any): The data the candidates were taken from. The candidates are only reused if it is still the same object.
+            normalized_query (str): The normalized new query.
+
+        Returns:
+            Optional[List[Any]]: The candidates of the previous query, or None if all data has to be searched.
+        """
+        if session_key is None:
+            return None
+
+        session = self._sessions.get(session_key)
+
+        if session is None:
+            return None
+
+        previous_source, previous_query, candidates = session
+
+        if previous_source is not source or not normalized_query.startswith(previous_query):
+            return None
+
+        self.narrowed_count += 1
+
+        return candidates
+
+    def update(self, session_key: Optional[Hashable], source: Any, normalized_query: str, candidates: List[Any]):
+        """Remembers the candidates of a query for the next query of the session.
+
+        Args:
+            session_key (Optional[Hashable]): The key of the session, e.g. the id of the user. None if there is no session.
+            source (Any): The data the candidates were taken from.
+            normalized_query (str): The normalized query.
+            candidates (List[Any]): All candidates matching the query.
+        """
+        if session_key is not None:
+            self._sessions.set(session_key, (source, normalized_query, candidates))
@@ -0,0 +1,224 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+def estimate_size(value: Any) -> int:
+    """Estimates the memory size of a value in bytes, including the objects it contains.
+
+    Args:
+        value (Any): The value to estimate the size of.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    if hasattr(value, "nbytes"):
+        return sys.getsizeof(value) + int(value.nbytes)
+
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(item) for item in value)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += estimate_size(vars(value))
+
+    return size
+
+
+class BoundedCache(Generic[K, V]):
+    """A dictionary-like cache which evicts the least recently used entries once it exceeds its entry or byte budget,
+    and entries which have not been accessed for longer than their time to live.
+
+    Args:
+        max_entries (int, optional): The maximum amount of entries. Defaults to -1, meaning unlimited.
+        max_bytes (int, optional): The maximum total size of all entries in bytes, as measured by size_of. Defaults to -1, meaning unlimited.
+        time_to_live_seconds (float, optional): The time in seconds after which an entry is evicted if it was not accessed. Defaults to -1, meaning forever.
+        size_of (Callable[[V], int], optional): The function that measures the size of an entry in bytes. Defaults to estimate_size.
+    """
+
+    def __init__(self, max_entries: int = -1, max_bytes: int = -1, time_to_live_seconds: float = -1, size_of: Callable[[V], int] = None):
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.time_to_live_seconds: float = time_to_live_seconds
+        self._size_of: Callable[[V], int] = size_of if size_of else estimate_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._access_times: Dict[K, float] = {}
+        self._sizes: Dict[K, int] = {}
+        self.total_bytes: int = 0
+        """The total size of all entries in bytes, as last measured."""
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries and not self._is_expired(key)
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self:
+            raise KeyError(key)
+
+        return self._entries[key]
+
+    def __setitem__(self, key: K, value: V):
+        self.set(key, value)
+
+    def keys(self) -> List[K]:
+        """Gets the keys of all entries, from least to most recently used.
+
+        Returns:
+            List[K]: The keys of all entries.
+        """
+        return list(self._entries.keys())
+
+    def get(self, key: K, default: V = None) -> V:
+        """Gets the value of an entry and marks it as recently used.
+
+        Args:
+            key (K): The key of the entry.
+            default (V, optional): The value to return if the entry does not exist. Defaults to None.
+
+        Returns:
+            V: The value of the entry, or the default value if it does not exist.
+        """
+        if key in self._entries and self._is_expired(key):
+            self._remove(key)
+            self.evictions += 1
+
+        if key not in self._entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(key)
+
+        return self._entries[key]
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Gets the value of an entry, or creates and adds it if it does not exist.
+
+        Args:
+            key (K): The key of the entry.
+            factory (Callable[[], V]): The function that creates the value if the entry does not exist.
+
+        Returns:
+            V: The value of the entry.
+        """
+        value = self.get(key, None)
+
+        if value is None:
+            value = factory()
+            self.set(key, value)
+
+        return value
+
+    def set(self, key: K, value: V):
+        """Adds or replaces an entry and evicts entries if the cache exceeds its limits.
+
+        Args:
+            key (K): The key of the entry.
+            value (V): The value of the entry.
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = value
+        self._touch(key)
+        self._measure(key)
+        self._evict()
+
+    def update_size(self, key: K):
+        """Measures the size of an entry again, for example after its value was loaded, and evicts entries if the cache exceeds its byte budget.
+
+        Args:
+            key (K): The key of the entry.
+        """
+        if key not in self._entries:
+            return
+
+        self._measure(key)
+        self._evict()
+
+    def pop(self, key: K, default: V = None) -> V:
+        """Removes an entry from the cache.
+
+        Args:
+            key (K): The key of the entry.
+            default (V, optional): The value to return if the entry does not exist. Defaults to None.
+
+        Returns:
+            V: The value of the removed entry, or the default value if it did not exist.
+        """
+        if key not in self._entries:
+            return default
+
+        return self._remove(key)
+
+    def evict_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Evicts all entries matching a predicate.
+
+        Args:
+            predicate (Callable[[K, V], bool]): The function that determines if an entry is evicted, given its key and value.
+
+        Returns:
+            int: The amount of evicted entries.
+        """
+        keys = [key for key, value in self._entries.items() if predicate(key, value)]
+
+        for key in keys:
+            self._remove(key)
+
+        self.evictions += len(keys)
+
+        return len(keys)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        self._entries.clear()
+        self._access_times.clear()
+        self._sizes.clear()
+        self.total_bytes = 0
+
+    def _touch(self, key: K):
+        self._entries.move_to_end(key)
+        self._access_times[key] = time.time()
+
+    def _measure(self, key: K):
+        if self.max_bytes < 0:
+            return
+
+        size = self._size_of(self._entries[key])
+        self.total_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _is_expired(self, key: K) -> bool:
+        return -1 < self.time_to_live_seconds <= time.time() - self._access_times[key]
+
+    def _remove(self, key: K) -> V:
+        del self._access_times[key]
+        self.total_bytes -= self._sizes.pop(key, 0)
+
+        return self._entries.pop(key)
+
+    def _evict(self):
+        """Evicts expired entries, then the least recently used entries until the cache is within its limits.
+        The most recently used entry is never evicted.
+        """
+        # Entries are ordered by access time, so the expired ones are at the front.
+        while len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            is_over_limit = -1 < self.max_entries < len(self._entries) or -1 < self.max_bytes < self.total_bytes
+
+            if not is_over_limit and not self._is_expired(oldest_key):
+                break
+
+            self._remove(oldest_key)
+            self.evictions += 1
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from typing import List, TYPE_CHECKING
+from utils.async_database import AsyncDatabase
+from utils.data.user import DiscordUser
+from utils.data.discord_server import DiscordServer
+
+if TYPE_CHECKING:
+    from utils.market_api import MarketApi
+
+
+class CacheWarmer:
+    """Loads the data most commands need while the bot connects to the gateway, so the first commands don't have to wait for it.
+    The meta data and world data are loaded first, then the market snapshots of the most used worlds are prefetched.
+    Worlds are ranked by how many users and servers have them as their default world.
+    Snapshots are loaded in the prefetch lane of the rate limiter, so commands are served first.
+
+    Args:
+        market_api (MarketApi): The market API whose caches are warmed up.
+        world_count (int, optional): The amount of most used worlds to prefetch the market snapshots of. Defaults to 10.
+    """
+
+    def __init__(self, market_api: "MarketApi", world_count: int = 10):
+        self.market_api: "MarketApi" = market_api
+        self.world_count: int = world_count
+        self.prefetched_count: int = 0
+        """The amount of market snapshots that were prefetched."""
+        self._task: asyncio.Task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Gets whether the warm-up is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Starts the warm-up on the running event loop."""
+        if self.is_running:
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run_async())
+
+    def stop(self):
+        """Stops the warm-up."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run_async(self):
+        try:
+            await self.warm_up_async()
+        except Exception as e:
+            print(f"Error warming up the caches: {e}")
+
+    async def warm_up_async(self) -> List[str]:
+        """Loads the meta data and world data concurrently, then prefetches the market snapshots of the most used worlds concurrently.
+
+        Returns:
+            List[str]: The names of the worlds whose market snapshots were prefetched.
+        """
+        start_time = time.perf_counter()
+
+        await asyncio.gather(self.market_api.meta_data.get_async(), self.market_api.world_data.get_async())
+        print(f"Warm-up: loaded the meta data and world data after {time.perf_counter() - start_time:.2f}s.")
+
+        worlds = await self.get_most_used_worlds_async()
+        prefetched_worlds = []
+
+        async def prefetch(world: str):
+            try:
+                if await self.market_api.prefetch_market_values_async(world):
+                    prefetched_worlds.append(world)
+                    self.prefetched_count += 1
+            except Exception as e:
+                print(f"Warm-up: failed to prefetch the market values of {world}: {e}")
+
+            print(f"Warm-up: {len(prefetched_worlds)}/{len(worlds)} market snapshots prefetched after {time.perf_counter() - start_time:.2f}s ({world}).")
+
+        await asyncio.gather(*[prefetch(world) for world in worlds])
+
+        return prefetched_worlds
+
+    async def get_most_used_worlds_async(self) -> List[str]:
+        """Ranks the worlds by how many users and servers have them as their default world.
+
+        Returns:
+            List[str]: The names of the most used existing worlds, most used first, at most world_count.
+        """
+        user_counts, server_counts = await asyncio.gather(AsyncDatabase().count_by_async(DiscordUser, "default_world"),
+                                                          AsyncDatabase().count_by_async(DiscordServer, "default_world"))
+        worlds = await self.market_api.world_data.get_async()
+        counts = {}
+
+        for world_counts in (user_counts, server_counts):
+            for world, count in world_counts.items():
+                world = self.market_api.normalize_world(world) if world else None
+
+                if world in worlds:
+                    counts[world] = counts.get(world, 0) + count
+
+        return sorted(counts, key=lambda world: counts[world], reverse=True)[:self.world_count]
@@ -1,7 +1,7 @@
 import time
 import asyncio
-from typing import Generic, TypeVar, Callable
-from utils import background_loop
+from typing import Generic, Optional, TypeVar, Callable
+from utils.expiry_scheduler import ExpiryScheduler
 
 
 T = TypeVar("T")
@@ -14,8 +14,13 @@ class CacheableData(Generic[T]):
         reload_predicate (Callable[[], bool], optional): The function that determines if the data needs to be reloaded. Defaults to None.
         invalidate_after_seconds (float, optional): The time interval in seconds after which the data needs to be reloaded. Defaults to -1.
         delete_after_interval (bool, optional): Whether to automatically delete the data cache after the interval has passed. Defaults to False.
+        stale_while_revalidate (bool, optional): Whether get_async keeps returning the previous value while it is reloaded in the background.
+            If the reload fails, the previous value is kept. Defaults to False.
+        background_loader (Callable[[], T], optional): The function that loads the data when revalidating in the background. Defaults to the loader.
     """
-    def __init__(self, loader: Callable[[], T], reload_predicate: Callable[[], bool] = None, invalidate_after_seconds: float = -1, delete_after_interval: bool = False):
+    # The revalidation options are keyword-only, pylint still counts them towards the maximum arguments.
+    def __init__(self, loader: Callable[[], T], reload_predicate: Callable[[], bool] = None, invalidate_after_seconds: float = -1, delete_after_interval: bool = False, *, # pylint: disable=R0913
+                 stale_while_revalidate: bool = False, background_loader: Callable[[], T] = None):
         self._value: T = None
         self._was_loaded: bool = False
         self._last_load_time: float = 0
@@ -23,9 +28,12 @@ class CacheableData(Generic[T]):
         self._reload_predicate: Callable[[], T] = reload_predicate if reload_predicate else lambda: False
         self._reload_interval_seconds: float = invalidate_after_seconds
         self._is_async = asyncio.iscoroutinefunction(loader) or asyncio.iscoroutinefunction(reload_predicate)
-        self._is_loop_running = False
+        self._is_expiry_scheduled = False
         self._delete_after_interval = delete_after_interval
         self._checker_lock = asyncio.Lock()
+        self._stale_while_revalidate = stale_while_revalidate
+        self._background_loader: Callable[[], T] = background_loader if background_loader else loader
+        self._revalidation_task: asyncio.Task = None
 
     @property
     def value(self) -> T:
@@ -39,8 +47,49 @@ class CacheableData(Generic[T]):
             self._was_loaded = True
             self._last_load_time = time.time()
 
-            if not self._is_loop_running and self._delete_after_interval and self._reload_interval_seconds > -1:
-                background_loop.run_in_background(self._check_expired_loop_async)
+            if not self._is_expiry_scheduled and self._delete_after_interval and self._reload_interval_seconds > -1:
+                self._is_expiry_scheduled = True
+                ExpiryScheduler().schedule(self._on_expiry_due, self._last_load_time + self._reload_interval_seconds)
+
+    @property
+    def age(self) -> float:
+        """Gets the time in seconds since the current value was loaded, or -1 if there is no value."""
+        return time.time() - self._last_load_time if self._was_loaded else -1
+
+    @property
+    def is_revalidating(self) -> bool:
+        """Gets whether the value is currently being reloaded in the background."""
+        return self._revalidation_task is not None and not self._revalidation_task.done()
+
+    def is_fresh(self, new_data_time: float = -1) -> bool:
+        """Checks if there is a value that doesn't need to be reloaded, without evaluating the reload predicate.
+
+        Args:
+            new_data_time (float, optional): The timestamp of new available data. Defaults to -1.
+
+        Returns:
+            bool: True if the value is loaded and neither expired nor older than the new data, False otherwise.
+        """
+        return self._was_loaded and not self._is_outdated(new_data_time, False)
+
+    def restore(self, value: T, load_time: float) -> bool:
+        """Sets a value that was loaded earlier, e.g. read from disk, keeping its original load time,
+        so it is revalidated and expires as if it was loaded by this cache. Does nothing if the current value was loaded later.
+
+        Args:
+            value (T): The value.
+            load_time (float): The timestamp the value was originally loaded at.
+
+        Returns:
+            bool: Whether the value was restored.
+        """
+        if self._was_loaded and self._last_load_time >= load_time:
+            return False
+
+        self.value = value
+        self._last_load_time = load_time
+
+        return True
 
     def invalidate(self):
         """Invalidates the cache, causing the data to be reloaded on the next get call."""
@@ -69,9 +118,7 @@ class CacheableData(Generic[T]):
 
         # Check if the value needs to be (re)loaded.
         # Because this is not async, we can skip the lock.
-        if not self._was_loaded or \
-           new_data_time > self._last_load_time or \
-           predicate_result:
+        if not self._was_loaded or self._is_outdated(new_data_time, predicate_result):
             self.value = self._loader()
 
         return self.value
@@ -92,11 +139,16 @@ class CacheableData(Generic[T]):
         if asyncio.iscoroutine(predicate_result):
             predicate_result = await predicate_result
 
+        # Serve the stale value while it is reloaded in the background.
+        if self._stale_while_revalidate and self._was_loaded:
+            if self._is_outdated(new_data_time, predicate_result):
+                self._start_revalidation()
+
+            return self.value
+
         # Check if the value needs to be (re)loaded.
         async with self._checker_lock:
-            if not self._was_loaded or \
-               new_data_time > self._last_load_time or \
-               predicate_result:
+            if not self._was_loaded or self._is_outdated(new_data_time, predicate_result):
                 self.value = self._loader()
 
                 if asyncio.iscoroutine(self.value):
@@ -104,30 +156,79 @@ class CacheableData(Generic[T]):
 
         return self.value
 
-    async def _check_expired_loop_async(self):
-        """Checks in a loop if the cache item is expired, and deletes the value if it is."""
-        async with self._checker_lock:
-            if self._is_loop_running:
-                return
+    def _is_outdated(self, new_data_time: float, predicate_result: bool) -> bool:
+        """Checks if the loaded value needs to be reloaded.
 
-            self._is_loop_running = True
+        Args:
+            new_data_time (float): The timestamp of new available data.
+            predicate_result (bool): The result of the reload predicate.
+
+        Returns:
+            bool: True if the value is outdated, False otherwise.
+        """
+        is_expired = -1 < self._reload_interval_seconds <= time.time() - self._last_load_time
+
+        return new_data_time > self._last_load_time or predicate_result or is_expired
+
+    async def revalidate_async(self):
+        """Reloads the value with the background loader right away, or waits for the reload that is already running.
+        Keeps the current value if the reload fails, and raises the error of the reload.
+        """
+        if not self.is_revalidating:
+            self._revalidation_task = asyncio.get_running_loop().create_task(self._revalidate_async())
+
+        error = await self._revalidation_task
+
+        if error:
+            raise error
+
+    def _start_revalidation(self):
+        """Starts reloading the value in the background, unless a reload is already running."""
+        if self.is_revalidating:
+            return
 
-        while True:
-            expires_in = self._check_expired()
+        self._revalidation_task = asyncio.get_running_loop().create_task(self._revalidate_async())
 
-            if expires_in <= 0:
-                break
+    async def _revalidate_async(self) -> Optional[Exception]:
+        """Reloads the value in the background. Keeps the stale value if the reload fails.
+
+        Returns:
+            Optional[Exception]: The error of the reload if it failed, None otherwise.
+        """
+        try:
+            value = self._background_loader()
+
+            if asyncio.iscoroutine(value):
+                value = await value
+        except Exception as e:
+            print(f"Error revalidating cached data, keeping the stale value: {e}")
+            return e
+
+        self.value = value
+        # The value might be equal to the stale one, but it is fresh now either way.
+        self._last_load_time = time.time()
+
+        return None
+
+    def _on_expiry_due(self) -> float:
+        """Called by the expiry scheduler once the cache item is due, deletes the value if it is expired.
+
+        Returns:
+            float: The seconds until the value expires, or a value <= 0 if it was deleted.
+        """
+        expires_in = self._check_expired()
 
-            # Sleep until the next expiry, but at least 100ms to prevent busy waiting.
-            await asyncio.sleep(max(expires_in, 0.1))
+        if expires_in <= 0:
+            self._is_expiry_scheduled = False
 
-        self._is_loop_running = False
+        return expires_in
 
     def _check_expired(self) -> float:
         current_time: float = time.time()
         time_passed = current_time - self._last_load_time
 
-        if self._reload_interval_seconds > -1 and time_passed >= self._reload_interval_seconds:
+        # Stale values are kept until they are replaced by the revalidation.
+        if -1 < self._reload_interval_seconds <= time_passed and not self._stale_while_revalidate:
             self.invalidate()
 
         return self._reload_interval_seconds - time_passed
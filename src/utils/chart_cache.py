@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import os
+import threading
+from typing import Optional
+from utils.bounded_cache import BoundedCache
+
+
+class ChartCache:
+    """Caches rendered charts by a content key, in a memory tier and a size-capped disk tier that survives restarts.
+
+    Args:
+        directory (str, optional): The directory of the disk tier. Defaults to the charts directory next to the database.
+        max_memory_entries (int, optional): The maximum amount of charts kept in memory. Defaults to 256.
+        max_disk_bytes (int, optional): The maximum total size in bytes of the charts kept on disk. Defaults to 256 MiB.
+    """
+
+    def __init__(self, directory: str = None, max_memory_entries: int = 256, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.directory: str = directory if directory else os.path.join(os.path.dirname(__file__), "data", "charts")
+        self.max_disk_bytes: int = max_disk_bytes
+        self.memory: BoundedCache[str, bytes] = BoundedCache(max_entries=max_memory_entries)
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: int = -1
+
+    @staticmethod
+    def create_key(*parts: bytes) -> str:
+        """Creates a cache key from the content a chart is rendered from.
+
+        Args:
+            parts (bytes): The content of the chart, e.g. the bytes of its series.
+
+        Returns:
+            str: The cache key.
+        """
+        content_hash = hashlib.sha256()
+
+        for part in parts:
+            content_hash.update(len(part).to_bytes(8, "little"))
+            content_hash.update(part)
+
+        return content_hash.hexdigest()
+
+    async def get_async(self, key: str) -> Optional[bytes]:
+        """Gets a chart from the memory tier, or from the disk tier if it is not in memory.
+
+        Args:
+            key (str): The cache key of the chart.
+
+        Returns:
+            Optional[bytes]: The PNG image of the chart, or None if it is not cached.
+        """
+        chart = self.memory.get(key)
+
+        if chart is None:
+            chart = await asyncio.to_thread(self._read, key)
+
+            if chart is None:
+                self.misses += 1
+                return None
+
+            self.disk_hits += 1
+            self.memory.set(key, chart)
+
+        return chart
+
+    async def set_async(self, key: str, chart: bytes):
+        """Adds a chart to the memory and disk tier.
+
+        Args:
+            key (str): The cache key of the chart.
+            chart (bytes): The PNG image of the chart.
+        """
+        self.memory.set(key, chart)
+        await asyncio.to_thread(self._write, key, chart)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._get_path(key)
+
+        try:
+            with open(path, mode="rb") as f:
+                chart = f.read()
+
+            # Mark the chart as recently used, the disk tier evicts by modification time.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return chart
+
+    def _write(self, key: str, chart: bytes):
+        path = self._get_path(key)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with self._disk_lock:
+            os.makedirs(self.directory, exist_ok=True)
+
+            if self._disk_bytes < 0:
+                self._disk_bytes = sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.name.endswith(".png"))
+
+            if os.path.exists(path):
+                return
+
+            # Write to a temporary file first, so a crash can't leave a partial chart behind.
+            with open(temporary_path, mode="wb") as f:
+                f.write(chart)
+
+            os.replace(temporary_path, path)
+            self._disk_bytes += len(chart)
+
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """Deletes the least recently used charts until the disk tier is at most 90% full."""
+        entries = sorted((entry for entry in os.scandir(self.directory) if entry.name.endswith(".png")), key=lambda entry: entry.stat().st_mtime)
+
+        for entry in entries:
+            if self._disk_bytes <= self.max_disk_bytes * 0.9:
+                break
+
+            size = entry.stat().st_size
+
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+            self._disk_bytes -= size
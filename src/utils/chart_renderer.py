@@ -0,0 +1,105 @@
+import asyncio
+import multiprocessing
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Union
+from utils.data.market_values import MarketValues, render_price_history_plot, PRICE_HISTORY_PLOT_WIDTH
+from utils.data.history_series import HistorySeries
+from utils.chart_cache import ChartCache
+from utils.decorators.singleton import singleton
+
+
+def _initialize_worker():
+    """Prepares a worker process by rendering a throwaway chart, so fonts and renderer caches are loaded before the first real job."""
+    render_price_history_plot(np.array([0, 1], dtype=np.float64), np.array([1, 2], dtype=np.float64), np.array([1, 2], dtype=np.float64))
+
+
+@singleton
+class ChartRenderer:
+    """Renders charts in a bounded pool of worker processes, so rendering does not block the event loop and scales with the available cores.
+    Rendered charts are cached by their content, so identical charts are only rendered once.
+
+    Args:
+        max_workers (int, optional): The amount of worker processes. Defaults to 2.
+        chart_cache (ChartCache, optional): The cache of rendered charts. Defaults to a ChartCache in the default directory.
+    """
+
+    def __init__(self, max_workers: int = 2, chart_cache: ChartCache = None):
+        self.max_workers: int = max_workers
+        self.chart_cache: ChartCache = chart_cache if chart_cache else ChartCache()
+        self.queue_depth: int = 0
+        """The amount of charts waiting for or being rendered."""
+        self.render_count: int = 0
+        self.max_render_latency: float = 0
+        """The longest time in seconds a chart took from being requested until it was rendered."""
+        self._total_render_latency: float = 0
+        self._executor: ProcessPoolExecutor = None
+
+    @property
+    def average_render_latency(self) -> float:
+        """Gets the average time in seconds a chart took from being requested until it was rendered."""
+        return self._total_render_latency / self.render_count if self.render_count else 0
+
+    def start(self):
+        """Starts the worker processes, so the first chart doesn't have to wait for them."""
+        if self._executor:
+            return
+
+        # Spawn fresh processes instead of forking, the bot's threads and event loops must not be copied into the workers.
+        self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"), initializer=_initialize_worker)
+
+        for _ in range(self.max_workers):
+            self._executor.submit(int)
+
+    def shutdown(self):
+        """Stops the worker processes."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def render_price_history(self, market_values: Union[HistorySeries, List[MarketValues]]) -> bytes:
+        """Renders the price history plot of an item in a worker process, or returns it from the cache if it was rendered before.
+
+        Args:
+            market_values (Union[HistorySeries, List[MarketValues]]): The market values history of the item.
+
+        Returns:
+            bytes: The PNG image of the plot.
+        """
+        history = market_values if isinstance(market_values, HistorySeries) else HistorySeries(market_values)
+        series = history.get_plot_series(PRICE_HISTORY_PLOT_WIDTH)
+        show_markers = len(history) < 31
+        cache_key = ChartCache.create_key(b"price_history", bytes([show_markers]), *[values.tobytes() for values in series])
+        plot = await self.chart_cache.get_async(cache_key)
+
+        if plot is None:
+            plot = await self._render(render_price_history_plot, *series, show_markers)
+            await self.chart_cache.set_async(cache_key, plot)
+
+        return plot
+
+    async def _render(self, render_function: Callable[..., bytes], *args: Any) -> bytes:
+        """Runs a render function in a worker process.
+
+        Args:
+            render_function (Callable[..., bytes]): The module level function rendering the chart.
+            args (Any): The arguments of the render function.
+
+        Returns:
+            bytes: The rendered image.
+        """
+        self.start()
+        start_time = time.monotonic()
+        self.queue_depth += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, render_function, *args)
+        finally:
+            self.queue_depth -= 1
+            self._record_latency(time.monotonic() - start_time)
+
+    def _record_latency(self, latency: float):
+        self.render_count += 1
+        self._total_render_latency += latency
+        self.max_render_latency = max(self.max_render_latency, latency)
@@ -0,0 +1,47 @@
+import hashlib
+import json
+import os
+import discord
+
+
+def get_command_tree_hash(tree: discord.app_commands.CommandTree) -> str:
+    """Gets a hash of the definition of all global commands of a command tree, as it is sent to Discord when syncing.
+
+    Args:
+        tree (discord.app_commands.CommandTree): The command tree.
+
+    Returns:
+        str: The hex digest of the hash.
+    """
+    commands = sorted((command.to_dict(tree) for command in tree.get_commands()), key=lambda command: (command["type"], command["name"]))
+    definition = {"application_id": tree.client.application_id, "commands": commands}
+
+    return hashlib.sha256(json.dumps(definition, sort_keys=True).encode("utf-8")).hexdigest()
+
+async def sync_command_tree(tree: discord.app_commands.CommandTree, hash_location: str) -> bool:
+    """Syncs the command tree with Discord, unless it is unchanged since the last sync.
+    Syncing is slow and rate limited, so the hash of the synced tree is stored and compared on every start.
+
+    Args:
+        tree (discord.app_commands.CommandTree): The command tree.
+        hash_location (str): The path of the file storing the hash of the last synced tree.
+
+    Returns:
+        bool: Whether the tree was synced.
+    """
+    tree_hash = get_command_tree_hash(tree)
+
+    if os.path.exists(hash_location):
+        with open(hash_location, mode="r", encoding="utf-8") as f:
+            if f.read().strip() == tree_hash:
+                return False
+
+    await tree.sync()
+
+    # Only store the hash once the sync succeeded, so a failed sync is retried on the next start.
+    os.makedirs(os.path.dirname(hash_location), exist_ok=True)
+
+    with open(hash_location, mode="w", encoding="utf-8") as f:
+        f.write(tree_hash)
+
+    return True
@@ -1,6 +1,5 @@
 from pydantic import BaseModel
-from tinydb import Query
-from utils import database
+from utils.settings_cache import SettingsCache
 from typing import Tuple
 
 
@@ -14,8 +13,7 @@ class DiscordServer(BaseModel):
 
     def save(self):
         """Saves the server to the database."""
-        table = database.get_table(DiscordServer)
-        table.update_data(Query().id == self.id, self)
+        settings_cache.save(self)
 
     @staticmethod
     def from_database(server_id: int) -> Tuple["DiscordServer", bool]:
@@ -27,10 +25,20 @@ class DiscordServer(BaseModel):
         Returns:
             Tuple[DiscordServer, bool]: A tuple containing the DiscordServer object and a boolean indicating if the server was found in the database.
         """
-        table = database.get_table(DiscordServer)
-        server_data = table.get_data(Query().id == server_id)
+        return settings_cache.get(server_id)
+
+    @staticmethod
+    async def from_database_async(server_id: int) -> Tuple["DiscordServer", bool]:
+        """Loads the discord server settings from the database without blocking the event loop if it exists, otherwise creates a new one.
+
+        Args:
+            server_id (int): The discord server id.
+
+        Returns:
+            Tuple[DiscordServer, bool]: A tuple containing the DiscordServer object and a boolean indicating if the server was found in the database.
+        """
+        return await settings_cache.get_async(server_id)
 
-        if not server_data:
-            return DiscordServer(id=server_id), False
 
-        return server_data[0], True
+settings_cache: SettingsCache[DiscordServer] = SettingsCache(DiscordServer)
+"""The cached settings of each server."""
@@ -0,0 +1,200 @@
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from pydantic import BaseModel
+import numpy as np
+
+if TYPE_CHECKING:
+    from utils.data.market_values import MarketValues
+
+
+def largest_triangle_three_buckets(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Selects the points of a series which preserve its visual shape best, using the Largest-Triangle-Three-Buckets algorithm.
+
+    Args:
+        x (np.ndarray): The x values of the series, in ascending order.
+        y (np.ndarray): The y values of the series.
+        threshold (int): The maximum amount of points to select.
+
+    Returns:
+        np.ndarray: The indices of the selected points, in ascending order.
+    """
+    point_count = len(x)
+
+    if threshold >= point_count or threshold < 3:
+        return np.arange(point_count)
+
+    # The first and last point are always kept, the points in between are split into threshold - 2 buckets.
+    bucket_edges = np.linspace(1, point_count - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = point_count - 1
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start, end = bucket_edges[bucket], bucket_edges[bucket + 1]
+
+        # The third corner of the triangle is the average of the next bucket, or the last point for the last bucket.
+        if bucket == threshold - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = bucket_edges[bucket + 2]
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous]) - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+
+    return indices
+
+
+class PriceStatistics(BaseModel):
+    """A data class containing the statistics of one price series of a history.
+    """
+
+    count: int
+    """The amount of entries with a valid price."""
+    max: int
+    max_time: int
+    """The time of the first entry with the highest price."""
+    min: int
+    min_time: int
+    """The time of the first entry with the lowest price."""
+    mean: int
+    """The mean price, rounded down."""
+    median: float
+    percentiles: Dict[int, float]
+    """The price percentiles, by percent."""
+    volume: int
+    """The total amount of items traded."""
+
+
+class HistoryStatistics(BaseModel):
+    """A data class containing the statistics of a history.
+    """
+
+    last_time: int
+    """The time of the latest entry."""
+    sell: Optional[PriceStatistics] = None
+    """The sell price statistics, None if there are no valid sell prices."""
+    buy: Optional[PriceStatistics] = None
+    """The buy price statistics, None if there are no valid buy prices."""
+
+
+class HistorySeries:
+    """The price history of an item as columnar arrays, built once per fetched history.
+    Behaves like the list of MarketValues it was built from.
+
+    Args:
+        market_values (List[MarketValues]): The market values history of the item, in ascending order of time.
+    """
+
+    STATISTICS_PERCENTILES: Tuple[int, ...] = (10, 25, 50, 75, 90)
+    """The percentiles computed by get_statistics."""
+
+    def __init__(self, market_values: List["MarketValues"]):
+        self.market_values: List["MarketValues"] = market_values
+        self._statistics: Optional[HistoryStatistics] = None
+
+        # Read every field needed for the chart and the statistics in a single pass over the history.
+        columns = np.array([(market_value.time, market_value.day_average_sell, market_value.sell_offer, market_value.day_sold,
+                             market_value.day_average_buy, market_value.buy_offer, market_value.day_bought) for market_value in market_values], dtype=np.float64).reshape(-1, 7).T
+
+        self.time: np.ndarray = columns[0]
+        """The time of each entry in seconds."""
+        self.sell: np.ndarray = self._get_prices(columns[1], columns[2])
+        """The sell price of each entry, NaN where there is no price."""
+        self.sold: np.ndarray = np.maximum(columns[3], 0)
+        """The amount of items sold in each entry."""
+        self.buy: np.ndarray = self._get_prices(columns[4], columns[5])
+        """The buy price of each entry, NaN where there is no price."""
+        self.bought: np.ndarray = np.maximum(columns[6], 0)
+        """The amount of items bought in each entry."""
+
+    @staticmethod
+    def _get_prices(day_average: np.ndarray, offer: np.ndarray) -> np.ndarray:
+        """Gets the price series, falling back to the offer if there is no day average.
+
+        Args:
+            day_average (np.ndarray): The day average prices.
+            offer (np.ndarray): The offer prices.
+
+        Returns:
+            np.ndarray: The prices, NaN where neither is a valid price.
+        """
+        prices = np.where(day_average > -1, day_average, offer)
+        prices[prices <= 0] = np.nan
+
+        return prices
+
+    def __len__(self) -> int:
+        return len(self.market_values)
+
+    def __iter__(self) -> Iterator["MarketValues"]:
+        return iter(self.market_values)
+
+    def __getitem__(self, index: int) -> "MarketValues":
+        return self.market_values[index]
+
+    def get_statistics(self) -> HistoryStatistics:
+        """Gets the statistics of the history, computed once and shared by every caller.
+
+        Returns:
+            HistoryStatistics: The statistics of the history.
+        """
+        if self._statistics is None:
+            self._statistics = HistoryStatistics(last_time=int(self.time.max()) if len(self) else 0,
+                                                 sell=self._get_price_statistics(self.sell, self.sold),
+                                                 buy=self._get_price_statistics(self.buy, self.bought))
+
+        return self._statistics
+
+    def _get_price_statistics(self, prices: np.ndarray, volumes: np.ndarray) -> Optional[PriceStatistics]:
+        """Computes the statistics of a price series.
+
+        Args:
+            prices (np.ndarray): The prices, NaN where there is no price.
+            volumes (np.ndarray): The amount of items traded in each entry.
+
+        Returns:
+            Optional[PriceStatistics]: The statistics, or None if there are no valid prices.
+        """
+        valid = np.isfinite(prices)
+
+        if not valid.any():
+            return None
+
+        valid_prices = prices[valid]
+        valid_times = self.time[valid]
+        max_index = int(np.argmax(valid_prices))
+        min_index = int(np.argmin(valid_prices))
+        percentiles = np.percentile(valid_prices, self.STATISTICS_PERCENTILES)
+
+        return PriceStatistics(count=len(valid_prices),
+                               max=int(valid_prices[max_index]),
+                               max_time=int(valid_times[max_index]),
+                               min=int(valid_prices[min_index]),
+                               min_time=int(valid_times[min_index]),
+                               mean=int(valid_prices.sum()) // len(valid_prices),
+                               median=float(percentiles[self.STATISTICS_PERCENTILES.index(50)]),
+                               percentiles={percent: float(value) for percent, value in zip(self.STATISTICS_PERCENTILES, percentiles)},
+                               volume=int(volumes[valid].sum()))
+
+    def get_plot_series(self, max_points: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gets the time in days, sell and buy series to plot, downsampled so each line has at most max_points points.
+
+        Args:
+            max_points (int): The maximum amount of points per line, e.g. the pixel width of the chart.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The time, sell and buy series.
+        """
+        days = self.time / (24 * 3600)
+
+        if len(self) <= max_points:
+            return days, self.sell, self.buy
+
+        # Downsample both lines separately, and keep every entry which either of them needs.
+        indices = [np.flatnonzero(np.isfinite(prices)) for prices in (self.sell, self.buy)]
+        selected = [valid[largest_triangle_three_buckets(days[valid], prices[valid], max_points // 2)] for valid, prices in zip(indices, (self.sell, self.buy))]
+        selected = np.union1d(*selected)
+
+        return days[selected], self.sell[selected], self.buy[selected]
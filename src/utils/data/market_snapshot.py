@@ -0,0 +1,223 @@
+from typing import Any, Dict, Iterator, List
+from utils.data.market_values import MarketValues
+import numpy as np
+
+
+_FIELD_DTYPES: Dict[type, Any] = {int: np.int64, float: np.float64, bool: np.bool_, str: object}
+
+class MarketSnapshot:
+    """The market values of all items of a world, stored as one NumPy array per MarketValues field.
+    Rows are sorted by item id, which serves as the id to row index. Single items are returned as MarketValues views on demand,
+    while whole-world queries run as array operations.
+
+    Args:
+        columns (Dict[str, np.ndarray]): One array per MarketValues field, all of the same length.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        order = np.argsort(columns["id"], kind="stable")
+        self.columns: Dict[str, np.ndarray] = {name: column[order] for name, column in columns.items()}
+        self.ids: np.ndarray = self.columns["id"]
+
+    @staticmethod
+    def from_market_values(market_values: List[MarketValues]) -> "MarketSnapshot":
+        """Creates a snapshot from a list of market values.
+
+        Args:
+            market_values (List[MarketValues]): The market values of the items.
+
+        Returns:
+            MarketSnapshot: The snapshot containing the market values.
+        """
+        columns = {}
+
+        for name, field in MarketValues.model_fields.items():
+            dtype = _FIELD_DTYPES[field.annotation]
+            columns[name] = np.fromiter((getattr(market_value, name) for market_value in market_values), dtype=dtype, count=len(market_values))
+
+        return MarketSnapshot(columns)
+
+    @staticmethod
+    def from_rows(rows: List[Dict[str, Any]]) -> "MarketSnapshot":
+        """Creates a snapshot directly from decoded API rows, without creating MarketValues models first.
+        The rows are not validated, missing fields are set to their default value.
+
+        Args:
+            rows (List[Dict[str, Any]]): The decoded market values of the items.
+
+        Returns:
+            MarketSnapshot: The snapshot containing the market values.
+        """
+        columns = {}
+
+        for name, field in MarketValues.model_fields.items():
+            dtype = _FIELD_DTYPES[field.annotation]
+
+            if field.is_required():
+                values = (row[name] for row in rows)
+            else:
+                values = (row.get(name, field.default) for row in rows)
+
+            columns[name] = np.fromiter(values, dtype=dtype, count=len(rows))
+
+        return MarketSnapshot(columns)
+
+    @staticmethod
+    def from_arrays(arrays: Dict[str, np.ndarray]) -> "MarketSnapshot":
+        """Creates a snapshot from the arrays of to_arrays, e.g. after reading them from disk.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): One array per MarketValues field.
+
+        Returns:
+            MarketSnapshot: The snapshot containing the market values.
+        """
+        columns = {}
+
+        for name, field in MarketValues.model_fields.items():
+            columns[name] = arrays[name].astype(_FIELD_DTYPES[field.annotation], copy=False)
+
+        return MarketSnapshot(columns)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Gets the columns as arrays that can be stored without pickling, string columns are converted to fixed width unicode arrays.
+
+        Returns:
+            Dict[str, np.ndarray]: One array per MarketValues field.
+        """
+        return {name: column.astype(str) if column.dtype == object else column for name, column in self.columns.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """Gets the size of all columns in bytes."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return (int(item_id) for item_id in self.ids)
+
+    def __contains__(self, item_id: int) -> bool:
+        return self.get_row(item_id) > -1
+
+    def __getitem__(self, item_id: int) -> MarketValues:
+        row = self.get_row(item_id)
+
+        if row < 0:
+            raise KeyError(item_id)
+
+        return self.get_row_values(row)
+
+    def get(self, item_id: int, default: MarketValues = None) -> MarketValues:
+        """Gets the market values of an item.
+
+        Args:
+            item_id (int): The id of the item.
+            default (MarketValues, optional): The value to return if the item is not in the snapshot. Defaults to None.
+
+        Returns:
+            MarketValues: The market values of the item, or the default value.
+        """
+        return self[item_id] if item_id in self else default
+
+    def get_row(self, item_id: int) -> int:
+        """Gets the row of an item.
+
+        Args:
+            item_id (int): The id of the item.
+
+        Returns:
+            int: The row of the item, or -1 if it is not in the snapshot.
+        """
+        row = int(np.searchsorted(self.ids, item_id))
+
+        if row < len(self.ids) and self.ids[row] == item_id:
+            return row
+
+        return -1
+
+    def get_row_values(self, row: int) -> MarketValues:
+        """Creates a MarketValues view of a row.
+
+        Args:
+            row (int): The row to create the view of.
+
+        Returns:
+            MarketValues: The market values of the row.
+        """
+        values = {}
+
+        for name, column in self.columns.items():
+            value = column[row]
+            values[name] = value.item() if isinstance(value, np.generic) else value
+
+        return MarketValues.model_construct(**values)
+
+    def column(self, name: str) -> np.ndarray:
+        """Gets the array of a MarketValues field, ordered by item id.
+
+        Args:
+            name (str): The name of the field.
+
+        Returns:
+            np.ndarray: The values of the field for all items.
+        """
+        return self.columns[name]
+
+    def filter(self, mask: np.ndarray) -> "MarketSnapshot":
+        """Creates a snapshot of the items matching a mask.
+
+        Args:
+            mask (np.ndarray): A boolean array with one entry per row, e.g. snapshot.column("sell_offer") > 0.
+
+        Returns:
+            MarketSnapshot: The snapshot containing only the matching items.
+        """
+        return MarketSnapshot({name: column[mask] for name, column in self.columns.items()})
+
+    def sort_by(self, name: str, descending: bool = False) -> np.ndarray:
+        """Sorts the items by a MarketValues field.
+
+        Args:
+            name (str): The name of the field to sort by.
+            descending (bool, optional): Whether to sort in descending order. Defaults to False.
+
+        Returns:
+            np.ndarray: The item ids in sorted order.
+        """
+        order = np.argsort(self.columns[name], kind="stable")
+
+        if descending:
+            order = order[::-1]
+
+        return self.ids[order]
+
+    def top_k(self, name: str, k: int, descending: bool = True) -> List[MarketValues]:
+        """Gets the k items with the highest, or lowest, value of a MarketValues field.
+
+        Args:
+            name (str): The name of the field to rank by.
+            k (int): The amount of items to return.
+            descending (bool, optional): Whether to return the highest values instead of the lowest. Defaults to True.
+
+        Returns:
+            List[MarketValues]: The market values of the top k items, in ranked order.
+        """
+        k = min(k, len(self))
+
+        if k <= 0:
+            return []
+
+        column = self.columns[name]
+
+        # Partition first, so only the top k rows need to be sorted.
+        # The column isn't negated for descending order, since that doesn't work for bool and str columns.
+        if descending:
+            rows = np.argpartition(column, len(self) - k)[len(self) - k:]
+            rows = rows[np.argsort(column[rows], kind="stable")[::-1]]
+        else:
+            rows = np.argpartition(column, k - 1)[:k]
+            rows = rows[np.argsort(column[rows], kind="stable")]
+
+        return [self.get_row_values(row) for row in rows]
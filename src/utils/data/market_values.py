@@ -1,9 +1,12 @@
 from pydantic import BaseModel
 from typing import List
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import numpy as np
 from io import BytesIO
+from utils.data.history_series import HistorySeries
+
+
+PRICE_HISTORY_PLOT_WIDTH = 640
+"""The width of the price history plot in pixels, and the maximum amount of points plotted per line."""
 
 
 class MarketValues(BaseModel):
@@ -44,59 +47,74 @@ class MarketValues(BaseModel):
             market_values (List[MarketValues]): The market values of the item.
 
         Returns:
-            str: The path to the saved plot.
+            BytesIO: The PNG image of the plot.
         """
-        plt.ioff()
-
-        time = np.array([market_value.time / (24 * 3600) for market_value in market_values], dtype=np.float64)
-        sell = [market_value.day_average_sell if market_value.day_average_sell > -1 else market_value.sell_offer for market_value in market_values]
-        buy = [market_value.day_average_buy if market_value.day_average_buy > -1 else market_value.buy_offer for market_value in market_values]
-
-        sell = np.array([price if price > 0 else None for price in sell], dtype=np.float64)
-        buy = np.array([price if price > 0 else None for price in buy], dtype=np.float64)
-        sell_mask = np.isfinite(sell)
-        buy_mask = np.isfinite(buy)
-
-        line_color = "#A9A9A9"
-        buy_color = "#8884d8"
-        sell_color = "#82ca9d"
-
-        # Create a new figure.
-        figure = plt.figure(facecolor=None)
-        figure.tight_layout()
-
-        subplot = figure.add_subplot(111, facecolor=None)
-        subplot.grid(True, color=line_color, linestyle="--", linewidth=0.5, which="major", axis="both", alpha=0.25)
-        subplot.set_xlim(min(time), max(time))
-        subplot.spines["top"].set_visible(False)
-        subplot.spines["right"].set_visible(False)
-        subplot.spines["bottom"].set_color(line_color)
-        subplot.spines["left"].set_color(line_color)
-        subplot.tick_params(colors=line_color)
-        subplot.yaxis.label.set_color(line_color)
-        subplot.xaxis.label.set_color(line_color)
-
-        # Set the x-axis to display dates.
-        subplot.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        figure.autofmt_xdate()
-
-        # Plot the sell and buy values.
-        subplot.plot(time[sell_mask], sell[sell_mask], label="Sell price", linestyle="-", color=sell_color, marker="o" if len(sell) < 31 else None)
-        subplot.plot(time[buy_mask], buy[buy_mask], label="Buy price", linestyle="-", color=buy_color, marker="o" if len(buy) < 31 else None)
-
-        # Set the labels and title.
-        subplot.set_xlabel("Time", color=line_color)
-        subplot.set_ylabel("Price", color=line_color)
-
-        # Add a legend.
-        subplot.legend(facecolor=None, edgecolor=None, labelcolor=line_color, framealpha=0)
-
-        # Save the plot to a BytesIO object.
-        plot_bytes = BytesIO()
-        figure.savefig(plot_bytes, format="png", transparent=True)
-        plot_bytes.seek(0)
-
-        # Clear the figure.
-        figure.clear()
-
-        return plot_bytes
+        history = market_values if isinstance(market_values, HistorySeries) else HistorySeries(market_values)
+        plot = render_price_history_plot(*history.get_plot_series(PRICE_HISTORY_PLOT_WIDTH), show_markers=len(history) < 31)
+
+        return BytesIO(plot)
+
+
+def render_price_history_plot(time: np.ndarray, sell: np.ndarray, buy: np.ndarray, show_markers: bool = None) -> bytes:
+    """Renders a plot of a price history as a PNG image.
+    Uses its own Agg figure instead of the global pyplot state, so it is safe to run concurrently.
+
+    Args:
+        time (np.ndarray): The time series in days.
+        sell (np.ndarray): The sell price series, NaN where there is no price.
+        buy (np.ndarray): The buy price series, NaN where there is no price.
+        show_markers (bool, optional): Whether to mark each data point. Defaults to marking them if there are less than 31.
+
+    Returns:
+        bytes: The PNG image of the plot.
+    """
+    # Import matplotlib on the first chart, it is slow to import and not needed to start the bot.
+    # pylint: disable=C0415
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import matplotlib.dates as mdates
+
+    sell_mask = np.isfinite(sell)
+    buy_mask = np.isfinite(buy)
+    marker = "o" if (len(time) < 31 if show_markers is None else show_markers) else None
+
+    line_color = "#A9A9A9"
+    buy_color = "#8884d8"
+    sell_color = "#82ca9d"
+
+    # Create a new figure.
+    figure = Figure(facecolor=None)
+    FigureCanvasAgg(figure)
+    figure.tight_layout()
+
+    subplot = figure.add_subplot(111, facecolor=None)
+    subplot.grid(True, color=line_color, linestyle="--", linewidth=0.5, which="major", axis="both", alpha=0.25)
+    subplot.set_xlim(min(time), max(time))
+    subplot.spines["top"].set_visible(False)
+    subplot.spines["right"].set_visible(False)
+    subplot.spines["bottom"].set_color(line_color)
+    subplot.spines["left"].set_color(line_color)
+    subplot.tick_params(colors=line_color)
+    subplot.yaxis.label.set_color(line_color)
+    subplot.xaxis.label.set_color(line_color)
+
+    # Set the x-axis to display dates.
+    subplot.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    figure.autofmt_xdate()
+
+    # Plot the sell and buy values.
+    subplot.plot(time[sell_mask], sell[sell_mask], label="Sell price", linestyle="-", color=sell_color, marker=marker)
+    subplot.plot(time[buy_mask], buy[buy_mask], label="Buy price", linestyle="-", color=buy_color, marker=marker)
+
+    # Set the labels and title.
+    subplot.set_xlabel("Time", color=line_color)
+    subplot.set_ylabel("Price", color=line_color)
+
+    # Add a legend.
+    subplot.legend(facecolor=None, edgecolor=None, labelcolor=line_color, framealpha=0)
+
+    # Save the plot to a BytesIO object.
+    plot_bytes = BytesIO()
+    figure.savefig(plot_bytes, format="png", transparent=True)
+
+    return plot_bytes.getvalue()
@@ -1,6 +1,5 @@
 from pydantic import BaseModel
-from tinydb import Query
-from utils import database
+from utils.settings_cache import SettingsCache
 from typing import Tuple
 
 
@@ -14,8 +13,7 @@ class DiscordUser(BaseModel):
 
     def save(self):
         """Saves the user to the database."""
-        table = database.get_table(DiscordUser)
-        table.update_data(Query().id == self.id, self)
+        settings_cache.save(self)
 
     @staticmethod
     def from_database(user_id: int) -> Tuple["DiscordUser", bool]:
@@ -27,10 +25,20 @@ class DiscordUser(BaseModel):
         Returns:
             Tuple[DiscordUser, bool]: A tuple containing the DiscordUser object and a boolean indicating if the user was found in the database.
         """
-        table = database.get_table(DiscordUser)
-        user_data = table.get_data(Query().id == user_id)
+        return settings_cache.get(user_id)
+
+    @staticmethod
+    async def from_database_async(user_id: int) -> Tuple["DiscordUser", bool]:
+        """Loads the user from the database without blocking the event loop if it exists, otherwise creates a new one.
+
+        Args:
+            user_id (int): The discord id of the user.
+
+        Returns:
+            Tuple[DiscordUser, bool]: A tuple containing the DiscordUser object and a boolean indicating if the user was found in the database.
+        """
+        return await settings_cache.get_async(user_id)
 
-        if not user_data:
-            return DiscordUser(id=user_id), False
 
-        return user_data[0], True
+settings_cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+"""The cached settings of each user."""
@@ -1,14 +1,17 @@
 import tinydb
 import os
+import sqlite3
 import threading
 import json
-from typing import TypeVar, Generic, Union, List
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Tuple, TypeVar, Generic, Union, List
 from pydantic import BaseModel
 from utils import json_helper
 
 
 _lock_object = threading.Lock()
-_database: tinydb.TinyDB = None
+_database: Union[tinydb.TinyDB, sqlite3.Connection] = None
+_read_connections: Dict[int, sqlite3.Connection] = {}
 _tables = {}
 database_path: str = None
 
@@ -68,6 +71,31 @@ class DatabaseTable(Generic[T]):
 
             return self.table.upsert(data_dict, query)
 
+    def update_many(self, data: List[T], key: str = "id") -> List[int]:
+        """Update or insert multiple data in the database at once, each matched by its key.
+
+        Args:
+            data (List[T]): The data to update it with.
+            key (str, optional): The field identifying the data. Defaults to "id".
+
+        Returns:
+            List[int]: The list of updated document IDs.
+        """
+        with _lock_object:
+            return [document_id for item in data for document_id in self.table.upsert(json.loads(json_helper.object_to_json(item)), tinydb.Query()[key] == getattr(item, key))]
+
+    def count_by(self, field: str) -> Dict[Any, int]:
+        """Count the data grouped by the value of a field.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            Dict[Any, int]: The amount of data with each value of the field, None for data without the field.
+        """
+        with _lock_object:
+            return dict(Counter(document.get(field) for document in self.table.all()))
+
     def delete_data(self, query: tinydb.Query) -> List[int]:
         """Delete data from the database.
         
@@ -81,22 +109,274 @@ class DatabaseTable(Generic[T]):
             return self.table.remove(query)
 
 
-def setup_database(database_name: str = "database"):
-    """Setup the database.
+class SqliteDatabaseTable(DatabaseTable[T]):
+    """A database table stored in SQLite. Each document is stored as JSON in a row, keyed by its id if the table type has an integer id.
+    Equality queries are translated to indexed SQL, any other query is evaluated on every document.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        table_type (type): The type of the table.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, table_type: type):
+        super().__init__(None, table_type)
+        self.connection = connection
+        self.table_name = table_type.__name__
+        self.is_keyed_by_id = "id" in table_type.model_fields and table_type.model_fields["id"].annotation is int
+
+        with _lock_object, self.connection:
+            _create_sqlite_table(self.connection, self.table_name)
+
+    def insert_data(self, data: Union[T, List[T]]) -> List[int]:
+        """Insert data into the database.
+        Unlike TinyDB, a table keyed by id can't hold two documents with the same id, inserting one replaces the existing document.
+
+        Args:
+            data (Union[T, List[T]]): The data to insert.
+
+        Returns:
+            List[int]: The list of inserted document IDs.
+        """
+        with _lock_object, self.connection:
+            return [self._insert(item) for item in (data if isinstance(data, list) else [data])]
+
+    def get_data(self, query: tinydb.Query) -> List[T]:
+        """Get data from the database.
+
+        Args:
+            query (tinydb.Query): The query to filter the data.
+
+        Returns:
+            List[T]: The list of data.
+        """
+        # Reads use a connection of their own thread and don't take the lock, so they can run concurrently with each other and with writes.
+        return [self.table_type(**document) for _, document in self._search(query, _get_read_connection())]
+
+    def update_data(self, query: tinydb.Query, data: T) -> List[int]:
+        """Update data in the database, or insert it if no data matches the query.
+
+        Args:
+            query (tinydb.Query): The query to filter the data.
+            data (T): The data to update it with.
+
+        Returns:
+            List[int]: The list of updated document IDs.
+        """
+        with _lock_object, self.connection:
+            return self._upsert(query, data)
+
+    def update_many(self, data: List[T], key: str = "id") -> List[int]:
+        """Update or insert multiple data in the database in a single transaction, each matched by its key.
+
+        Args:
+            data (List[T]): The data to update it with.
+            key (str, optional): The field identifying the data. Defaults to "id".
+
+        Returns:
+            List[int]: The list of updated document IDs.
+        """
+        with _lock_object, self.connection:
+            return [document_id for item in data for document_id in self._upsert(tinydb.Query()[key] == getattr(item, key), item)]
+
+    def count_by(self, field: str) -> Dict[Any, int]:
+        """Count the data grouped by the value of a field, in a single SQL query.
+
+        Args:
+            field (str): The name of the field.
+
+        Returns:
+            Dict[Any, int]: The amount of data with each value of the field, None for data without the field.
+        """
+        rows = _get_read_connection().execute(f'SELECT json_extract(data, ?), COUNT(*) FROM "{self.table_name}" GROUP BY 1', (f"$.{field}",))
+
+        return dict(rows.fetchall())
+
+    def delete_data(self, query: tinydb.Query) -> List[int]:
+        """Delete data from the database.
+
+        Args:
+            query (tinydb.Query): The query to filter the data.
+
+        Returns:
+            List[int]: The list of removed document IDs.
+        """
+        with _lock_object, self.connection:
+            document_ids = [document_id for document_id, _ in self._search(query)]
+            self.connection.executemany(f'DELETE FROM "{self.table_name}" WHERE doc_id = ?', [(document_id,) for document_id in document_ids])
+
+            return document_ids
+
+    def _upsert(self, query: tinydb.Query, data: T) -> List[int]:
+        document_ids = [document_id for document_id, _ in self._search(query)]
+
+        if not document_ids:
+            return [self._insert(data)]
+
+        document = json_helper.object_to_json(data)
+        self.connection.executemany(f'UPDATE "{self.table_name}" SET data = ? WHERE doc_id = ?', [(document, document_id) for document_id in document_ids])
+
+        return document_ids
+
+    def _insert(self, data: T) -> int:
+        document_id = data.id if self.is_keyed_by_id else None
+        cursor = self.connection.execute(f'INSERT INTO "{self.table_name}" (doc_id, data) VALUES (?, ?) ON CONFLICT (doc_id) DO UPDATE SET data = excluded.data',
+                                         (document_id, json_helper.object_to_json(data)))
+
+        return cursor.lastrowid
+
+    def _search(self, query: tinydb.Query, connection: sqlite3.Connection = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """Finds the documents matching a query.
+
+        Args:
+            query (tinydb.Query): The query to filter the data.
+            connection (sqlite3.Connection, optional): The connection to read with. Defaults to the connection of the table.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: The id and content of each matching document.
+        """
+        connection = connection if connection else self.connection
+        condition = self._translate_query(getattr(query, "_hash", None))
+        select = f'SELECT doc_id, data FROM "{self.table_name}"'
+
+        if condition is not None:
+            rows = connection.execute(f"{select} WHERE {condition[0]} ORDER BY doc_id", condition[1])
+            return [(document_id, json.loads(document)) for document_id, document in rows]
+
+        # Evaluate queries that can't be translated on every document.
+        documents = ((document_id, json.loads(document)) for document_id, document in connection.execute(f"{select} ORDER BY doc_id"))
+        return [(document_id, document) for document_id, document in documents if query(document)]
+
+    def _translate_query(self, query_hash: Optional[Tuple]) -> Optional[Tuple[str, List[Any]]]:
+        """Translates the equality comparisons of a query to an SQL condition.
+
+        Args:
+            query_hash (Optional[Tuple]): The hash of the tinydb query, describing its structure.
+
+        Returns:
+            Optional[Tuple[str, List[Any]]]: The SQL condition and its parameters, or None if the query can't be translated.
+        """
+        if not query_hash:
+            return None
+
+        if query_hash[0] == "and" and isinstance(query_hash[1], Iterable):
+            conditions = [self._translate_query(part) for part in query_hash[1]]
+
+            if any(condition is None for condition in conditions):
+                return None
+
+            return " AND ".join(f"({condition})" for condition, _ in conditions), [parameter for _, parameters in conditions for parameter in parameters]
+
+        if query_hash[0] != "==" or len(query_hash) != 3 or not isinstance(query_hash[2], (str, int, float)):
+            return None
+
+        path, value = query_hash[1], query_hash[2]
+
+        # The id is the primary key, so lookups by it use the index.
+        if self.is_keyed_by_id and path == ("id",) and isinstance(value, int) and not isinstance(value, bool):
+            return "doc_id = ?", [value]
+
+        return "json_extract(data, ?) = ?", ["$." + ".".join(str(key) for key in path), value]
+
+
+def _get_read_connection() -> sqlite3.Connection:
+    """Gets the SQLite connection of the current thread for reading, with write-ahead logging readers don't block each other.
+
+    Returns:
+        sqlite3.Connection: The read connection.
+    """
+    thread_id = threading.get_ident()
+    connection = _read_connections.get(thread_id)
+
+    if connection is None:
+        connection = sqlite3.connect(database_path, check_same_thread=False)
+        _read_connections[thread_id] = connection
+
+    return connection
+
+
+def _create_sqlite_table(connection: sqlite3.Connection, table_name: str):
+    connection.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" (doc_id INTEGER PRIMARY KEY, data TEXT NOT NULL)')
+
+
+def _migrate_from_tinydb(tinydb_path: str, sqlite_path: str):
+    """Copies all tables of a TinyDB database into a new SQLite database.
+    Documents with an integer id are keyed by it, like the SQLite tables do, others keep their TinyDB document id.
+    The database is built in a temporary file and moved into place once it is complete,
+    so a failed or interrupted migration leaves no database behind and is retried on the next start.
+
+    Args:
+        tinydb_path (str): The path of the TinyDB JSON file.
+        sqlite_path (str): The path of the SQLite database to create.
+    """
+    temporary_path = f"{sqlite_path}.migrating"
+
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+
+    old_database = tinydb.TinyDB(tinydb_path, access_mode="r")
+    connection = sqlite3.connect(temporary_path)
+
+    try:
+        with connection:
+            for table_name in old_database.tables():
+                _create_sqlite_table(connection, table_name)
+                rows = [(document["id"] if isinstance(document.get("id"), int) else document.doc_id, json.dumps(document)) for document in old_database.table(table_name).all()]
+
+                # Keep the first document of duplicate ids, like the first search result was used before.
+                connection.executemany(f'INSERT OR IGNORE INTO "{table_name}" (doc_id, data) VALUES (?, ?)', rows)
+    finally:
+        connection.close()
+        old_database.close()
+
+    os.replace(temporary_path, sqlite_path)
+    print(f"Migrated the database from {tinydb_path} to {sqlite_path}.")
+
+
+def setup_database(database_name: str = "database", storage: str = "sqlite"):
+    """Setup the database, closing the previous one. A SQLite database is migrated once from the TinyDB file of the same name if it doesn't exist yet.
 
     Args:
         database_name (str): The name of the database. Defaults to "database".
+        storage (str): The storage engine, either "sqlite" or "tinydb". Defaults to "sqlite".
     """
     global _database, database_path
 
-    database_path = os.path.join(os.path.dirname(__file__), "data", f"{database_name}.json")
-    _database = tinydb.TinyDB(database_path)
+    # Close the previous database, so neither its tables nor the read connections of any thread keep reading it.
+    if _database is not None:
+        close_database()
+
+    directory = os.path.join(os.path.dirname(__file__), "data")
+    tinydb_path = os.path.join(directory, f"{database_name}.json")
+    _tables.clear()
+
+    if storage == "tinydb":
+        database_path = tinydb_path
+        _database = tinydb.TinyDB(database_path)
+        return
+
+    if storage != "sqlite":
+        raise ValueError(f"Unknown database storage '{storage}'.")
+
+    database_path = os.path.join(directory, f"{database_name}.db")
+
+    # Migrate before connecting, connecting creates the database file.
+    if not os.path.exists(database_path) and os.path.exists(tinydb_path):
+        _migrate_from_tinydb(tinydb_path, database_path)
+
+    _database = sqlite3.connect(database_path, check_same_thread=False)
+    _database.execute("PRAGMA journal_mode=WAL")
+    _database.execute("PRAGMA synchronous=NORMAL")
 
 def close_database():
     """Close the database."""
     with _lock_object:
         _database.close()
 
+        for connection in _read_connections.values():
+            connection.close()
+
+        _read_connections.clear()
+
 def get_table(table_type: type) -> DatabaseTable[T]:
     """Get a table from the database.
 
@@ -113,8 +393,10 @@ def get_table(table_type: type) -> DatabaseTable[T]:
     type_name = table_type.__name__
 
     if type_name not in _tables:
-        table = _database.table(type_name)
-        database_table = DatabaseTable(table, table_type)
+        if isinstance(_database, sqlite3.Connection):
+            database_table = SqliteDatabaseTable(_database, table_type)
+        else:
+            database_table = DatabaseTable(_database.table(type_name), table_type)
 
         _tables[type_name] = database_table
 
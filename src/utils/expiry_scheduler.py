@@ -0,0 +1,130 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from typing import Callable, List, Tuple
+from utils import background_loop
+from utils.decorators.singleton import singleton
+
+
+@singleton
+class ExpiryScheduler:
+    """Expires cache entries from a single coroutine on the background loop, instead of one sleeping coroutine per entry.
+    Entries register an expiry callback with their expiry time, and due callbacks are run in batches.
+
+    Args:
+        batch_size (int, optional): The maximum amount of callbacks to run before yielding to other coroutines. Defaults to 1000.
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size: int = batch_size
+        self.expired_count: int = 0
+        """The amount of expiry callbacks that have been run."""
+        self._heap: List[Tuple[float, int, weakref.WeakMethod]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup: asyncio.Event = None
+        self._task: asyncio.Task = None
+        self._is_running: bool = False
+
+    @property
+    def pending_count(self) -> int:
+        """Gets the amount of entries waiting for their expiry."""
+        return len(self._heap)
+
+    def schedule(self, callback: Callable[[], float], expires_at: float):
+        """Schedules an expiry callback. The scheduler only keeps a weak reference to the callback's object,
+        so scheduled entries can still be garbage collected.
+
+        Args:
+            callback (Callable[[], float]): The bound method to call once the entry is due.
+                It returns the seconds until the entry expires again, or a value <= 0 if it does not need to be checked anymore.
+            expires_at (float): The timestamp at which the entry expires.
+        """
+        with self._lock:
+            is_earliest = not self._heap or expires_at < self._heap[0][0]
+            heapq.heappush(self._heap, (expires_at, next(self._counter), weakref.WeakMethod(callback)))
+
+            should_start = not self._is_running
+            self._is_running = True
+
+        if should_start:
+            background_loop.run_in_background(self._run_async)
+        elif is_earliest and self._wakeup:
+            # Wake the scheduler up, so it doesn't oversleep the new earliest expiry.
+            background_loop.get_background_loop().call_soon_threadsafe(self._wakeup.set)
+
+    def stop(self, timeout_seconds: float = 5):
+        """Cancels the scheduler's coroutine on the background loop and waits until it has finished, e.g. before the loop is stopped.
+        The scheduled entries are kept, and scheduling another entry starts the scheduler again.
+
+        Args:
+            timeout_seconds (float, optional): The maximum time in seconds to wait for the coroutine to finish. Defaults to 5.
+        """
+        task = self._task
+
+        if task is None or task.done() or not task.get_loop().is_running():
+            return
+
+        asyncio.run_coroutine_threadsafe(self._cancel_async(task), task.get_loop()).result(timeout_seconds)
+
+    async def _cancel_async(self, task: asyncio.Task):
+        """Cancels the scheduler's coroutine and waits until it has finished."""
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run_async(self):
+        """Sleeps until the next expiry and runs all due callbacks, until it is stopped."""
+        self._task = asyncio.current_task()
+        self._wakeup = asyncio.Event()
+
+        try:
+            while True:
+                self._wakeup.clear()
+
+                with self._lock:
+                    next_expiry = self._heap[0][0] if self._heap else None
+
+                timeout = None if next_expiry is None else next_expiry - time.time()
+
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(0)
+
+                self._expire_due()
+        finally:
+            self._task = None
+            self._is_running = False
+
+    def _expire_due(self):
+        """Runs up to batch_size due callbacks, and reschedules the entries that did not expire yet."""
+        current_time = time.time()
+        due_callbacks: List[weakref.WeakMethod] = []
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= current_time and len(due_callbacks) < self.batch_size:
+                due_callbacks.append(heapq.heappop(self._heap)[2])
+
+        for callback_reference in due_callbacks:
+            callback = callback_reference()
+
+            # The entry was garbage collected in the meantime.
+            if callback is None:
+                continue
+
+            self.expired_count += 1
+            expires_in = callback()
+
+            if expires_in > 0:
+                with self._lock:
+                    heapq.heappush(self._heap, (current_time + expires_in, next(self._counter), callback_reference))
@@ -1,5 +1,4 @@
-from utils.data.discord_server import DiscordServer
-from utils.data.user import DiscordUser
+from utils.data import discord_server, user
 from discord.ext import commands
 
 
@@ -12,10 +11,29 @@ def get_default_world(ctx: commands.Context) -> str:
     Returns:
         str: The default world.
     """
+    # Only read the cached settings, copying them is not needed.
     if ctx.guild:
-        discord_server, has_default = DiscordServer.from_database(ctx.guild.id)
+        server_settings, has_default = discord_server.settings_cache.get(ctx.guild.id, copy=False)
 
         if has_default:
-            return discord_server.default_world
+            return server_settings.default_world
 
-    return DiscordUser.from_database(ctx.author.id)[0].default_world
+    return user.settings_cache.get(ctx.author.id, copy=False)[0].default_world
+
+
+async def get_default_world_async(ctx: commands.Context) -> str:
+    """Gets the default world for the user or server, loading uncached settings on a database thread.
+
+    Args:
+        ctx (commands.Context): The context of the command.
+
+    Returns:
+        str: The default world.
+    """
+    if ctx.guild:
+        server_settings, has_default = await discord_server.settings_cache.get_async(ctx.guild.id, copy=False)
+
+        if has_default:
+            return server_settings.default_world
+
+    return (await user.settings_cache.get_async(ctx.author.id, copy=False))[0].default_world
@@ -0,0 +1,50 @@
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Optional
+from utils.data.item_meta_data import ItemMetaData
+from utils.item_search_index import ItemSearchIndex
+
+
+class ItemIndex:
+    """An immutable index resolving item identifiers to ids, together with the search index of the item names.
+    A new index is built completely for every meta data load and replaces the old one with a single assignment,
+    so readers never see a half-built index and items that were renamed or removed disappear with the old index.
+
+    Args:
+        items_meta_data (Iterable[ItemMetaData]): The meta data of all items.
+        normalize (Callable[[str], str]): The function that normalizes identifiers.
+    """
+
+    def __init__(self, items_meta_data: Iterable[ItemMetaData], normalize: Callable[[str], str]):
+        self.normalize: Callable[[str], str] = normalize
+        identifier_to_id: Dict[str, int] = {}
+        names = []
+
+        # Map any possible identifier of each item to its id.
+        for item in items_meta_data:
+            identifier_to_id[str(item.id)] = item.id
+            identifier_to_id[normalize(item.name)] = item.id
+            identifier_to_id[normalize(f"{item.name} ({item.id})")] = item.id
+
+            if item.wiki_name:
+                identifier_to_id[normalize(item.wiki_name)] = item.id
+
+            names.append(item.wiki_name if item.wiki_name else item.name)
+
+        self.identifier_to_id: Mapping[str, int] = MappingProxyType(identifier_to_id)
+        """The item id of each normalized identifier."""
+        self.search_index: ItemSearchIndex = ItemSearchIndex(names, normalize)
+        """The search index of the item names."""
+
+    def __len__(self) -> int:
+        return len(self.search_index)
+
+    def get_id(self, identifier: str) -> Optional[int]:
+        """Gets the id of an item by one of its identifiers.
+
+        Args:
+            identifier (str): The identifier of the item. Can be the id, name, name (id), or wiki name.
+
+        Returns:
+            Optional[int]: The id of the item, or None if no item has the identifier.
+        """
+        return self.identifier_to_id.get(self.normalize(str(identifier)))
@@ -0,0 +1,180 @@
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+import heapq
+
+
+def bounded_edit_distance(query: str, text: str, max_distance: int) -> Tuple[int, int]:
+    """Computes the edit distance of a query to a text and to the closest prefix of the text, giving up once both exceed a bound.
+    Insertions, deletions, substitutions and swaps of adjacent characters count as one edit each.
+
+    Args:
+        query (str): The query.
+        text (str): The text to compare the query to.
+        max_distance (int): The largest distance of interest.
+
+    Returns:
+        Tuple[int, int]: The distance to the closest prefix and to the whole text, max_distance + 1 if they exceed the bound.
+    """
+    exceeded = max_distance + 1
+
+    if len(query) - len(text) > max_distance:
+        return exceeded, exceeded
+
+    second_previous_row: List[int] = []
+    previous_row = list(range(len(text) + 1))
+
+    for query_index, query_character in enumerate(query, 1):
+        row = [query_index]
+
+        for text_index, text_character in enumerate(text, 1):
+            distance = min(previous_row[text_index] + 1, row[text_index - 1] + 1, previous_row[text_index - 1] + (query_character != text_character))
+
+            if query_index > 1 and text_index > 1 and query_character == text[text_index - 2] and query[query_index - 2] == text_character:
+                distance = min(distance, second_previous_row[text_index - 2] + 1)
+
+            row.append(distance)
+
+        # The distances never shrink by more than a swap allows, so once two rows exceed the bound it can't be met anymore.
+        if min(row) > max_distance and min(previous_row) > max_distance:
+            return exceeded, exceeded
+
+        second_previous_row, previous_row = previous_row, row
+
+    return min(*previous_row, exceeded), min(previous_row[-1], exceeded)
+
+
+class ItemSearchIndex:
+    """An index of item names for fast substring search, built once per meta data load.
+    Names are normalized once and ranked by length, and every n-gram of a normalized name points to the ranks of the names containing it.
+    A search only visits the names containing the rarest n-gram of the query, shortest first, and stops once it has enough matches.
+
+    Args:
+        names (Iterable[str]): The names of the items.
+        normalize (Callable[[str], str]): The function that normalizes names and queries.
+        max_gram_length (int, optional): The maximum length of the indexed n-grams. Defaults to 3.
+        fuzzy_candidate_count (int, optional): The maximum amount of names a fuzzy search compares the query to. Defaults to 100.
+    """
+
+    def __init__(self, names: Iterable[str], normalize: Callable[[str], str], max_gram_length: int = 3, fuzzy_candidate_count: int = 100):
+        self.normalize: Callable[[str], str] = normalize
+        self.max_gram_length: int = max_gram_length
+        self.fuzzy_candidate_count: int = fuzzy_candidate_count
+
+        # Sort by length once, so every posting list is already in the order results are returned in.
+        self.names: Tuple[str, ...] = tuple(sorted(names, key=len))
+        self.normalized_names: Tuple[str, ...] = tuple(normalize(name) for name in self.names)
+        self._postings: Dict[str, List[int]] = {}
+
+        for rank, normalized_name in enumerate(self.normalized_names):
+            for gram in self._get_grams(normalized_name):
+                self._postings.setdefault(gram, []).append(rank)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _get_grams(self, text: str) -> Set[str]:
+        """Gets all distinct n-grams of a text, up to the maximum n-gram length.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            Set[str]: The n-grams of the text.
+        """
+        return {text[start:start + length] for length in range(1, self.max_gram_length + 1) for start in range(len(text) - length + 1)}
+
+    def _get_candidates(self, normalized_query: str) -> Iterable[int]:
+        """Gets the ranks of the names which may contain the query, in ascending order.
+
+        Args:
+            normalized_query (str): The normalized query.
+
+        Returns:
+            Iterable[int]: The ranks of the candidate names.
+        """
+        if not normalized_query:
+            return range(len(self.names))
+
+        length = min(len(normalized_query), self.max_gram_length)
+        grams = {normalized_query[start:start + length] for start in range(len(normalized_query) - length + 1)}
+
+        # Every match contains all n-grams of the query, so the shortest posting list is enough.
+        return min((self._postings.get(gram, []) for gram in grams), key=len)
+
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Gets the shortest names containing the query, ignoring case and non alphanumeric characters.
+
+        Args:
+            query (str): The query.
+            limit (int, optional): The maximum amount of names. Defaults to 25.
+
+        Returns:
+            List[str]: The matching names, ordered by length.
+        """
+        return [self.names[rank] for rank in self.get_matches(query, limit=limit)]
+
+    def get_matches(self, query: str, candidates: Iterable[int] = None, limit: int = -1) -> List[int]:
+        """Gets the ranks of the names containing the query, ignoring case and non alphanumeric characters.
+
+        Args:
+            query (str): The query.
+            candidates (Iterable[int], optional): The ranks to search, in ascending order, e.g. the matches of a query this one extends. Defaults to all names.
+            limit (int, optional): The maximum amount of ranks. Defaults to -1, meaning all.
+
+        Returns:
+            List[int]: The ranks of the matching names, in ascending order, so the shortest names come first.
+        """
+        normalized_query = self.normalize(query)
+        matches: List[int] = []
+
+        if candidates is None:
+            candidates = self._get_candidates(normalized_query)
+
+        for rank in candidates:
+            if len(matches) == limit:
+                break
+
+            if normalized_query in self.normalized_names[rank]:
+                matches.append(rank)
+
+        return matches
+
+    def fuzzy_search(self, query: str, limit: int = 25, exclude: Iterable[str] = ()) -> List[str]:
+        """Gets the names closest to the query by edit distance, tolerating typos in the query.
+        Only the names sharing the most n-grams with the query are compared, so the search stays fast on the full item set.
+
+        Args:
+            query (str): The query, at least 3 characters long after normalizing.
+            limit (int, optional): The maximum amount of names. Defaults to 25.
+            exclude (Iterable[str], optional): The names to leave out, e.g. the exact matches already found. Defaults to ().
+
+        Returns:
+            List[str]: The closest names, ordered by their distance to the query and their length.
+        """
+        normalized_query = self.normalize(query)
+
+        if len(normalized_query) < 3:
+            return []
+
+        # Allow one typo per four characters, and count bigrams for short queries, a single typo breaks most of their trigrams.
+        max_distance = max(1, len(normalized_query) // 4)
+        length = 2 if len(normalized_query) < 6 else 3
+        grams = {normalized_query[start:start + length] for start in range(len(normalized_query) - length + 1)}
+
+        shared_grams = Counter()
+        for gram in grams:
+            shared_grams.update(self._postings.get(gram, ()))
+
+        excluded = set(exclude)
+        scored: List[Tuple[int, int, int]] = []
+
+        for rank, _ in heapq.nlargest(self.fuzzy_candidate_count, shared_grams.items(), key=lambda item: item[1]):
+            if self.names[rank] in excluded:
+                continue
+
+            prefix_distance, distance = bounded_edit_distance(normalized_query, self.normalized_names[rank], max_distance)
+
+            if prefix_distance <= max_distance:
+                scored.append((prefix_distance, distance, rank))
+
+        return [self.names[rank] for _, _, rank in sorted(scored)[:limit]]
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping coroutine, which shows how long other work blocked the loop.
+
+    Args:
+        interval_seconds (float, optional): The time in seconds between two measurements. Defaults to 0.25.
+    """
+
+    def __init__(self, interval_seconds: float = 0.25):
+        self.interval_seconds: float = interval_seconds
+        self.max_lag: float = 0
+        """The highest measured lag in seconds."""
+        self.sample_count: int = 0
+        self._total_lag: float = 0
+        self._task: asyncio.Task = None
+
+    @property
+    def average_lag(self) -> float:
+        """Gets the average measured lag in seconds."""
+        return self._total_lag / self.sample_count if self.sample_count else 0
+
+    def start(self):
+        """Starts measuring the lag of the running event loop."""
+        if self._task and not self._task.done():
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._measure_async())
+
+    def stop(self):
+        """Stops measuring."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self):
+        """Resets the measurements, e.g. to compare the lag before and after a change."""
+        self.max_lag = 0
+        self.sample_count = 0
+        self._total_lag = 0
+
+    def format_report(self) -> str:
+        """Formats the measurements.
+
+        Returns:
+            str: The report, e.g. "Event loop lag: average 0.002s, max 0.150s over 1200 samples".
+        """
+        return f"Event loop lag: average {self.average_lag:.3f}s, max {self.max_lag:.3f}s over {self.sample_count} samples"
+
+    async def _measure_async(self):
+        """Sleeps in a loop and records how much later than requested each sleep ended."""
+        while True:
+            start_time = time.monotonic()
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0, time.monotonic() - start_time - self.interval_seconds)
+
+            self.sample_count += 1
+            self._total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
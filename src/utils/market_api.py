@@ -1,35 +1,67 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from utils.data.item_meta_data import ItemMetaData
 from utils.data.market_values import MarketValues
 from utils.data.market_board import MarketBoard
+from utils.data.market_snapshot import MarketSnapshot
+from utils.data.history_series import HistorySeries
 from utils.data.world_data import WorldData
 from utils.cacheable_data import CacheableData
+from utils.bounded_cache import BoundedCache, estimate_size
+from utils.request_coalescer import RequestCoalescer
+from utils.rate_limiter import RateLimiter, RequestPriority, RequestTicket
+from utils.payload_decoder import PayloadDecoder
+from utils.model_builder import ModelBuilder
+from utils.item_index import ItemIndex
+from utils.request_context import RequestContext
+from utils.market_cache_store import MarketCacheStore
 from utils.decorators.singleton import singleton
+from pydantic import BaseModel
 import httpx
 import re
-import asyncio
-from time import time
+import time
 
 
 @singleton
 class MarketApi:
     """A helper class to interact with the Tibia Market API.
+
+    Args:
+        token (str, optional): The token of the Tibia Market API. Defaults to None.
+        cache_max_entries (int, optional): The maximum amount of cached histories and market boards each. Defaults to 10000.
+        cache_max_bytes (int, optional): The maximum estimated size in bytes of the cached histories, market boards and market values each. Defaults to -1, meaning unlimited.
+        stream_responses (bool, optional): Whether to parse responses incrementally while they are received, instead of after the whole body arrived. Defaults to False.
+        trusted_payloads (bool, optional): Whether to create models from responses without validating them, except for a random sample of rows. Defaults to False.
     """
 
-    def __init__(self, token: str = None):
+    def __init__(self, token: str = None, cache_max_entries: int = 10000, cache_max_bytes: int = -1, stream_responses: bool = False, trusted_payloads: bool = False):
         self.token = token
         self.http_client = httpx.AsyncClient()
 
         self.api_url = "https://api.tibiamarket.top:8001/"
         self.headers = {"Authorization": f"Bearer {self.token}"}
-
-        self.identifier_to_id: Dict[str, int] = {}
-
-        self.world_data: CacheableData[Dict[str, WorldData]] = CacheableData(self._load_world_data, invalidate_after_seconds=60)
-        self.meta_data: CacheableData[Dict[int, ItemMetaData]] = CacheableData(self._load_meta_data, invalidate_after_seconds=3600)
-        self.market_values_cache: Dict[str, CacheableData[MarketValues]] = {}
-        self.history_cache: Dict[str, CacheableData[List[MarketValues]]] = {}
-        self.market_board_cache: Dict[str, CacheableData[MarketBoard]] = {}
+        self.request_coalescer = RequestCoalescer()
+        self.rate_limiter = RateLimiter()
+        self._request_tickets: Dict[Tuple[str, Tuple], RequestTicket] = {}
+        """The rate limiter ticket of each request in flight, by its coalescing key."""
+        self.payload_decoder = PayloadDecoder()
+        self.stream_responses = stream_responses
+        self.model_builder = ModelBuilder(trusted_payloads)
+        self.cache_store = MarketCacheStore()
+        """The store the caches are saved to and restored from across restarts."""
+
+        self.item_index: ItemIndex = ItemIndex([], self.normalize_identifier)
+        """The identifier and search index of the items, replaced as a whole whenever the meta data is loaded."""
+
+        self.world_data: CacheableData[Dict[str, WorldData]] = CacheableData(self._load_world_data, invalidate_after_seconds=60, stale_while_revalidate=True,
+                                                                             background_loader=lambda: self._load_world_data(RequestPriority.BACKGROUND))
+        self.meta_data: CacheableData[Dict[int, ItemMetaData]] = CacheableData(self._load_meta_data, invalidate_after_seconds=3600, stale_while_revalidate=True,
+                                                                               background_loader=lambda: self._load_meta_data(RequestPriority.BACKGROUND))
+        self.market_values_cache: BoundedCache[str, CacheableData[MarketSnapshot]] = BoundedCache(max_bytes=cache_max_bytes, time_to_live_seconds=3600,
+                                                                                                           size_of=self._get_cache_size)
+        self.history_cache: BoundedCache[str, CacheableData[HistorySeries]] = BoundedCache(cache_max_entries, cache_max_bytes, time_to_live_seconds=300,
+                                                                                                size_of=self._get_cache_size)
+        self.market_board_cache: BoundedCache[str, CacheableData[MarketBoard]] = BoundedCache(cache_max_entries, cache_max_bytes, time_to_live_seconds=300,
+                                                                                              size_of=self._get_cache_size)
 
     @staticmethod
     def normalize_identifier(identifier: str) -> str:
@@ -79,118 +111,325 @@ class MarketApi:
             int: The id of the item.
         """
         await self.meta_data.get_async()
-        normalized_identifier = self.normalize_identifier(str(identifier))
 
-        if normalized_identifier not in self.identifier_to_id:
-            raise ValueError(f"Item with identifier '{normalized_identifier}' not found.")
+        return self._resolve_item_id(self.item_index, identifier)
 
-        return self.identifier_to_id[normalized_identifier]
-
-    async def get_market_values(self, server, identifier: str) -> MarketValues:
-        """Get the market values of an item by it's identifier.
+    async def create_request_context(self, server: str, identifier: str) -> RequestContext:
+        """Resolves the world and item of a command once, reading the world data and meta data a single time.
 
         Args:
-            identifier (str): The identifier of the item.
+            server (str): The name of the Tibia server.
+            identifier (str): The identifier of the item. Can be the id, name (id), or wiki name.
 
         Returns:
-            MarketValues: The market values of the item.
+            RequestContext: The context to pass to the get methods.
         """
-        item_id: int = await self.identifier_to_item_id(identifier)
+        items_meta_data = await self.meta_data.get_async()
+
+        # Read the index right after the meta data, they are replaced together.
+        item_id = self._resolve_item_id(self.item_index, identifier)
+        worlds = await self.world_data.get_async()
         server = self.normalize_world(server)
 
-        await self.throw_if_world_not_found(server)
+        if server not in worlds:
+            raise ValueError(f"World '{server}' not found. Available worlds are: {', '.join(worlds.keys())}")
 
-        if server not in self.market_values_cache:
-            self.market_values_cache[server] = CacheableData(lambda: self._load_market_values(server), invalidate_after_seconds=3600)
+        return RequestContext(worlds[server], item_id, items_meta_data)
 
-        last_world_update = (await self.world_data.get_async())[server].last_update.timestamp()
-        market_values = await self.market_values_cache[server].get_async(last_world_update)
+    async def get_market_values(self, server: str = None, identifier: str = None, context: RequestContext = None) -> MarketValues:
+        """Get the market values of an item by it's identifier.
+
+        Args:
+            server (str, optional): The name of the Tibia server. Not needed if a context is given.
+            identifier (str, optional): The identifier of the item. Not needed if a context is given.
+            context (RequestContext, optional): The resolved world and item. Defaults to resolving the server and identifier.
+
+        Returns:
+            MarketValues: The market values of the item.
+        """
+        context = context if context else await self.create_request_context(server, identifier)
+        server = context.server
+
+        cache = self.market_values_cache.get_or_create(server, lambda: self._create_market_values_cache(server))
+        market_values = await cache.get_async(context.last_world_update)
+        self.market_values_cache.update_size(server)
 
-        return market_values[item_id]
+        return market_values[context.item_id]
 
-    async def get_history(self, server: str, identifier: str, timespan: int) -> List[MarketValues]:
+    async def get_history(self, server: str = None, identifier: str = None, timespan: int = 30, context: RequestContext = None) -> HistorySeries:
         """Get the market values history of an item by it's identifier.
 
         Args:
-            server (str): The name of the Tibia server.
-            identifier (str): The identifier of the item.
-            timespan (int): The amount of days ago to get the history from.
+            server (str, optional): The name of the Tibia server. Not needed if a context is given.
+            identifier (str, optional): The identifier of the item. Not needed if a context is given.
+            timespan (int, optional): The amount of days ago to get the history from. Defaults to 30.
+            context (RequestContext, optional): The resolved world and item. Defaults to resolving the server and identifier.
 
         Returns:
-            List[MarketValues]: The market values history of the item.
+            HistorySeries: The market values history of the item.
         """
-        item_id: int = await self.identifier_to_item_id(identifier)
-        server = self.normalize_world(server)
-
-        await self.throw_if_world_not_found(server)
-
+        context = context if context else await self.create_request_context(server, identifier)
+        server, item_id = context.server, context.item_id
         key = f"{server}_{item_id}_{timespan}"
 
-        if key not in self.history_cache:
-            self.history_cache[key] = CacheableData(lambda: self._load_history(server, item_id, timespan), invalidate_after_seconds=300, delete_after_interval=True)
+        cache = self.history_cache.get_or_create(key, lambda: CacheableData(lambda: self._load_history(server, item_id, timespan), invalidate_after_seconds=300, delete_after_interval=True))
 
-        last_world_update = (await self.world_data.get_async())[server].last_update.timestamp()
-        history = await self.history_cache[key].get_async(last_world_update)
+        history = await cache.get_async(context.last_world_update)
+        self.history_cache.update_size(key)
 
         return history
 
-    async def get_market_board(self, server: str, identifier: str) -> MarketBoard:
+    async def get_market_board(self, server: str = None, identifier: str = None, context: RequestContext = None) -> MarketBoard:
         """Get the market board of an item by it's identifier.
 
         Args:
-            server (str): The name of the Tibia server.
-            identifier (str): The identifier of the item.
+            server (str, optional): The name of the Tibia server. Not needed if a context is given.
+            identifier (str, optional): The identifier of the item. Not needed if a context is given.
+            context (RequestContext, optional): The resolved world and item. Defaults to resolving the server and identifier.
 
         Returns:
             MarketBoard: The market board of the item.
         """
-        item_id: int = await self.identifier_to_item_id(identifier)
-        server = self.normalize_world(server)
-
-        await self.throw_if_world_not_found(server)
-
+        context = context if context else await self.create_request_context(server, identifier)
+        server, item_id = context.server, context.item_id
         key = f"{server}_{item_id}"
 
-        if key not in self.market_board_cache:
-            self.market_board_cache[key] = CacheableData(lambda: self._load_market_board(server, item_id), invalidate_after_seconds=300, delete_after_interval=True)
+        cache = self.market_board_cache.get_or_create(key, lambda: CacheableData(lambda: self._load_market_board(server, item_id), invalidate_after_seconds=300, delete_after_interval=True))
 
-        last_world_update = (await self.world_data.get_async())[server].last_update.timestamp()
-        market_board = await self.market_board_cache[key].get_async(last_world_update)
+        market_board = await cache.get_async(context.last_world_update)
+        self.market_board_cache.update_size(key)
 
         return market_board
 
-    async def get_meta_data(self, identifier: str) -> ItemMetaData:
+    async def get_meta_data(self, identifier: str = None, context: RequestContext = None) -> ItemMetaData:
         """Get the meta data of an item by it's identifier.
 
         Args:
-            identifier (str): The identifier of the item. Can be the id, name (id), or wiki name.
+            identifier (str, optional): The identifier of the item. Can be the id, name (id), or wiki name. Not needed if a context is given.
+            context (RequestContext, optional): The resolved item. Defaults to resolving the identifier.
 
         Returns:
             ItemMetaData: The meta data of the item.
         """
-        item_id: int = await self.identifier_to_item_id(identifier)
+        if context:
+            return context.meta_data
+
+        items_meta_data = await self.meta_data.get_async()
+
+        return items_meta_data[self._resolve_item_id(self.item_index, identifier)]
+
+    async def refresh_world_async(self, server: str, last_update: float) -> bool:
+        """Brings the cached data of a world up to date after it was updated.
+        Evicts the world's histories and market boards loaded before the update, and reloads its market snapshot in the background lane if it is cached.
+        Raises the error of the reload if it failed, the stale snapshot is kept in that case.
+
+        Args:
+            server (str): The name of the Tibia server.
+            last_update (float): The timestamp of the world's update.
+
+        Returns:
+            bool: Whether the market snapshot was reloaded.
+        """
+        def is_stale(cache: CacheableData) -> bool:
+            return cache.age > -1 and time.time() - cache.age < last_update
+
+        prefix = f"{server}_"
+        self.history_cache.evict_where(lambda key, cache: key.startswith(prefix) and is_stale(cache))
+        self.market_board_cache.evict_where(lambda key, cache: key.startswith(prefix) and is_stale(cache))
+
+        cache = self.market_values_cache.get(server)
+
+        if cache is None or not is_stale(cache):
+            return False
+
+        await cache.revalidate_async()
+        self.market_values_cache.update_size(server)
+
+        return True
+
+    async def prefetch_market_values_async(self, server: str) -> bool:
+        """Loads the market snapshot of a world in the prefetch lane, unless the cached one is up to date.
+        A snapshot loaded by a command in the meantime is not replaced.
+
+        Args:
+            server (str): The name of the Tibia server.
+
+        Returns:
+            bool: Whether the market snapshot was loaded.
+        """
+        server = self.normalize_world(server)
+        await self.throw_if_world_not_found(server)
+
+        cache = self.market_values_cache.get_or_create(server, lambda: self._create_market_values_cache(server))
+        last_world_update = (await self.world_data.get_async())[server].last_update.timestamp()
+
+        if cache.is_fresh(last_world_update):
+            return False
+
+        load_time = time.time()
+        snapshot = await self._load_market_values(server, RequestPriority.PREFETCH)
+
+        if cache.restore(snapshot, load_time):
+            self.market_values_cache.update_size(server)
+
+        return True
+
+    async def save_caches_async(self):
+        """Saves the meta data, world data and the market snapshots of all worlds to disk, together with the times they were loaded at.
+        The values are collected on the event loop and written in the worker pool.
+        """
+        entries = []
+
+        for name, cache in (("meta_data", self.meta_data), ("world_data", self.world_data)):
+            if cache.age > -1:
+                entries.append((name, list(cache.value.values()), time.time() - cache.age))
+
+        snapshots = []
+
+        for world in self.market_values_cache.keys():
+            cache = self.market_values_cache.get(world)
+
+            if cache is not None and cache.age > -1:
+                snapshots.append((world, cache.value, time.time() - cache.age))
+
+        await self.payload_decoder.run(self._save_caches, entries, snapshots)
+
+    def _save_caches(self, entries: List[Tuple[str, List[BaseModel], float]], snapshots: List[Tuple[str, MarketSnapshot, float]]):
+        """Writes cached values to the cache store.
+
+        Args:
+            entries (List[Tuple[str, List[BaseModel], float]]): The name, models and load time of each list of models.
+            snapshots (List[Tuple[str, MarketSnapshot, float]]): The world, snapshot and load time of each market snapshot.
+        """
+        for name, models, load_time in entries:
+            self.cache_store.save_rows(name, [model.model_dump(mode="json") for model in models], load_time)
+
+        for world, snapshot, load_time in snapshots:
+            self.cache_store.save_snapshot(world, snapshot, load_time)
+
+    async def load_caches_async(self) -> int:
+        """Loads the caches saved by save_caches_async, keeping the times they were originally loaded at, so they are revalidated as usual.
+        Caches that already hold newer values are not replaced.
+
+        Returns:
+            int: The amount of restored caches.
+        """
+        meta_data, world_data, snapshots = await self.payload_decoder.run(self._load_caches)
+        restored_count = 0
+
+        if meta_data:
+            (items_meta_data, item_index), load_time = meta_data
+
+            if self.meta_data.restore(items_meta_data, load_time):
+                self.item_index = item_index
+                restored_count += 1
+
+        if world_data and self.world_data.restore(*world_data):
+            restored_count += 1
+
+        for world, (snapshot, load_time) in snapshots.items():
+            cache = self.market_values_cache.get_or_create(world, lambda world=world: self._create_market_values_cache(world))
+
+            if cache.restore(snapshot, load_time):
+                self.market_values_cache.update_size(world)
+                restored_count += 1
+
+        return restored_count
+
+    def _load_caches(self) -> Tuple[Any, Any, Dict[str, Tuple[MarketSnapshot, float]]]:
+        """Reads the saved caches from the cache store and creates their values.
+
+        Returns:
+            Tuple[Any, Any, Dict[str, Tuple[MarketSnapshot, float]]]: The meta data with its index, the world data and the market snapshots, each with their load time.
+                Caches that weren't saved are None.
+        """
+        meta_data = self.cache_store.load_rows("meta_data")
+        world_data = self.cache_store.load_rows("world_data")
+
+        if meta_data:
+            meta_data = self._build_meta_data(meta_data[0]), meta_data[1]
 
-        return (await self.meta_data.get_async())[item_id]
+        if world_data:
+            world_data = {world["name"]: WorldData(**world) for world in world_data[0]}, world_data[1]
 
-    async def _load_market_values(self, server: str) -> MarketBoard:
-        """Loads and caches the market values of an item in a Tibia server.
+        return meta_data, world_data, self.cache_store.load_snapshots()
+
+    def _create_market_values_cache(self, server: str) -> CacheableData[MarketSnapshot]:
+        """Creates the cache of the market snapshot of a world.
 
         Args:
             server (str): The name of the Tibia server.
 
         Returns:
-            MarketBoard: The market values of an item in a Tibia server.
+            CacheableData[MarketSnapshot]: The cache of the market snapshot.
+        """
+        return CacheableData(lambda: self._load_market_values(server), invalidate_after_seconds=3600,
+                             background_loader=lambda: self._load_market_values(server, RequestPriority.BACKGROUND))
+
+    def _resolve_item_id(self, item_index: ItemIndex, identifier: str) -> int:
+        """Resolves an item identifier with an item index, suggesting similar item names if it isn't found.
+
+        Args:
+            item_index (ItemIndex): The index of the loaded meta data.
+            identifier (str): The identifier of the item.
+
+        Returns:
+            int: The id of the item.
         """
-        response = await self._send_request("market_values", server=server, limit=5000)
+        item_id = item_index.get_id(identifier)
 
-        market_values = {}
+        if item_id is None:
+            normalized_identifier = self.normalize_identifier(str(identifier))
+            suggestions = item_index.search_index.fuzzy_search(normalized_identifier, 3)
+            suggestion = f" Did you mean {', '.join(suggestions)}?" if suggestions else ""
 
-        for item in response:
-            market_values[item["id"]] = MarketValues(**item)
+            raise ValueError(f"Item with identifier '{normalized_identifier}' not found.{suggestion}")
 
-        return market_values
+        return item_id
 
-    async def _load_history(self, server: str, item_id: int, timespan: int) -> List[MarketValues]:
+    @staticmethod
+    def _get_cache_size(cache: CacheableData) -> int:
+        """Estimates the size of a cached value in bytes.
+
+        Args:
+            cache (CacheableData): The cache item.
+
+        Returns:
+            int: The estimated size in bytes.
+        """
+        return estimate_size(cache.value)
+
+    async def _load_market_values(self, server: str, priority: RequestPriority = RequestPriority.INTERACTIVE) -> MarketSnapshot:
+        """Loads and caches the market values of all items in a Tibia server.
+
+        Args:
+            server (str): The name of the Tibia server.
+            priority (RequestPriority, optional): The rate limiter lane of the request. Defaults to RequestPriority.INTERACTIVE.
+
+        Returns:
+            MarketSnapshot: The market values of all items in a Tibia server.
+        """
+        response = await self._send_request("market_values", priority, server=server, limit=5000)
+
+        # Materialize the snapshot in the worker pool, it takes a while for thousands of items.
+        return await self.payload_decoder.run(self._build_market_snapshot, response)
+
+    def _build_market_snapshot(self, response: List[Dict[str, Any]]) -> MarketSnapshot:
+        """Creates the market snapshot of a world from the response of the API.
+
+        Args:
+            response (List[Dict[str, Any]]): The decoded response of the market_values endpoint.
+
+        Returns:
+            MarketSnapshot: The market values of all items in the world.
+        """
+        # Trusted rows can be put into the columns directly, without creating a model for each of them.
+        if self.model_builder.is_sample_valid(MarketValues, response):
+            return MarketSnapshot.from_rows(response)
+
+        return MarketSnapshot.from_market_values(self.model_builder.validate_list(MarketValues, response))
+
+    async def _load_history(self, server: str, item_id: int, timespan: int) -> HistorySeries:
         """Loads and caches the market values history of an item in a Tibia server.
 
         Args:
@@ -199,11 +438,11 @@ class MarketApi:
             timespan (int): The amount of days ago to get the history from.
 
         Returns:
-            List[MarketValues]: The market values history of an item in a Tibia server.
+            HistorySeries: The market values history of an item in a Tibia server.
         """
         response = await self._send_request("item_history", server=server, item_id=item_id, start_days_ago=timespan)
 
-        return [MarketValues(**item) for item in response]
+        return await self.payload_decoder.run(lambda: HistorySeries(self.model_builder.build_list(MarketValues, response)))
 
     async def _load_market_board(self, server: str, item_id: int) -> MarketBoard:
         """Loads and caches the market board of an item in a Tibia server.
@@ -217,15 +456,18 @@ class MarketApi:
         """
         response = await self._send_request("market_board", server=server, item_id=item_id)
 
-        return MarketBoard(**response)
+        return self.model_builder.build(MarketBoard, response)
 
-    async def _load_world_data(self) -> Dict[str, WorldData]:
+    async def _load_world_data(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> Dict[str, WorldData]:
         """Loads and caches the world data of all Tibia servers.
 
+        Args:
+            priority (RequestPriority, optional): The rate limiter lane of the request. Defaults to RequestPriority.INTERACTIVE.
+
         Returns:
             Dict[str, WorldData]: The world data of all Tibia servers.
         """
-        response = await self._send_request("world_data")
+        response = await self._send_request("world_data", priority)
 
         worlds = {}
 
@@ -234,50 +476,99 @@ class MarketApi:
 
         return worlds
 
-    async def _load_meta_data(self) -> Dict[str, ItemMetaData]:
+    async def _load_meta_data(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> Dict[str, ItemMetaData]:
         """Loads and caches the meta data of all items.
 
+        Args:
+            priority (RequestPriority, optional): The rate limiter lane of the request. Defaults to RequestPriority.INTERACTIVE.
+
         Returns:
             Dict[int, ItemMetaData]: The meta data of all items.
         """
-        response = await self._send_request("item_metadata")
+        response = await self._send_request("item_metadata", priority)
 
-        meta_data = {}
+        # Materialize the models and build the new index in the worker pool, it takes a while for thousands of items.
+        meta_data, item_index = await self.payload_decoder.run(self._build_meta_data, response)
 
-        # Populate the meta data dictionary with each item's meta data.
-        # Also populate the identifier to id dictionary with any possible identifier.
-        for item in response:
-            item_meta_data = ItemMetaData(**item)
-            meta_data[item_meta_data.id] = item_meta_data
+        # Replace the whole index at once, so lookups never see a half-built one.
+        self.item_index = item_index
 
-            self.identifier_to_id[str(item["id"])] = item_meta_data.id
-            self.identifier_to_id[self.normalize_identifier(item["name"])] = item_meta_data.id
-            self.identifier_to_id[self.normalize_identifier(f"{item['name']} ({item['id']})")] = item_meta_data.id
+        return meta_data
 
-            if item["wiki_name"]:
-                self.identifier_to_id[self.normalize_identifier(item["wiki_name"])] = item_meta_data.id
+    def _build_meta_data(self, response: List[Dict[str, Any]]) -> Tuple[Dict[int, ItemMetaData], ItemIndex]:
+        """Creates the meta data of all items and their index from the response of the API.
 
-        return meta_data
+        Args:
+            response (List[Dict[str, Any]]): The decoded response of the item_metadata endpoint.
 
-    async def _send_request(self, endpoint: str, **query_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            Tuple[Dict[int, ItemMetaData], ItemIndex]: The meta data of all items, and the index of their identifiers and names.
+        """
+        items_meta_data = self.model_builder.build_list(ItemMetaData, response)
+        meta_data = {item_meta_data.id: item_meta_data for item_meta_data in items_meta_data}
+
+        return meta_data, ItemIndex(items_meta_data, self.normalize_identifier)
+
+    async def _send_request(self, endpoint: str, priority: RequestPriority = RequestPriority.INTERACTIVE, **query_parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Send a request to the Tibia API.
+        Identical requests that are already in flight are coalesced, and all callers receive the same response.
+        A more urgent caller joining a request moves it up to its own lane of the rate limiter.
+
+        Args:
+            endpoint (str): The endpoint of the API.
+            priority (RequestPriority, optional): The rate limiter lane of the request. Defaults to RequestPriority.INTERACTIVE.
+            query_parameters (Dict): The parameters of the request.
+
+        Returns:
+            Dict: The response of the request.
+        """
+        key = (endpoint, tuple(sorted(query_parameters.items())))
+        ticket = self._request_tickets.get(key)
+
+        if ticket is not None:
+            self.rate_limiter.raise_priority(ticket, priority)
+
+        async def fetch() -> Dict[str, Any]:
+            request_ticket = RequestTicket(priority)
+            self._request_tickets[key] = request_ticket
+
+            try:
+                return await self._fetch(endpoint, request_ticket, **query_parameters)
+            finally:
+                if self._request_tickets.get(key) is request_ticket:
+                    del self._request_tickets[key]
+
+        return await self.request_coalescer.run(key, fetch)
+
+    async def _fetch(self, endpoint: str, ticket: RequestTicket, **query_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a response from the Tibia API, pacing it with the rate limiter and retrying if it was ratelimited anyway.
 
         Args:
             endpoint (str): The endpoint of the API.
+            ticket (RequestTicket): The rate limiter lane of the request.
             query_parameters (Dict): The parameters of the request.
 
         Returns:
             Dict: The response of the request.
         """
-        response = await self.http_client.get(self.api_url + endpoint, headers=self.headers, params=query_parameters, timeout=60)
+        is_retry = False
+
+        while True:
+            await self.rate_limiter.acquire(is_retry=is_retry, ticket=ticket)
 
-        # If ratelimited, wait for the ratelimit to reset.
-        if response.status_code == 429:
-            reset_timestamp = float(response.headers["X-Ratelimit-Reset"])
-            reset_time = max(0, reset_timestamp - time())
+            if self.stream_responses:
+                async with self.http_client.stream("GET", self.api_url + endpoint, headers=self.headers, params=query_parameters, timeout=60) as response:
+                    self.rate_limiter.update(response.status_code, response.headers)
 
-            await asyncio.sleep(reset_time)
+                    if response.status_code != 429:
+                        return await self.payload_decoder.decode_stream(response.aiter_bytes(self.payload_decoder.stream_chunk_size))
+            else:
+                response = await self.http_client.get(self.api_url + endpoint, headers=self.headers, params=query_parameters, timeout=60)
+                self.rate_limiter.update(response.status_code, response.headers)
 
-            return await self._send_request(endpoint, **query_parameters)
+                # Decode the response in the worker pool, large payloads would block the event loop for a while.
+                if response.status_code != 429:
+                    return await self.payload_decoder.decode(response.content)
 
-        return response.json()
+            # If ratelimited, the rate limiter holds the request back until the ratelimit resets.
+            is_retry = True
@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, IO
+import numpy as np
+from utils.data.market_snapshot import MarketSnapshot
+
+
+_LOAD_TIME_KEY = "__load_time__"
+
+class MarketCacheStore:
+    """Stores cached market data on disk, so a restarted bot can serve it right away instead of downloading it again.
+    Every entry is stored together with the time it was originally loaded, so it is revalidated as if it was never unloaded.
+    Lists of rows are stored as JSON, market snapshots as compressed NumPy archives with one array per column.
+    Files are replaced atomically, so a crash while saving leaves the previous file intact.
+
+    Args:
+        directory (str, optional): The directory of the files. Defaults to the cache directory next to the database.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory: str = directory if directory else os.path.join(os.path.dirname(__file__), "data", "cache")
+
+    def save_rows(self, name: str, rows: List[Dict[str, Any]], load_time: float):
+        """Saves a list of rows.
+
+        Args:
+            name (str): The name of the entry, e.g. "meta_data".
+            rows (List[Dict[str, Any]]): The rows, containing only JSON serializable values.
+            load_time (float): The timestamp the rows were originally loaded at.
+        """
+        self._write(f"{name}.json", lambda f: f.write(json.dumps({"load_time": load_time, "rows": rows}).encode("utf-8")))
+
+    def load_rows(self, name: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """Loads a list of rows.
+
+        Args:
+            name (str): The name of the entry, e.g. "meta_data".
+
+        Returns:
+            Optional[Tuple[List[Dict[str, Any]], float]]: The rows and the timestamp they were originally loaded at, or None if they weren't saved or can't be read.
+        """
+        try:
+            with open(self._get_path(f"{name}.json"), mode="r", encoding="utf-8") as f:
+                content = json.load(f)
+
+            return content["rows"], content["load_time"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Failed to load the cached {name}: {e}")
+            return None
+
+    def save_snapshot(self, world: str, snapshot: MarketSnapshot, load_time: float):
+        """Saves the market snapshot of a world.
+
+        Args:
+            world (str): The name of the world.
+            snapshot (MarketSnapshot): The snapshot.
+            load_time (float): The timestamp the snapshot was originally loaded at.
+        """
+        arrays = snapshot.to_arrays()
+        arrays[_LOAD_TIME_KEY] = np.array(load_time)
+
+        self._write(os.path.join("market_values", f"{world}.npz"), lambda f: np.savez_compressed(f, **arrays))
+
+    def load_snapshots(self) -> Dict[str, Tuple[MarketSnapshot, float]]:
+        """Loads the market snapshots of all saved worlds.
+
+        Returns:
+            Dict[str, Tuple[MarketSnapshot, float]]: The snapshot of each world and the timestamp it was originally loaded at.
+                Snapshots that can't be read are skipped.
+        """
+        directory = self._get_path("market_values")
+        snapshots = {}
+
+        if not os.path.isdir(directory):
+            return snapshots
+
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(".npz"):
+                continue
+
+            world = entry.name[:-len(".npz")]
+
+            try:
+                with np.load(entry.path, allow_pickle=False) as arrays:
+                    snapshots[world] = MarketSnapshot.from_arrays(arrays), float(arrays[_LOAD_TIME_KEY])
+            except Exception as e:
+                print(f"Failed to load the cached market values of {world}: {e}")
+
+        return snapshots
+
+    def _get_path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    def _write(self, file_name: str, write: Callable[[IO[bytes]], Any]):
+        path = self._get_path(file_name)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first, so a crash can't leave a partial file behind.
+        with open(temporary_path, mode="wb") as f:
+            write(f)
+
+        os.replace(temporary_path, path)
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from utils.market_api import MarketApi
+
+
+class MarketRefresher:
+    """Watches the world data for updated worlds and brings their cached market data up to date in the background,
+    so commands don't have to wait for the reload after an update.
+
+    Args:
+        market_api (MarketApi): The market API whose caches are refreshed.
+        interval_seconds (float, optional): The time in seconds between two checks of the world data. Defaults to 60.
+    """
+
+    def __init__(self, market_api: "MarketApi", interval_seconds: float = 60):
+        self.market_api: "MarketApi" = market_api
+        self.interval_seconds: float = interval_seconds
+        self.refresh_count: int = 0
+        """The amount of market snapshots that were reloaded."""
+        self._last_updates: Dict[str, float] = {}
+        self._task: asyncio.Task = None
+
+    def start(self):
+        """Starts watching the world data on the running event loop."""
+        if self._task and not self._task.done():
+            return
+
+        self._task = asyncio.get_running_loop().create_task(self._run_async())
+
+    def stop(self):
+        """Stops watching."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run_async(self):
+        """Checks the world data for updates in a loop."""
+        while True:
+            try:
+                await self.check_async()
+            except Exception as e:
+                print(f"Error refreshing market data: {e}")
+
+            await asyncio.sleep(self.interval_seconds)
+
+    async def check_async(self) -> List[str]:
+        """Reloads the world data in the background lane, and refreshes the cached data of every world that was updated since the last check.
+
+        Returns:
+            List[str]: The names of the updated worlds.
+        """
+        await self.market_api.world_data.revalidate_async()
+        worlds = await self.market_api.world_data.get_async()
+        updated_worlds = []
+
+        for name, world in worlds.items():
+            last_update = world.last_update.timestamp()
+
+            # Worlds seen for the first time are refreshed by the lazy reload, if anyone uses them.
+            if name in self._last_updates and last_update > self._last_updates[name]:
+                updated_worlds.append(name)
+
+            self._last_updates[name] = last_update
+
+        results = await asyncio.gather(*[self.market_api.refresh_world_async(name, self._last_updates[name]) for name in updated_worlds], return_exceptions=True)
+
+        for name, result in zip(updated_worlds, results):
+            if isinstance(result, Exception):
+                print(f"Error refreshing the market data of {name}: {result}")
+            elif result:
+                self.refresh_count += 1
+
+        return updated_worlds
@@ -0,0 +1,154 @@
+import random
+import typing
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+
+M = TypeVar("M", bound=BaseModel)
+_NoneType = type(None)
+
+_nested_fields: Dict[type, Dict[str, Tuple[bool, type]]] = {}
+_list_adapters: Dict[type, TypeAdapter] = {}
+
+def _get_nested_fields(model_type: Type[BaseModel]) -> Dict[str, Tuple[bool, type]]:
+    """Gets the fields of a model which contain other models.
+
+    Args:
+        model_type (Type[BaseModel]): The type of the model.
+
+    Returns:
+        Dict[str, Tuple[bool, type]]: The field names, mapped to whether they are lists and the type of the nested model.
+    """
+    if model_type not in _nested_fields:
+        nested_fields = {}
+
+        for name, field in model_type.model_fields.items():
+            annotation = field.annotation
+
+            # Unwrap Optional[...] annotations.
+            if typing.get_origin(annotation) is typing.Union:
+                annotation = next(argument for argument in typing.get_args(annotation) if argument is not _NoneType)
+
+            is_list = typing.get_origin(annotation) in (list, List)
+            nested_type = typing.get_args(annotation)[0] if is_list else annotation
+
+            if isinstance(nested_type, type) and issubclass(nested_type, BaseModel):
+                nested_fields[name] = (is_list, nested_type)
+
+        _nested_fields[model_type] = nested_fields
+
+    return _nested_fields[model_type]
+
+def construct_model(model_type: Type[M], data: Dict[str, Any]) -> M:
+    """Creates a model and its nested models without validation.
+
+    Args:
+        model_type (Type[M]): The type of the model.
+        data (Dict[str, Any]): The values of the model's fields.
+
+    Returns:
+        M: The model.
+    """
+    nested_fields = _get_nested_fields(model_type)
+
+    if nested_fields:
+        data = dict(data)
+
+        for name, (is_list, nested_type) in nested_fields.items():
+            value = data.get(name)
+
+            if value is None:
+                continue
+
+            data[name] = [construct_model(nested_type, item) for item in value] if is_list else construct_model(nested_type, value)
+
+    return model_type.model_construct(**data)
+
+def _get_list_adapter(model_type: Type[M]) -> TypeAdapter:
+    if model_type not in _list_adapters:
+        _list_adapters[model_type] = TypeAdapter(List[model_type])
+
+    return _list_adapters[model_type]
+
+
+class ModelBuilder:
+    """Creates models from API payloads.
+    By default all rows are validated in one batch. In trusted mode, models are created without validation,
+    and only a random sample of rows is validated to detect changes of the API's schema.
+
+    Args:
+        trusted (bool, optional): Whether to trust the payloads and skip validating most rows. Defaults to False.
+        validation_sample_size (int, optional): The amount of rows validated per payload in trusted mode. Defaults to 20.
+    """
+
+    def __init__(self, trusted: bool = False, validation_sample_size: int = 20):
+        self.trusted: bool = trusted
+        self.validation_sample_size: int = validation_sample_size
+        self.schema_drift_count: int = 0
+        """The amount of trusted payloads whose sample failed validation."""
+
+    def build(self, model_type: Type[M], data: Dict[str, Any]) -> M:
+        """Creates a model from a payload.
+
+        Args:
+            model_type (Type[M]): The type of the model.
+            data (Dict[str, Any]): The decoded payload.
+
+        Returns:
+            M: The model.
+        """
+        return self.build_list(model_type, [data])[0]
+
+    def build_list(self, model_type: Type[M], rows: List[Dict[str, Any]]) -> List[M]:
+        """Creates a list of models from a payload.
+
+        Args:
+            model_type (Type[M]): The type of the models.
+            rows (List[Dict[str, Any]]): The decoded payload rows.
+
+        Returns:
+            List[M]: The models.
+        """
+        if not self.is_sample_valid(model_type, rows):
+            return self.validate_list(model_type, rows)
+
+        return [construct_model(model_type, row) for row in rows]
+
+    @staticmethod
+    def validate_list(model_type: Type[M], rows: List[Dict[str, Any]]) -> List[M]:
+        """Creates a list of models from a payload, validating all rows in one batch.
+
+        Args:
+            model_type (Type[M]): The type of the models.
+            rows (List[Dict[str, Any]]): The decoded payload rows.
+
+        Returns:
+            List[M]: The models.
+        """
+        return _get_list_adapter(model_type).validate_python(rows)
+
+    def is_sample_valid(self, model_type: Type[M], rows: List[Dict[str, Any]]) -> bool:
+        """Checks whether the rows of a payload can be trusted without validating all of them.
+        Always False if not in trusted mode.
+
+        Args:
+            model_type (Type[M]): The type of the models.
+            rows (List[Dict[str, Any]]): The decoded payload rows.
+
+        Returns:
+            bool: True if the rows can be trusted, False if they need to be validated.
+        """
+        if not self.trusted:
+            return False
+
+        sample = random.sample(rows, min(self.validation_sample_size, len(rows)))
+
+        try:
+            _get_list_adapter(model_type).validate_python(sample)
+        except ValidationError as e:
+            self.schema_drift_count += 1
+            print(f"The {model_type.__name__} payload does not match its schema anymore, validating all rows: {e}")
+
+            return False
+
+        return True
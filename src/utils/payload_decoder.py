@@ -0,0 +1,166 @@
+import asyncio
+import codecs
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, List, TypeVar
+
+
+T = TypeVar("T")
+
+class JsonStreamParser:
+    """Parses a JSON document incrementally from chunks of bytes.
+    If the document is an array, its items are decoded as soon as they are complete, so only the unparsed tail of the text is kept in memory.
+    """
+
+    def __init__(self):
+        self._json_decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._is_array: bool = None
+        self._is_array_closed: bool = False
+        self._is_item_expected: bool = False
+        self._items: List[Any] = []
+
+    def feed(self, chunk: bytes):
+        """Feeds the next chunk of the document to the parser.
+
+        Args:
+            chunk (bytes): The next chunk of the document.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+
+        # Check whether the document is an array once the first character arrived.
+        if self._is_array is None:
+            stripped_buffer = self._buffer.lstrip()
+
+            if not stripped_buffer:
+                return
+
+            self._is_array = stripped_buffer[0] == "["
+
+            if self._is_array:
+                self._buffer = stripped_buffer[1:]
+
+        if self._is_array:
+            self._parse_items()
+
+    def close(self) -> Any:
+        """Finishes parsing the document.
+
+        Returns:
+            Any: The decoded document.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+
+        if not self._is_array:
+            return json.loads(self._buffer)
+
+        self._parse_items()
+
+        if not self._is_array_closed or self._buffer.strip():
+            raise json.JSONDecodeError("Incomplete or invalid JSON array", self._buffer, 0)
+
+        return self._items
+
+    def _parse_items(self):
+        """Decodes all complete items in the buffer, and keeps the incomplete tail."""
+        buffer = self._buffer
+        position = 0
+
+        while not self._is_array_closed:
+            # Skip the whitespace before the next item.
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+
+            if position >= len(buffer):
+                break
+
+            # A separator without an item before it, or a closing bracket right after a separator, is invalid.
+            # It stays in the buffer and is reported by close.
+            if buffer[position] == "," or (buffer[position] == "]" and self._is_item_expected):
+                break
+
+            if buffer[position] == "]":
+                self._is_array_closed = True
+                position += 1
+                break
+
+            try:
+                item, end = self._json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item is not complete yet, wait for the next chunk.
+                break
+
+            separator_position = end
+
+            while separator_position < len(buffer) and buffer[separator_position] in " \t\r\n":
+                separator_position += 1
+
+            # An item is only complete once the separator after it arrived, a scalar like "1." or "1e" may continue in the next chunk.
+            # Invalid text after an item stays in the buffer, and is reported by close.
+            if separator_position >= len(buffer) or buffer[separator_position] not in ",]":
+                break
+
+            self._items.append(item)
+
+            # Consume exactly one separator, the closing bracket is handled by the next iteration.
+            self._is_item_expected = buffer[separator_position] == ","
+            position = separator_position + 1 if self._is_item_expected else separator_position
+
+        self._buffer = buffer[position:]
+
+
+class PayloadDecoder:
+    """Decodes API payloads and materializes them into models in a worker thread pool, so large payloads don't block the event loop.
+
+    Args:
+        max_workers (int, optional): The maximum amount of worker threads. Defaults to 2.
+        stream_chunk_size (int, optional): The amount of bytes handed to a worker at once when decoding a stream. Defaults to 262144.
+    """
+
+    def __init__(self, max_workers: int = 2, stream_chunk_size: int = 262144):
+        self.stream_chunk_size: int = stream_chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="payload_decoder")
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs a function in the worker pool.
+
+        Args:
+            func (Callable[..., T]): The function to run.
+            args (Any): The arguments of the function.
+
+        Returns:
+            T: The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def decode(self, content: bytes) -> Any:
+        """Decodes a complete JSON document in the worker pool.
+
+        Args:
+            content (bytes): The JSON document.
+
+        Returns:
+            Any: The decoded document.
+        """
+        return await self.run(json.loads, content)
+
+    async def decode_stream(self, chunks: AsyncIterator[bytes]) -> Any:
+        """Decodes a JSON document while it is being received, parsing each chunk in the worker pool.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The chunks of the JSON document.
+
+        Returns:
+            Any: The decoded document.
+        """
+        parser = JsonStreamParser()
+
+        async for chunk in chunks:
+            await self.run(parser.feed, chunk)
+
+        return await self.run(parser.close)
+
+    def shutdown(self):
+        """Shuts down the worker pool."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,224 @@
+import asyncio
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Mapping, Optional
+
+
+class RequestPriority(IntEnum):
+    """The priority lanes of the rate limiter. Lower values are served first."""
+
+    INTERACTIVE = 0
+    """Requests a user is actively waiting for, like commands and autocompletes."""
+    BACKGROUND = 1
+    """Requests refreshing data in the background."""
+    PREFETCH = 2
+    """Requests loading data that might be needed in the future."""
+
+
+class RequestTicket:
+    """The lane of a request, which can be raised with RateLimiter.raise_priority while the request waits for a token,
+    e.g. when a more urgent caller joins the request.
+
+    Args:
+        priority (RequestPriority): The initial lane of the request.
+    """
+
+    def __init__(self, priority: RequestPriority):
+        self.priority: RequestPriority = priority
+        self.waiter: Optional[asyncio.Future] = None
+        """The future of the request waiting in its lane, None if the request isn't waiting."""
+
+
+class RateLimiter:
+    """A token bucket rate limiter with priority lanes.
+    Requests are paced before the server rejects them, based on the configured rate and the advertised rate limit headers.
+
+    Args:
+        capacity (float, optional): The maximum amount of requests that can be sent in a burst. Defaults to 10.
+        refill_per_second (float, optional): The amount of requests that can be sent per second on average. Defaults to 10.
+    """
+
+    def __init__(self, capacity: float = 10, refill_per_second: float = 10):
+        self.capacity: float = capacity
+        self.refill_per_second: float = refill_per_second
+        self._tokens: float = capacity
+        self._last_refill: float = time.monotonic()
+        self._blocked_until: float = 0
+        self._lanes: Dict[RequestPriority, Deque[asyncio.Future]] = {priority: deque() for priority in RequestPriority}
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+        self._wait_count: Dict[RequestPriority, int] = {priority: 0 for priority in RequestPriority}
+        self._total_wait_time: Dict[RequestPriority, float] = {priority: 0 for priority in RequestPriority}
+        self._max_wait_time: Dict[RequestPriority, float] = {priority: 0 for priority in RequestPriority}
+
+    def get_queue_depth(self, priority: RequestPriority = None) -> int:
+        """Gets the amount of requests waiting for a token.
+
+        Args:
+            priority (RequestPriority, optional): The lane to count. Counts all lanes if None. Defaults to None.
+
+        Returns:
+            int: The amount of waiting requests.
+        """
+        if priority is None:
+            return sum(len(lane) for lane in self._lanes.values())
+
+        return len(self._lanes[priority])
+
+    def get_average_wait_time(self, priority: RequestPriority) -> float:
+        """Gets the average time in seconds requests of a lane waited for a token.
+
+        Args:
+            priority (RequestPriority): The lane to get the wait time of.
+
+        Returns:
+            float: The average wait time in seconds.
+        """
+        if not self._wait_count[priority]:
+            return 0
+
+        return self._total_wait_time[priority] / self._wait_count[priority]
+
+    def get_max_wait_time(self, priority: RequestPriority) -> float:
+        """Gets the longest time in seconds a request of a lane waited for a token.
+
+        Args:
+            priority (RequestPriority): The lane to get the wait time of.
+
+        Returns:
+            float: The maximum wait time in seconds.
+        """
+        return self._max_wait_time[priority]
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE, is_retry: bool = False, ticket: RequestTicket = None):
+        """Waits until a request of the given priority may be sent.
+
+        Args:
+            priority (RequestPriority, optional): The lane of the request. Defaults to RequestPriority.INTERACTIVE.
+            is_retry (bool, optional): Whether the request was rejected before. Retries are put at the front of their lane. Defaults to False.
+            ticket (RequestTicket, optional): The ticket of the request, its lane can be raised while the request waits.
+                Its priority is used instead of the priority argument. Defaults to None.
+        """
+        start_time = time.monotonic()
+        ticket = ticket if ticket else RequestTicket(priority)
+
+        # Skip the queue entirely if nobody is waiting and a token is available.
+        if not self.get_queue_depth() and self._try_consume_token():
+            self._record_wait_time(ticket.priority, 0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        ticket.waiter = future
+
+        if is_retry:
+            self._lanes[ticket.priority].appendleft(future)
+        else:
+            self._lanes[ticket.priority].append(future)
+
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in self._lanes[ticket.priority]:
+                self._lanes[ticket.priority].remove(future)
+            elif not future.cancelled():
+                # The token was already handed out, give it back.
+                self._tokens = min(self.capacity, self._tokens + 1)
+
+            self._dispatch()
+            raise
+        finally:
+            ticket.waiter = None
+
+        self._record_wait_time(ticket.priority, time.monotonic() - start_time)
+
+    def raise_priority(self, ticket: RequestTicket, priority: RequestPriority):
+        """Moves a request to a more urgent lane, if it is in a less urgent one. A waiting request is moved to the back of the new lane.
+
+        Args:
+            ticket (RequestTicket): The ticket of the request.
+            priority (RequestPriority): The lane to move the request to.
+        """
+        if priority >= ticket.priority:
+            return
+
+        waiter = ticket.waiter
+
+        if waiter is not None and waiter in self._lanes[ticket.priority]:
+            self._lanes[ticket.priority].remove(waiter)
+            self._lanes[priority].append(waiter)
+
+        ticket.priority = priority
+
+        if waiter is not None:
+            self._dispatch()
+
+    def update(self, status_code: int, headers: Mapping[str, str]):
+        """Updates the limiter with the rate limit information of a response.
+
+        Args:
+            status_code (int): The status code of the response.
+            headers (Mapping[str, str]): The headers of the response.
+        """
+        remaining = headers.get("X-Ratelimit-Remaining")
+        reset = headers.get("X-Ratelimit-Reset")
+
+        if remaining is not None:
+            self._refill()
+            self._tokens = min(self._tokens, float(remaining))
+
+        # Hold back all requests until the reset if the server has no requests left for us.
+        if reset is not None and (status_code == 429 or (remaining is not None and float(remaining) <= 0)):
+            self._tokens = min(self._tokens, 0)
+            self._blocked_until = max(self._blocked_until, float(reset))
+
+    def _try_consume_token(self) -> bool:
+        if self._get_time_until_token() > 0:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    def _get_time_until_token(self) -> float:
+        blocked_for = self._blocked_until - time.time()
+
+        if blocked_for > 0:
+            return blocked_for
+
+        self._refill()
+
+        if self._tokens >= 1:
+            return 0
+
+        return (1 - self._tokens) / self.refill_per_second
+
+    def _refill(self):
+        current_time = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (current_time - self._last_refill) * self.refill_per_second)
+        self._last_refill = current_time
+
+    def _dispatch(self):
+        """Hands out tokens to the waiting requests in order of priority, and schedules the next dispatch if requests are left waiting."""
+        if self._wake_handle:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+
+        for priority in RequestPriority:
+            lane = self._lanes[priority]
+
+            while lane:
+                if lane[0].done():
+                    lane.popleft()
+                    continue
+
+                if not self._try_consume_token():
+                    self._wake_handle = asyncio.get_running_loop().call_later(self._get_time_until_token(), self._dispatch)
+                    return
+
+                lane.popleft().set_result(None)
+
+    def _record_wait_time(self, priority: RequestPriority, wait_time: float):
+        self._wait_count[priority] += 1
+        self._total_wait_time[priority] += wait_time
+        self._max_wait_time[priority] = max(self._max_wait_time[priority], wait_time)
@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class RequestCoalescer:
+    """Deduplicates identical in-flight requests. Concurrent callers with the same key await one shared future
+    instead of each starting their own request.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.request_count: int = 0
+        """The amount of requests that were actually started."""
+        self.coalesced_count: int = 0
+        """The amount of callers that joined an already running request instead of starting a new one."""
+
+    @property
+    def in_flight_count(self) -> int:
+        """Gets the amount of requests that are currently running."""
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, request_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs the request created by the factory, or joins the running request with the same key.
+
+        Args:
+            key (Hashable): The key identifying identical requests.
+            request_factory (Callable[[], Awaitable[Any]]): The function that creates the request if none is running.
+
+        Returns:
+            Any: The shared result of the request.
+        """
+        future = self._in_flight.get(key)
+
+        if future is not None and future.get_loop() is asyncio.get_running_loop():
+            self.coalesced_count += 1
+        else:
+            future = asyncio.ensure_future(request_factory())
+            self._in_flight[key] = future
+            self.request_count += 1
+
+            future.add_done_callback(lambda done_future: self._remove_in_flight(key, done_future))
+
+        # Shield the shared future, so a cancelled caller does not cancel the request for everyone else.
+        return await asyncio.shield(future)
+
+    def _remove_in_flight(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
@@ -0,0 +1,31 @@
+from typing import Dict
+from utils.data.item_meta_data import ItemMetaData
+from utils.data.world_data import WorldData
+
+
+class RequestContext:
+    """The world and item a command is about, resolved once per command, so every part of its response comes from the same data version
+    and the caches are only asked once. Create it with MarketApi.create_request_context and pass it to the get methods.
+
+    Args:
+        world (WorldData): The data of the world, including the update the response is based on.
+        item_id (int): The id of the item.
+        items_meta_data (Dict[int, ItemMetaData]): The meta data of all items, as loaded when the context was created.
+    """
+
+    def __init__(self, world: WorldData, item_id: int, items_meta_data: Dict[int, ItemMetaData]):
+        self.world: WorldData = world
+        self.item_id: int = item_id
+        self.items_meta_data: Dict[int, ItemMetaData] = items_meta_data
+        self.last_world_update: float = world.last_update.timestamp()
+        """The timestamp of the world's update, cached data older than it is reloaded."""
+
+    @property
+    def server(self) -> str:
+        """Gets the normalized name of the world."""
+        return self.world.name
+
+    @property
+    def meta_data(self) -> ItemMetaData:
+        """Gets the meta data of the item."""
+        return self.items_meta_data[self.item_id]
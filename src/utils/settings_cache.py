@@ -0,0 +1,140 @@
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from pydantic import BaseModel
+from tinydb import Query
+from utils import database
+from utils.async_database import AsyncDatabase
+from utils.bounded_cache import BoundedCache
+from utils.write_behind_queue import WriteBehindQueue
+
+
+T = TypeVar("T", bound=BaseModel)
+
+_MISSING = object()
+
+
+class SettingsCache(Generic[T]):
+    """A read-through cache in front of a database table of settings keyed by id.
+    Settings that don't exist are remembered as well, so looking them up again doesn't hit the database.
+    Saved settings are written to the database in batches by the WriteBehindQueue.
+    The cache is cleared when the database is set up again.
+
+    Args:
+        table_type (type): The type of the settings, a BaseModel with an id.
+        max_entries (int, optional): The maximum amount of cached settings, the least recently used are evicted. Defaults to 100000.
+    """
+
+    def __init__(self, table_type: type, max_entries: int = 100000):
+        self.table_type: type = table_type
+        self._entries: BoundedCache[int, Optional[T]] = BoundedCache(max_entries)
+        self._table: database.DatabaseTable[T] = None
+
+    def _get_table(self) -> database.DatabaseTable[T]:
+        table = database.get_table(self.table_type)
+
+        # The database was set up again, so the cached settings may be outdated.
+        if table is not self._table:
+            self._entries.clear()
+            self._table = table
+
+        return table
+
+    def get(self, settings_id: int, copy: bool = True) -> Tuple[T, bool]:
+        """Gets the settings with an id, from the database if they aren't cached yet.
+
+        Args:
+            settings_id (int): The id of the settings.
+            copy (bool, optional): Whether to return a copy, which may be changed without affecting the cache. Defaults to True.
+
+        Returns:
+            Tuple[T, bool]: The settings, or new default settings if they don't exist, and whether they exist.
+        """
+        settings = self._get_cached(settings_id)
+
+        if settings is _MISSING:
+            settings = self._set_loaded(settings_id, self._table.get_data(Query().id == settings_id))
+
+        return self._to_result(settings_id, settings, copy)
+
+    async def get_async(self, settings_id: int, copy: bool = True) -> Tuple[T, bool]:
+        """Gets the settings with an id, from the database on a database thread if they aren't cached yet.
+
+        Args:
+            settings_id (int): The id of the settings.
+            copy (bool, optional): Whether to return a copy, which may be changed without affecting the cache. Defaults to True.
+
+        Returns:
+            Tuple[T, bool]: The settings, or new default settings if they don't exist, and whether they exist.
+        """
+        settings = self._get_cached(settings_id)
+
+        if settings is _MISSING:
+            settings = self._set_loaded(settings_id, await AsyncDatabase().get_data_async(self.table_type, Query().id == settings_id))
+
+        return self._to_result(settings_id, settings, copy)
+
+    def _get_cached(self, settings_id: int) -> Any:
+        """Gets the cached settings, or the settings waiting to be written, which are newer than the ones in the database.
+
+        Args:
+            settings_id (int): The id of the settings.
+
+        Returns:
+            Any: The settings, None if they don't exist, or _MISSING if they have to be loaded from the database.
+        """
+        self._get_table()
+        settings = self._entries.get(settings_id, _MISSING)
+
+        if settings is _MISSING:
+            settings = WriteBehindQueue().get_pending(self.table_type, settings_id)
+
+            if settings is None:
+                return _MISSING
+
+            self._entries.set(settings_id, settings)
+
+        return settings
+
+    def _set_loaded(self, settings_id: int, settings_data: List[T]) -> Optional[T]:
+        """Caches the settings read from the database, unless settings were saved while they were read, which are newer.
+
+        Args:
+            settings_id (int): The id of the settings.
+            settings_data (List[T]): The settings read from the database.
+
+        Returns:
+            Optional[T]: The newest settings, or None if they don't exist.
+        """
+        settings = self._entries.get(settings_id, _MISSING)
+
+        if settings is not _MISSING:
+            return settings
+
+        settings = WriteBehindQueue().get_pending(self.table_type, settings_id)
+
+        if settings is None:
+            settings = settings_data[0] if settings_data else None
+
+        self._entries.set(settings_id, settings)
+
+        return settings
+
+    def _to_result(self, settings_id: int, settings: Optional[T], copy: bool) -> Tuple[T, bool]:
+        if settings is None:
+            return self.table_type(id=settings_id), False
+
+        return (settings.model_copy() if copy else settings), True
+
+    def save(self, settings: T):
+        """Saves settings to the cache right away, and queues writing them to the database.
+
+        Args:
+            settings (T): The settings.
+        """
+        # Make sure settings of a previous database are not mixed in.
+        self._get_table()
+        self._entries.set(settings.id, settings.model_copy())
+        WriteBehindQueue().enqueue(settings)
+
+    def clear(self):
+        """Removes all settings from the cache."""
+        self._entries.clear()
@@ -0,0 +1,49 @@
+import time
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Measures how long each phase of the startup takes, so the time until the bot is ready can be kept low.
+    A phase ends when it is marked, and the next one starts right after, the first one starts when the timer is created.
+    """
+
+    def __init__(self):
+        self.phases: List[Tuple[str, float]] = []
+        """The name and duration in seconds of each finished phase, in order."""
+        self._start_time: float = time.perf_counter()
+        self._last_time: float = self._start_time
+
+    @property
+    def total_seconds(self) -> float:
+        """Gets the time in seconds from the creation of the timer until the end of the last phase."""
+        return self._last_time - self._start_time
+
+    def mark(self, phase: str) -> float:
+        """Ends a phase.
+
+        Args:
+            phase (str): The name of the phase.
+
+        Returns:
+            float: The duration of the phase in seconds.
+        """
+        current_time = time.perf_counter()
+        duration = current_time - self._last_time
+        self._last_time = current_time
+        self.phases.append((phase, duration))
+
+        return duration
+
+    def format_report(self) -> str:
+        """Formats the durations of all phases.
+
+        Returns:
+            str: The report, e.g. "Startup took 1.50s: imports 0.50s, login 1.00s".
+        """
+        phases = ", ".join(f"{phase} {duration:.2f}s" for phase, duration in self.phases)
+
+        return f"Startup took {self.total_seconds:.2f}s: {phases}"
+
+
+startup_timer: StartupTimer = StartupTimer()
+"""The timer of the bot's startup, started when this module is first imported."""
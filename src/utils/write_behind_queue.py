@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple, TypeVar
+from pydantic import BaseModel
+from utils import background_loop, database
+from utils.decorators.singleton import singleton
+
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@singleton
+class WriteBehindQueue:
+    """Collects settings writes and saves them to the database in batches, off the event loop.
+    Repeated writes to the same settings are merged, so only their latest state is written.
+    A batch is written once the oldest pending write waited for the flush interval, or right away once enough writes are pending.
+    Batches that failed to be written are retried, waiting twice as long after each failure in a row.
+
+    Args:
+        flush_interval_seconds (float, optional): The time in seconds pending writes wait for more writes to batch with. Defaults to 1.
+        max_pending (int, optional): The amount of pending writes that are written right away. Defaults to 100.
+        max_retry_delay_seconds (float, optional): The longest time in seconds to wait before retrying a failed batch. Defaults to 60.
+    """
+
+    def __init__(self, flush_interval_seconds: float = 1, max_pending: int = 100, max_retry_delay_seconds: float = 60):
+        self.flush_interval_seconds: float = flush_interval_seconds
+        self.max_pending: int = max_pending
+        self.max_retry_delay_seconds: float = max_retry_delay_seconds
+        self.write_count: int = 0
+        """The amount of settings that were written to the database."""
+        self.merged_count: int = 0
+        """The amount of writes that replaced a pending write of the same settings."""
+        self.flush_count: int = 0
+        self._pending: Dict[Tuple[type, int], BaseModel] = {}
+        self._writing: Dict[Tuple[type, int], BaseModel] = {}
+        """The batch currently being written, still newer than the database until the write finished."""
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._is_flush_scheduled: bool = False
+        self._failure_count: int = 0
+        """The amount of flushes in a row that failed to write a batch."""
+
+    @property
+    def pending_count(self) -> int:
+        """Gets the amount of settings waiting to be written."""
+        return len(self._pending)
+
+    def enqueue(self, settings: BaseModel):
+        """Adds settings to be written to the database, replacing a pending write of the same settings.
+
+        Args:
+            settings (BaseModel): The settings, a BaseModel with an id.
+        """
+        key = (type(settings), settings.id)
+
+        with self._lock:
+            if key in self._pending:
+                self.merged_count += 1
+
+            self._pending[key] = settings.model_copy()
+            should_flush_now = len(self._pending) >= self.max_pending
+            should_schedule = not should_flush_now and not self._is_flush_scheduled
+            self._is_flush_scheduled = self._is_flush_scheduled or should_schedule
+
+        if should_flush_now:
+            background_loop.run_in_background(self.flush)
+        elif should_schedule:
+            background_loop.run_in_background(self._flush_later_async)
+
+    def get_pending(self, table_type: type, settings_id: int) -> Optional[T]:
+        """Gets the pending write of settings, which is newer than the settings in the database.
+
+        Args:
+            table_type (type): The type of the settings.
+            settings_id (int): The id of the settings.
+
+        Returns:
+            Optional[T]: A copy of the pending settings, or None if there is no pending write.
+        """
+        with self._lock:
+            settings = self._pending.get((table_type, settings_id), self._writing.get((table_type, settings_id)))
+
+        return settings.model_copy() if settings else None
+
+    async def _flush_later_async(self):
+        """Waits for the flush interval, so more writes can join the batch, and writes it in a separate thread.
+        After failed flushes, the interval is doubled for each failure in a row, up to the maximum retry delay.
+        """
+        await asyncio.sleep(min(self.flush_interval_seconds * 2 ** self._failure_count, self.max_retry_delay_seconds))
+
+        with self._lock:
+            self._is_flush_scheduled = False
+
+        await asyncio.to_thread(self.flush)
+
+    def flush(self):
+        """Writes all pending settings to the database, one batch per settings type.
+        Settings that failed to be written stay pending, unless they were written again in the meantime, and another flush is scheduled.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._writing = batch
+
+            if not batch:
+                return
+
+            has_failed = False
+            batches: Dict[type, List[BaseModel]] = {}
+            for (table_type, _), settings in batch.items():
+                batches.setdefault(table_type, []).append(settings)
+
+            for table_type, settings_batch in batches.items():
+                try:
+                    database.get_table(table_type).update_many(settings_batch)
+                    self.write_count += len(settings_batch)
+                except Exception as e:
+                    print(f"Failed to write {len(settings_batch)} {table_type.__name__} settings: {e}")
+                    has_failed = True
+
+                    with self._lock:
+                        for settings in settings_batch:
+                            self._pending.setdefault((table_type, settings.id), settings)
+
+            with self._lock:
+                self._writing = {}
+                self._failure_count = self._failure_count + 1 if has_failed else 0
+                # Retry the failed settings, they would otherwise wait for the next unrelated write.
+                should_schedule = has_failed and not self._is_flush_scheduled
+                self._is_flush_scheduled = self._is_flush_scheduled or should_schedule
+
+            self.flush_count += 1
+
+            if should_schedule:
+                background_loop.run_in_background(self._flush_later_async)
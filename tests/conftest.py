@@ -1,11 +1,13 @@
 import pytest
 from utils.background_loop import stop_background_loop
+from utils.expiry_scheduler import ExpiryScheduler
 
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_unconfigure():
     """Hook called after the test session ends."""
     print("All tests have finished running, stopping background loop.")
+    ExpiryScheduler().stop()
     stop_background_loop()
 
 def pytest_collection_modifyitems(items):
@@ -0,0 +1,65 @@
+# pylint: disable=E1123,W0212
+from utils import database
+from utils.async_database import AsyncDatabase
+from utils.data.user import DiscordUser
+from tinydb import Query
+import asyncio
+import os
+import threading
+import pytest
+
+
+class TestAsyncDatabase:
+    """Test class for the AsyncDatabase class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Setup a fresh database for each test, and clean it up afterwards."""
+        database.setup_database("test_async_database")
+        yield
+        database.close_database()
+        os.remove(database.database_path)
+
+    async def test_operations_run_on_database_threads(self):
+        """Test if the operations run on the database threads and their latency is recorded."""
+        # Arrange
+        async_database = AsyncDatabase(force_new=True)
+        threads = []
+
+        # Act
+        try:
+            await async_database.update_many_async(DiscordUser, [DiscordUser(id=1, default_world="Bona"), DiscordUser(id=2)])
+            await async_database.run_async("thread", lambda: threads.append(threading.current_thread().name))
+            users = await async_database.get_data_async(DiscordUser, Query().id == 1)
+            deleted_ids = await async_database.delete_data_async(DiscordUser, Query().id == 2)
+        finally:
+            async_database.shutdown()
+
+        # Assert
+        assert users == [DiscordUser(id=1, default_world="Bona")]
+        assert deleted_ids == [2]
+        assert threads[0].startswith("database")
+        assert async_database.get_operation_count("get_data") == 1
+        assert async_database.get_max_latency("get_data") >= async_database.get_average_latency("get_data") > 0
+        assert async_database.get_average_latency("insert_data") == 0
+
+    async def test_get_data_runs_concurrently(self):
+        """Test if reads run concurrently, while a write is in progress."""
+        # Arrange
+        async_database = AsyncDatabase(max_workers=4, force_new=True)
+        database.get_table(DiscordUser).insert_data(DiscordUser(id=1))
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            barrier.wait()
+            return database.get_table(DiscordUser).get_data(Query().id == 1)
+
+        # Act
+        try:
+            with database._lock_object:
+                results = await asyncio.gather(*[async_database.run_async("get_data", read) for _ in range(3)])
+        finally:
+            async_database.shutdown()
+
+        # Assert
+        assert all(result == [DiscordUser(id=1)] for result in results)
@@ -0,0 +1,54 @@
+from utils.autocomplete_sessions import AutocompleteSessions
+import time
+
+
+class TestAutocompleteSessions:
+    """Test class for the AutocompleteSessions class."""
+
+    def test_get_candidates_extended_query(self):
+        """Test if the candidates of the previous query are returned if the new query extends it."""
+        # Arrange
+        sessions = AutocompleteSessions()
+        source = object()
+        sessions.update(1, source, "dra", ["dragon", "dragon scale"])
+
+        # Act
+        candidates = sessions.get_candidates(1, source, "drago")
+
+        # Assert
+        assert candidates == ["dragon", "dragon scale"]
+        assert sessions.narrowed_count == 1
+
+    def test_get_candidates_other_query_user_or_source(self):
+        """Test if no candidates are returned for an unrelated query, another user or changed data."""
+        # Arrange
+        sessions = AutocompleteSessions()
+        source = object()
+        sessions.update(1, source, "dra", ["dragon"])
+
+        # Act
+        other_query = sessions.get_candidates(1, source, "dog")
+        other_user = sessions.get_candidates(2, source, "drag")
+        other_source = sessions.get_candidates(1, object(), "drag")
+        no_session = sessions.get_candidates(None, source, "drag")
+
+        # Assert
+        assert other_query is None
+        assert other_user is None
+        assert other_source is None
+        assert no_session is None
+        assert sessions.narrowed_count == 0
+
+    def test_get_candidates_idle_session_expires(self):
+        """Test if a session expires after being idle."""
+        # Arrange
+        sessions = AutocompleteSessions(idle_seconds=0.05)
+        source = object()
+        sessions.update(1, source, "dra", ["dragon"])
+        time.sleep(0.1)
+
+        # Act
+        candidates = sessions.get_candidates(1, source, "drag")
+
+        # Assert
+        assert candidates is None
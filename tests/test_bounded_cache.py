@@ -0,0 +1,115 @@
+from utils.bounded_cache import BoundedCache, estimate_size
+import time
+
+
+class TestBoundedCache:
+    """Test class for the BoundedCache class."""
+
+    def test_get_counts_hits_and_misses(self):
+        """Test if get counts hits and misses."""
+        # Arrange
+        cache = BoundedCache()
+        cache.set("a", 1)
+
+        # Act
+        value_a = cache.get("a")
+        value_b = cache.get("b")
+
+        # Assert
+        assert value_a == 1
+        assert value_b is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_set_over_max_entries_evicts_least_recently_used(self):
+        """Test if the least recently used entry is evicted once the entry limit is exceeded."""
+        # Arrange
+        cache = BoundedCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+
+    def test_update_size_over_max_bytes_evicts(self):
+        """Test if entries are evicted once the byte budget is exceeded."""
+        # Arrange
+        cache = BoundedCache(max_bytes=10, size_of=len)
+        cache.set("a", [0] * 5)
+        cache.set("b", [])
+
+        # Act
+        cache["b"].extend([0] * 6)
+        cache.update_size("b")
+
+        # Assert
+        assert "a" not in cache
+        assert cache.total_bytes == 6
+        assert cache.evictions == 1
+
+    def test_get_after_time_to_live_evicts(self):
+        """Test if entries are evicted if they were not accessed within their time to live."""
+        # Arrange
+        cache = BoundedCache(time_to_live_seconds=0.1)
+        cache.set("a", 1)
+
+        # Act
+        value_a = cache.get("a")
+        time.sleep(0.1)
+        value_b = cache.get("a")
+
+        # Assert
+        assert value_a == 1
+        assert value_b is None
+        assert len(cache) == 0
+        assert cache.evictions == 1
+
+    def test_get_or_create_creates_once(self):
+        """Test if get_or_create only calls the factory if the entry does not exist."""
+        # Arrange
+        cache = BoundedCache()
+        created = []
+
+        def factory():
+            created.append(1)
+            return len(created)
+
+        # Act
+        value_a = cache.get_or_create("a", factory)
+        value_b = cache.get_or_create("a", factory)
+
+        # Assert
+        assert value_a == value_b == 1
+        assert len(created) == 1
+
+    def test_evict_where_evicts_matching_entries(self):
+        """Test if evict_where only evicts the entries matching the predicate."""
+        # Arrange
+        cache = BoundedCache()
+        cache["Antica_1"] = 1
+        cache["Antica_2"] = 2
+        cache["Bona_1"] = 3
+
+        # Act
+        evicted_count = cache.evict_where(lambda key, value: key.startswith("Antica_") and value > 1)
+
+        # Assert
+        assert evicted_count == 1
+        assert cache.keys() == ["Antica_1", "Bona_1"]
+        assert cache.evictions == 1
+
+    def test_estimate_size_includes_contents(self):
+        """Test if estimate_size includes the size of contained objects."""
+        # Act
+        empty_size = estimate_size([])
+        filled_size = estimate_size(["a" * 1000])
+
+        # Assert
+        assert filled_size > empty_size + 1000
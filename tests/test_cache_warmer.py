@@ -0,0 +1,67 @@
+# pylint: disable=E1123,W0201
+from datetime import datetime
+from pytest_httpx import HTTPXMock
+from utils import database
+from utils.market_api import MarketApi
+from utils.cache_warmer import CacheWarmer
+from utils.data.user import DiscordUser
+from utils.data.discord_server import DiscordServer
+from utils.data.item_meta_data import ItemMetaData
+from utils.data.market_values import MarketValues
+from utils.data.world_data import WorldData
+from utils.json_helper import object_to_json
+import os
+import pytest
+
+
+class TestCacheWarmer:
+    """Test class for the CacheWarmer class."""
+
+    @pytest.fixture(autouse=True, scope="function")
+    def setup_method(self, httpx_mock: HTTPXMock):
+        """Setup a database with default worlds and the MarketApi object for testing."""
+        database.setup_database("test_cache_warmer")
+        database.get_table(DiscordUser).insert_data([DiscordUser(id=1, default_world="Bona"), DiscordUser(id=2, default_world="bona"), DiscordUser(id=3),
+                                                     DiscordUser(id=4, default_world="Unknown")])
+        database.get_table(DiscordServer).insert_data([DiscordServer(id=1, default_world="Secura"), DiscordServer(id=2, default_world="Secura")])
+
+        worlds = [WorldData(name=name, last_update=datetime.now()) for name in ["Antica", "Bona", "Secura"]]
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/item_metadata", text=object_to_json([ItemMetaData(id=22118, name="tibia coin", npc_buy=[], npc_sell=[])]))
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/world_data", text=object_to_json(worlds))
+
+        for world in ["Bona", "Secura"]:
+            httpx_mock.add_response(url=f"https://api.tibiamarket.top:8001/market_values?server={world}&limit=5000", text=object_to_json([MarketValues(id=22118, time=0)]))
+
+        self.api = MarketApi(force_new=True)
+        yield
+        database.close_database()
+        os.remove(database.database_path)
+
+    async def test_get_most_used_worlds_async(self):
+        """Test if existing worlds are ranked by how many users and servers use them as their default world."""
+        # Arrange
+        warmer = CacheWarmer(self.api, world_count=2)
+
+        # Act
+        worlds = await warmer.get_most_used_worlds_async()
+
+        # Assert
+        assert worlds == ["Bona", "Secura"]
+
+    async def test_warm_up_async_prefetches_most_used_worlds(self, httpx_mock: HTTPXMock):
+        """Test if the warm-up loads the meta data and world data, and prefetches the snapshots of the most used worlds once."""
+        # Arrange
+        warmer = CacheWarmer(self.api, world_count=2)
+
+        # Act
+        first_worlds = await warmer.warm_up_async()
+        second_worlds = await warmer.warm_up_async()
+        market_values = await self.api.get_market_values("Secura", 22118)
+
+        # Assert
+        assert sorted(first_worlds) == ["Bona", "Secura"]
+        assert not second_worlds
+        assert warmer.prefetched_count == 2
+        assert market_values.id == 22118
+        assert self.api.meta_data.value is not None
+        assert len(httpx_mock.get_requests()) == 4
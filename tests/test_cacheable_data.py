@@ -1,6 +1,7 @@
 from utils.cacheable_data import CacheableData
 import time
 import asyncio
+import pytest
 
 
 class TestCacheableData:
@@ -119,6 +120,108 @@ class TestCacheableData:
         assert value_a == value_b
         assert value_a != value_c
 
+    async def test_get_async_stale_while_revalidate_serves_stale_value(self):
+        """Test if the stale value is returned while the new value is loaded in the background."""
+        # Arrange
+        cacheable_data = CacheableData(self._get_value_async, invalidate_after_seconds=0.1, stale_while_revalidate=True)
+
+        # Act
+        value_a = await cacheable_data.get_async()
+        await asyncio.sleep(0.1)
+        value_b = await cacheable_data.get_async()
+        age = cacheable_data.age
+        await asyncio.sleep(0.01)
+        value_c = await cacheable_data.get_async()
+
+        # Assert
+        assert value_a == value_b
+        assert age >= 0.1
+        assert value_a != value_c
+        assert cacheable_data.age < 0.1
+
+    async def test_get_async_stale_while_revalidate_keeps_value_on_error(self):
+        """Test if the stale value is kept if the background reload fails."""
+        # Arrange
+        values = []
+
+        async def loader():
+            if values:
+                raise ValueError("Loader failed.")
+
+            values.append(time.time())
+            return values[0]
+
+        cacheable_data = CacheableData(loader, invalidate_after_seconds=0.1, stale_while_revalidate=True)
+
+        # Act
+        value_a = await cacheable_data.get_async()
+        await asyncio.sleep(0.1)
+        await cacheable_data.get_async()
+        await asyncio.sleep(0.01)
+        value_b = await cacheable_data.get_async()
+
+        # Assert
+        assert value_a == value_b
+        assert cacheable_data.age >= 0.1
+
+    async def test_revalidate_async_reloads_with_background_loader(self):
+        """Test if revalidate_async reloads the value right away with the background loader."""
+        # Arrange
+        cacheable_data = CacheableData(lambda: "loader", background_loader=lambda: "background loader")
+        await cacheable_data.get_async()
+
+        # Act
+        await cacheable_data.revalidate_async()
+
+        # Assert
+        assert await cacheable_data.get_async() == "background loader"
+
+    async def test_revalidate_async_failure_raises_and_keeps_value(self):
+        """Test if a failed revalidation raises its error to the caller and keeps the current value."""
+        # Arrange
+        def fail():
+            raise ValueError("Reload failed")
+
+        cacheable_data = CacheableData(lambda: "loader", background_loader=fail)
+        await cacheable_data.get_async()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Reload failed"):
+            await cacheable_data.revalidate_async()
+
+        assert await cacheable_data.get_async() == "loader"
+
+    def test_restore_keeps_load_time(self):
+        """Test if a restored value is served with its original load time, and reloaded once it is expired."""
+        # Arrange
+        cacheable_data = CacheableData(lambda: "loaded", invalidate_after_seconds=60)
+
+        # Act
+        is_restored = cacheable_data.restore("restored", time.time() - 30)
+        value_a = cacheable_data.get()
+        cacheable_data.restore("restored", time.time() - 90)
+        cacheable_data.invalidate()
+        cacheable_data.restore("restored", time.time() - 90)
+        value_b = cacheable_data.get()
+
+        # Assert
+        assert is_restored
+        assert value_a == "restored"
+        assert value_b == "loaded"
+
+    def test_restore_does_not_replace_newer_value(self):
+        """Test if restoring a value loaded earlier than the current one is ignored."""
+        # Arrange
+        cacheable_data = CacheableData(lambda: "loaded")
+        cacheable_data.get()
+
+        # Act
+        is_restored = cacheable_data.restore("restored", time.time() - 30)
+
+        # Assert
+        assert not is_restored
+        assert cacheable_data.get() == "loaded"
+
     def _get_value(self):
         return time.time()
 
@@ -0,0 +1,64 @@
+from utils.chart_cache import ChartCache
+import os
+
+
+class TestChartCache:
+    """Test class for the ChartCache class."""
+
+    async def test_get_async_memory_hit(self, tmp_path):
+        """Test if a cached chart is returned from memory."""
+        # Arrange
+        cache = ChartCache(str(tmp_path))
+        key = ChartCache.create_key(b"chart")
+        await cache.set_async(key, b"png")
+
+        # Act
+        chart = await cache.get_async(key)
+
+        # Assert
+        assert chart == b"png"
+        assert cache.memory.hits == 1
+        assert cache.disk_hits == 0
+
+    async def test_get_async_disk_hit_after_restart(self, tmp_path):
+        """Test if a chart cached by a previous instance is returned from disk."""
+        # Arrange
+        key = ChartCache.create_key(b"chart")
+        await ChartCache(str(tmp_path)).set_async(key, b"png")
+        cache = ChartCache(str(tmp_path))
+
+        # Act
+        chart = await cache.get_async(key)
+        chart_again = await cache.get_async(key)
+
+        # Assert
+        assert chart == chart_again == b"png"
+        assert cache.disk_hits == 1
+        assert cache.memory.hits == 1
+
+    async def test_get_async_miss(self, tmp_path):
+        """Test if a chart which was never cached is a miss."""
+        # Arrange
+        cache = ChartCache(str(tmp_path))
+
+        # Act
+        chart = await cache.get_async(ChartCache.create_key(b"chart"))
+
+        # Assert
+        assert chart is None
+        assert cache.misses == 1
+
+    async def test_set_async_over_max_disk_bytes_evicts_oldest(self, tmp_path):
+        """Test if the least recently used charts are deleted once the disk tier is full."""
+        # Arrange
+        cache = ChartCache(str(tmp_path), max_disk_bytes=25)
+        keys = [ChartCache.create_key(str(i).encode()) for i in range(3)]
+
+        # Act
+        for i, key in enumerate(keys):
+            await cache.set_async(key, b"0123456789")
+            os.utime(os.path.join(str(tmp_path), f"{key}.png"), (i, i))
+
+        # Assert
+        assert not os.path.exists(os.path.join(str(tmp_path), f"{keys[0]}.png"))
+        assert os.path.exists(os.path.join(str(tmp_path), f"{keys[2]}.png"))
@@ -0,0 +1,46 @@
+# pylint: disable=E1123
+from utils.chart_renderer import ChartRenderer
+from utils.chart_cache import ChartCache
+from utils.data.market_values import MarketValues
+from time import time
+import asyncio
+
+
+class TestChartRenderer:
+    """Test class for the ChartRenderer class."""
+
+    async def test_render_price_history_concurrently(self, tmp_path):
+        """Test if concurrent price history plots are rendered in the worker processes."""
+        # Arrange
+        renderer = ChartRenderer(max_workers=1, chart_cache=ChartCache(str(tmp_path)), force_new=True)
+        market_values = [[MarketValues(id=1, time=time() - 60 * 60 * 24 * i, day_average_sell=100 + i + j, day_average_buy=90 + i) for i in range(30)] for j in range(3)]
+
+        # Act
+        try:
+            plots = await asyncio.gather(*[renderer.render_price_history(history) for history in market_values])
+        finally:
+            renderer.shutdown()
+
+        # Assert
+        assert all(plot.startswith(b"\x89PNG") for plot in plots)
+        assert renderer.render_count == 3
+        assert renderer.queue_depth == 0
+        assert renderer.max_render_latency >= renderer.average_render_latency > 0
+
+    async def test_render_price_history_cached(self, tmp_path):
+        """Test if an identical price history is not rendered again."""
+        # Arrange
+        renderer = ChartRenderer(max_workers=1, chart_cache=ChartCache(str(tmp_path)), force_new=True)
+        market_values = [MarketValues(id=1, time=time() - 60 * 60 * 24 * i, day_average_sell=100 + i, day_average_buy=90 + i) for i in range(30)]
+
+        # Act
+        try:
+            plot = await renderer.render_price_history(market_values)
+            cached_plot = await renderer.render_price_history(list(market_values))
+        finally:
+            renderer.shutdown()
+
+        # Assert
+        assert plot == cached_plot
+        assert renderer.render_count == 1
+        assert renderer.chart_cache.memory.hits == 1
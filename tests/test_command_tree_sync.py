@@ -0,0 +1,68 @@
+# pylint: disable=W0201
+from utils.command_tree_sync import get_command_tree_hash, sync_command_tree
+import discord
+import pytest
+
+
+class TestCommandTreeSync:
+    """Test class for the command tree sync functions."""
+
+    @pytest.fixture(autouse=True, scope="function")
+    def setup_method(self, mocker, tmp_path):
+        """Create a command tree with a command and a mocked sync."""
+        self.client = discord.Client(intents=discord.Intents.none())
+        self.tree = discord.app_commands.CommandTree(self.client)
+        self.sync = mocker.patch.object(self.tree, "sync", mocker.AsyncMock())
+        self.hash_location = str(tmp_path / "config" / "command_tree_hash.txt")
+
+        @self.tree.command(name="price", description="Get the price of an item.")
+        async def price(interaction: discord.Interaction, item: str): # pylint: disable=W0613
+            pass
+
+    async def test_sync_command_tree_skips_unchanged_tree(self):
+        """Test if the tree is only synced again after it changed."""
+        # Act
+        first_result = await sync_command_tree(self.tree, self.hash_location)
+        second_result = await sync_command_tree(self.tree, self.hash_location)
+
+        @self.tree.command(name="history", description="Get the price history of an item.")
+        async def history(interaction: discord.Interaction, item: str): # pylint: disable=W0613
+            pass
+
+        third_result = await sync_command_tree(self.tree, self.hash_location)
+
+        # Assert
+        assert [first_result, second_result, third_result] == [True, False, True]
+        assert self.sync.await_count == 2
+
+    async def test_sync_command_tree_failure_syncs_again(self):
+        """Test if a failed sync doesn't store the hash, so it is retried."""
+        # Arrange
+        self.sync.side_effect = discord.HTTPException(type("Response", (), {"status": 500, "reason": "Error"})(), "Error")
+
+        # Act
+        with pytest.raises(discord.HTTPException):
+            await sync_command_tree(self.tree, self.hash_location)
+
+        self.sync.side_effect = None
+        result = await sync_command_tree(self.tree, self.hash_location)
+
+        # Assert
+        assert result
+        assert self.sync.await_count == 2
+
+    def test_get_command_tree_hash_ignores_command_order(self):
+        """Test if the hash only depends on the commands, not on the order they were added in."""
+        # Arrange
+        trees = [discord.app_commands.CommandTree(discord.Client(intents=discord.Intents.none())) for _ in range(2)]
+
+        for tree, names in zip(trees, [["a", "b"], ["b", "a"]]):
+            for name in names:
+                tree.add_command(discord.app_commands.Command(name=name, description="Description", callback=_callback))
+
+        # Act & Assert
+        assert get_command_tree_hash(trees[0]) == get_command_tree_hash(trees[1])
+
+
+async def _callback(interaction: discord.Interaction): # pylint: disable=W0613
+    pass
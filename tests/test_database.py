@@ -1,3 +1,4 @@
+# pylint: disable=W0212,C0121
 from utils import database
 import os
 from pydantic import BaseModel
@@ -91,3 +92,176 @@ class TestDatabase:
         # Assert
         assert len(found_data) == 0
         assert insert_id == deleted_id
+
+
+class TestSetting(BaseModel):
+    """A class representing a setting keyed by an id."""
+    id: int
+    value: str = ""
+    enabled: bool = True
+
+class TestSqliteDatabase:
+    """A class to test the SQLite storage of the database module."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Setup a fresh database for each test, and clean it up afterwards."""
+        database.setup_database("test_sqlite_database")
+        yield
+        database.close_database()
+        os.remove(database.database_path)
+
+    def test_get_table_uses_sqlite(self):
+        """Test if the tables are stored in SQLite with write-ahead logging."""
+        # Act
+        table = database.get_table(TestSetting)
+        journal_mode = table.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        # Assert
+        assert isinstance(table, database.SqliteDatabaseTable)
+        assert database.database_path.endswith("test_sqlite_database.db")
+        assert journal_mode == "wal"
+
+    def test_id_is_primary_key(self):
+        """Test if documents with an id are keyed by it, and lookups by id are translated to the primary key."""
+        # Arrange
+        table = database.get_table(TestSetting)
+        query = database.tinydb.Query()
+
+        # Act
+        insert_ids = table.insert_data([TestSetting(id=1234, value="a"), TestSetting(id=5, value="b")])
+        update_ids = table.update_data(query.id == 5, TestSetting(id=5, value="c"))
+        condition = table._translate_query((query.id == 5)._hash)
+        found_data = table.get_data(query.id == 5)
+
+        # Assert
+        assert insert_ids == [1234, 5]
+        assert update_ids == [5]
+        assert condition == ("doc_id = ?", [5])
+        assert found_data == [TestSetting(id=5, value="c")]
+
+    def test_get_data_untranslatable_query(self):
+        """Test if queries which can't be translated to SQL are evaluated on the documents."""
+        # Arrange
+        table = database.get_table(TestSetting)
+        query = database.tinydb.Query()
+        table.insert_data([TestSetting(id=1, value="apple"), TestSetting(id=2, value="banana", enabled=False)])
+
+        # Act
+        found_data = table.get_data(query.value.test(lambda value: value.startswith("b")))
+        combined_data = table.get_data((query.value == "banana") & (query.enabled == False))
+
+        # Assert
+        assert [setting.id for setting in found_data] == [2]
+        assert [setting.id for setting in combined_data] == [2]
+
+    def test_count_by(self):
+        """Test if the data is counted by the values of a field."""
+        # Arrange
+        table = database.get_table(TestSetting)
+        table.insert_data([TestSetting(id=1, value="a"), TestSetting(id=2, value="b"), TestSetting(id=3, value="a")])
+
+        # Act
+        counts = table.count_by("value")
+
+        # Assert
+        assert counts == {"a": 2, "b": 1}
+
+    def test_count_by_tinydb(self):
+        """Test if the TinyDB storage counts the data by the values of a field as well."""
+        # Arrange
+        database.close_database()
+        os.remove(database.database_path)
+        database.setup_database("test_sqlite_database", storage="tinydb")
+        table = database.get_table(TestSetting)
+        table.insert_data([TestSetting(id=1, value="a"), TestSetting(id=2, value="b"), TestSetting(id=3, value="a")])
+
+        # Act
+        counts = table.count_by("value")
+
+        # Assert
+        assert isinstance(table, database.DatabaseTable) and not isinstance(table, database.SqliteDatabaseTable)
+        assert counts == {"a": 2, "b": 1}
+
+    def test_migrate_from_tinydb(self):
+        """Test if a new SQLite database is migrated from the TinyDB file of the same name."""
+        # Arrange
+        database.close_database()
+        os.remove(database.database_path)
+        tinydb_path = database.database_path.replace(".db", ".json")
+        old_database = database.tinydb.TinyDB(tinydb_path)
+        old_database.table("TestSetting").insert_multiple([{"id": 7, "value": "old"}, {"id": 8, "value": "older", "enabled": False}])
+        old_database.close()
+
+        # Act
+        try:
+            database.setup_database("test_sqlite_database")
+            found_data = database.get_table(TestSetting).get_data(database.tinydb.Query().id == 8)
+        finally:
+            os.remove(tinydb_path)
+
+        # Assert
+        assert found_data == [TestSetting(id=8, value="older", enabled=False)]
+
+    def test_migrate_from_tinydb_failed_is_retried(self):
+        """Test if a failed migration leaves no database behind, so it is migrated on the next start."""
+        # Arrange
+        database.close_database()
+        os.remove(database.database_path)
+        tinydb_path = database.database_path.replace(".db", ".json")
+
+        with open(tinydb_path, mode="w", encoding="utf-8") as f:
+            f.write('{"TestSetting": {"1": {"id": 7, "val')
+
+        # Act
+        try:
+            with pytest.raises(ValueError):
+                database.setup_database("test_sqlite_database")
+
+            is_database_created = os.path.exists(database.database_path)
+
+            with open(tinydb_path, mode="w", encoding="utf-8") as f:
+                f.write('{"TestSetting": {"1": {"id": 7, "value": "old"}}}')
+
+            database.setup_database("test_sqlite_database")
+            found_data = database.get_table(TestSetting).get_data(database.tinydb.Query().id == 7)
+        finally:
+            os.remove(tinydb_path)
+
+        # Assert
+        assert not is_database_created
+        assert found_data == [TestSetting(id=7, value="old")]
+
+    def test_insert_data_existing_id_replaces_document(self):
+        """Test if inserting a document with an existing id replaces the document instead of failing."""
+        # Arrange
+        table = database.get_table(TestSetting)
+        table.insert_data(TestSetting(id=1, value="a"))
+
+        # Act
+        insert_ids = table.insert_data(TestSetting(id=1, value="b"))
+        found_data = table.get_data(database.tinydb.Query().id == 1)
+
+        # Assert
+        assert insert_ids == [1]
+        assert found_data == [TestSetting(id=1, value="b")]
+
+    def test_setup_database_again_reads_new_database(self):
+        """Test if reads use the new database after it is set up again, instead of the read connections of the previous one."""
+        # Arrange
+        database.get_table(TestSetting).insert_data(TestSetting(id=1, value="a"))
+        database.get_table(TestSetting).get_data(database.tinydb.Query().id == 1)
+
+        # Act
+        try:
+            database.setup_database("test_other_sqlite_database")
+            found_data = database.get_table(TestSetting).get_data(database.tinydb.Query().id == 1)
+            counts = database.get_table(TestSetting).count_by("value")
+        finally:
+            database.close_database()
+            os.remove(database.database_path)
+            database.setup_database("test_sqlite_database")
+
+        # Assert
+        assert not found_data
+        assert not counts
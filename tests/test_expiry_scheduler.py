@@ -0,0 +1,112 @@
+# pylint: disable=E1123
+from utils.expiry_scheduler import ExpiryScheduler
+import asyncio
+import time
+import pytest
+
+
+class ExpiringEntry:
+    """An entry which counts how often it was expired."""
+
+    def __init__(self, expiries: int = 1):
+        self.expiries = expiries
+        self.expired_count = 0
+
+    def on_expiry_due(self) -> float:
+        """Expires the entry, and requests to be checked again until all expiries are done."""
+        self.expired_count += 1
+
+        return 0.05 if self.expired_count < self.expiries else 0
+
+
+class TestExpiryScheduler:
+    """Test class for the ExpiryScheduler class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Stop the scheduler created by each test, so its coroutine doesn't outlive the test."""
+        yield
+        ExpiryScheduler().stop()
+
+    async def test_schedule_runs_due_callbacks(self):
+        """Test if all scheduled callbacks are run once they are due."""
+        # Arrange
+        scheduler = ExpiryScheduler(batch_size=10, force_new=True)
+        entries = [ExpiringEntry() for _ in range(100)]
+
+        # Act
+        for i, entry in enumerate(entries):
+            scheduler.schedule(entry.on_expiry_due, time.time() + 0.05 + (i % 5) * 0.01)
+
+        pending_count = scheduler.pending_count
+        await asyncio.sleep(0.3)
+
+        # Assert
+        assert pending_count == 100
+        assert scheduler.pending_count == 0
+        assert all(entry.expired_count == 1 for entry in entries)
+
+    async def test_schedule_earlier_expiry_wakes_scheduler(self):
+        """Test if an entry expiring earlier than all others is not delayed by them."""
+        # Arrange
+        scheduler = ExpiryScheduler(force_new=True)
+        late_entry = ExpiringEntry()
+        early_entry = ExpiringEntry()
+        scheduler.schedule(late_entry.on_expiry_due, time.time() + 10)
+        await asyncio.sleep(0.05)
+
+        # Act
+        scheduler.schedule(early_entry.on_expiry_due, time.time() + 0.05)
+        await asyncio.sleep(0.2)
+
+        # Assert
+        assert early_entry.expired_count == 1
+        assert late_entry.expired_count == 0
+        assert scheduler.pending_count == 1
+
+    async def test_schedule_reschedules_unexpired_entries(self):
+        """Test if entries are checked again if they did not expire yet."""
+        # Arrange
+        scheduler = ExpiryScheduler(force_new=True)
+        entry = ExpiringEntry(expiries=3)
+
+        # Act
+        scheduler.schedule(entry.on_expiry_due, time.time())
+        await asyncio.sleep(0.3)
+
+        # Assert
+        assert entry.expired_count == 3
+        assert scheduler.pending_count == 0
+
+    async def test_schedule_skips_garbage_collected_entries(self):
+        """Test if the scheduler does not keep entries alive."""
+        # Arrange
+        scheduler = ExpiryScheduler(force_new=True)
+        scheduler.schedule(ExpiringEntry().on_expiry_due, time.time() + 0.05)
+
+        # Act
+        await asyncio.sleep(0.2)
+
+        # Assert
+        assert scheduler.pending_count == 0
+        assert scheduler.expired_count == 0
+
+    async def test_stop_cancels_and_schedule_restarts(self):
+        """Test if stop cancels the scheduler's coroutine, and scheduling another entry starts it again."""
+        # Arrange
+        scheduler = ExpiryScheduler(force_new=True)
+        late_entry = ExpiringEntry()
+        early_entry = ExpiringEntry()
+        scheduler.schedule(late_entry.on_expiry_due, time.time() + 10)
+        await asyncio.sleep(0.05)
+
+        # Act
+        scheduler.stop()
+        is_running_after_stop = scheduler._is_running  # pylint: disable=W0212
+        scheduler.schedule(early_entry.on_expiry_due, time.time() + 0.05)
+        await asyncio.sleep(0.2)
+
+        # Assert
+        assert not is_running_after_stop
+        assert early_entry.expired_count == 1
+        assert scheduler.pending_count == 1
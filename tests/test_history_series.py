@@ -0,0 +1,106 @@
+from utils.data.history_series import HistorySeries, largest_triangle_three_buckets
+from utils.data.market_values import MarketValues
+import numpy as np
+
+
+class TestHistorySeries:
+    """Test class for the HistorySeries class."""
+
+    def test_prices_fall_back_to_offers(self):
+        """Test if the prices fall back to the offers if there is no day average, and invalid prices are NaN."""
+        # Arrange
+        market_values = [
+            MarketValues(id=1, time=0, day_average_sell=100, sell_offer=90, day_average_buy=80, buy_offer=70),
+            MarketValues(id=1, time=1, day_average_sell=-1, sell_offer=90, day_average_buy=-1, buy_offer=-1),
+            MarketValues(id=1, time=2, day_average_sell=0, sell_offer=90),
+        ]
+
+        # Act
+        series = HistorySeries(market_values)
+
+        # Assert
+        assert list(series.sell[:2]) == [100, 90]
+        assert np.isnan(series.sell[2])
+        assert series.buy[0] == 80
+        assert np.isnan(series.buy[1])
+        assert len(series) == 3
+        assert series[1] is market_values[1]
+
+    def test_get_plot_series_downsamples_long_history(self):
+        """Test if long histories are downsampled to the maximum amount of points, keeping the extremes."""
+        # Arrange
+        market_values = [MarketValues(id=1, time=i * 24 * 3600, day_average_sell=100 + i % 7, day_average_buy=50) for i in range(10000)]
+        market_values[5000].day_average_sell = 10000
+        series = HistorySeries(market_values)
+
+        # Act
+        time, sell, buy = series.get_plot_series(640)
+
+        # Assert
+        assert len(time) <= 640
+        assert len(time) == len(sell) == len(buy)
+        assert time[0] == 0 and time[-1] == 9999
+        assert 10000 in sell
+
+    def test_get_plot_series_short_history_unchanged(self):
+        """Test if short histories are plotted completely."""
+        # Arrange
+        market_values = [MarketValues(id=1, time=i * 24 * 3600, day_average_sell=100 + i) for i in range(30)]
+
+        # Act
+        time, sell, _ = HistorySeries(market_values).get_plot_series(640)
+
+        # Assert
+        assert len(time) == 30
+        assert list(sell) == [100 + i for i in range(30)]
+
+    def test_largest_triangle_three_buckets_keeps_peak(self):
+        """Test if the downsampling keeps a single outlier."""
+        # Arrange
+        x = np.arange(1000, dtype=np.float64)
+        y = np.zeros(1000)
+        y[500] = 1
+
+        # Act
+        indices = largest_triangle_three_buckets(x, y, 10)
+
+        # Assert
+        assert len(indices) == 10
+        assert 500 in indices
+        assert indices[0] == 0 and indices[-1] == 999
+
+    def test_get_statistics(self):
+        """Test if the statistics of both price series are computed from the valid prices."""
+        # Arrange
+        market_values = [
+            MarketValues(id=1, time=10, day_average_sell=100, day_sold=2, buy_offer=50, day_bought=1),
+            MarketValues(id=1, time=20, day_average_sell=300, day_sold=3, day_average_buy=-1),
+            MarketValues(id=1, time=30, day_average_sell=-1, sell_offer=201, day_bought=4),
+        ]
+        series = HistorySeries(market_values)
+
+        # Act
+        statistics = series.get_statistics()
+
+        # Assert
+        assert statistics.last_time == 30
+        assert (statistics.sell.max, statistics.sell.max_time) == (300, 20)
+        assert (statistics.sell.min, statistics.sell.min_time) == (100, 10)
+        assert statistics.sell.mean == 200
+        assert statistics.sell.median == 201
+        assert statistics.sell.volume == 5
+        assert statistics.buy.count == 1
+        assert statistics.buy.volume == 1
+        assert series.get_statistics() is statistics
+
+    def test_get_statistics_without_prices(self):
+        """Test if a price series without valid prices has no statistics."""
+        # Arrange
+        series = HistorySeries([MarketValues(id=1, time=10)])
+
+        # Act
+        statistics = series.get_statistics()
+
+        # Assert
+        assert statistics.sell is None
+        assert statistics.buy is None
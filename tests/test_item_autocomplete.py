@@ -1,5 +1,6 @@
 # pylint: disable=E1123
 from datetime import datetime
+from types import SimpleNamespace
 from pytest_httpx import HTTPXMock
 from modules.autocomplete import item
 from utils.market_api import MarketApi
@@ -45,6 +46,32 @@ class TestItemAutocomplete:
         assert len(choices) == 1
         assert choices[0].name == "NPC's magic thing's strength item thingy"
 
+    async def test_item_autocomplete_misspelled_name(self):
+        """Test if a misspelled name returns the closest names."""
+        # Arrange
+        name = "magc swrd"
+
+        # Act
+        choices = await item.item_autocomplete(None, name)
+
+        # Assert
+        assert choices[0].name == "Magic Sword"
+
+    async def test_item_autocomplete_session_narrows_previous_matches(self):
+        """Test if a query extending the user's previous query only filters its matches."""
+        # Arrange
+        interaction = SimpleNamespace(user=SimpleNamespace(id=1))
+        narrowed_count = item.sessions.narrowed_count
+
+        # Act
+        await item.item_autocomplete(interaction, "s")
+        await item.item_autocomplete(interaction, "sw")
+        choices = await item.item_autocomplete(interaction, "swo")
+
+        # Assert
+        assert [choice.name for choice in choices] == ["Sword", "Fire Sword", "Magic Sword"]
+        assert item.sessions.narrowed_count == narrowed_count + 2
+
     async def test_item_autocomplete_no_results(self):
         """Test the get_meta_data method with valid identifiers."""
         # Arrange
@@ -0,0 +1,48 @@
+from utils.item_index import ItemIndex
+from utils.market_api import MarketApi
+from utils.data.item_meta_data import ItemMetaData
+import pytest
+
+
+class TestItemIndex:
+    """Test class for the ItemIndex class."""
+
+    items_meta_data = [
+        ItemMetaData(id=22118, name="tibia coin", wiki_name="Tibia Coin", npc_buy=[], npc_sell=[]),
+        ItemMetaData(id=3031, name="gold coin", npc_buy=[], npc_sell=[]),
+    ]
+
+    @pytest.mark.parametrize("identifier", ["22118", 22118, " TIBIA coin ", "tibia coin (22118)"])
+    def test_get_id_identifiers(self, identifier):
+        """Test if every identifier of an item resolves to its id."""
+        # Arrange
+        index = ItemIndex(self.items_meta_data, MarketApi().normalize_identifier)
+
+        # Act
+        item_id = index.get_id(identifier)
+
+        # Assert
+        assert item_id == 22118
+
+    def test_get_id_unknown_identifier(self):
+        """Test if an unknown identifier resolves to None."""
+        # Arrange
+        index = ItemIndex(self.items_meta_data, MarketApi().normalize_identifier)
+
+        # Act
+        item_id = index.get_id("platinum coin")
+
+        # Assert
+        assert item_id is None
+
+    def test_identifier_to_id_is_read_only(self):
+        """Test if the identifiers of a built index can't be changed, and the names are searchable."""
+        # Arrange
+        index = ItemIndex(self.items_meta_data, MarketApi().normalize_identifier)
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            index.identifier_to_id["platinum coin"] = 3035
+
+        assert len(index) == 2
+        assert index.search_index.search("coin") == ["gold coin", "Tibia Coin"]
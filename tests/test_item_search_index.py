@@ -0,0 +1,88 @@
+from utils.item_search_index import ItemSearchIndex, bounded_edit_distance
+from utils.market_api import MarketApi
+
+
+class TestItemSearchIndex:
+    """Test class for the ItemSearchIndex class."""
+
+    names = ["Magic Sword", "Sword", "Fire Sword", "Gold Coin", "NPC's magic thing's strength item thingy"]
+
+    def test_search_substring_ordered_by_length(self):
+        """Test if names containing the query are returned, shortest first."""
+        # Arrange
+        index = ItemSearchIndex(self.names, MarketApi().normalize_identifier)
+
+        # Act
+        matches = index.search("SWORD")
+
+        # Assert
+        assert matches == ["Sword", "Fire Sword", "Magic Sword"]
+
+    def test_search_normalizes_query(self):
+        """Test if the query is normalized like the names."""
+        # Arrange
+        index = ItemSearchIndex(self.names, MarketApi().normalize_identifier)
+
+        # Act
+        matches = index.search("npcs  magic things")
+
+        # Assert
+        assert matches == ["NPC's magic thing's strength item thingy"]
+
+    def test_search_short_and_missing_queries(self):
+        """Test if queries shorter than the n-grams and queries without matches work."""
+        # Arrange
+        index = ItemSearchIndex(self.names, MarketApi().normalize_identifier)
+
+        # Act
+        short_matches = index.search("co")
+        missing_matches = index.search("sworx")
+
+        # Assert
+        assert short_matches == ["Gold Coin"]
+        assert not missing_matches
+
+    def test_search_limit(self):
+        """Test if at most limit names are returned, and an empty query returns the shortest names."""
+        # Arrange
+        index = ItemSearchIndex([f"Item {i:04}" for i in range(1000)] + ["Item"], MarketApi().normalize_identifier)
+
+        # Act
+        matches = index.search("", 25)
+        item_matches = index.search("item 0", 10)
+
+        # Assert
+        assert len(matches) == 25
+        assert matches[0] == "Item"
+        assert item_matches == [f"Item {i:04}" for i in range(10)]
+
+    def test_fuzzy_search_tolerates_typos(self):
+        """Test if names are found despite typos, closest first, and exact matches can be excluded."""
+        # Arrange
+        index = ItemSearchIndex(self.names, MarketApi().normalize_identifier)
+
+        # Act
+        matches = index.fuzzy_search("fier swrod")
+        partial_matches = index.fuzzy_search("magc sw")
+        excluded_matches = index.fuzzy_search("sword", exclude=["Sword"])
+        short_matches = index.fuzzy_search("sw")
+
+        # Assert
+        assert matches[0] == "Fire Sword"
+        assert partial_matches == ["Magic Sword"]
+        assert "Sword" not in excluded_matches
+        assert not short_matches
+
+    def test_bounded_edit_distance(self):
+        """Test if the distances to the whole text and its closest prefix are computed, and capped at the bound."""
+        # Act
+        distances = bounded_edit_distance("kitten", "sitting", 3)
+        prefix_distances = bounded_edit_distance("magc", "magic sword", 2)
+        swapped_distances = bounded_edit_distance("fier", "fire", 1)
+        exceeded_distances = bounded_edit_distance("abcdef", "uvwxyz", 2)
+
+        # Assert
+        assert distances == (2, 3)
+        assert prefix_distances == (1, 3)
+        assert swapped_distances == (1, 1)
+        assert exceeded_distances == (3, 3)
@@ -0,0 +1,52 @@
+from utils.loop_lag_monitor import LoopLagMonitor
+import asyncio
+import time
+
+
+class TestLoopLagMonitor:
+    """Test class for the LoopLagMonitor class."""
+
+    async def test_blocking_call_is_measured(self):
+        """Test if blocking the event loop shows up as lag."""
+        # Arrange
+        monitor = LoopLagMonitor(interval_seconds=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        # Act
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        monitor.stop()
+
+        # Assert
+        assert monitor.max_lag >= 0.15
+        assert monitor.sample_count > 1
+
+    async def test_reset_clears_measurements(self):
+        """Test if reset clears all measurements."""
+        # Arrange
+        monitor = LoopLagMonitor(interval_seconds=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        # Act
+        monitor.reset()
+        monitor.stop()
+
+        # Assert
+        assert monitor.max_lag == 0
+        assert monitor.average_lag == 0
+
+    def test_format_report_contains_measurements(self):
+        """Test if the report contains the average and max lag."""
+        # Arrange
+        monitor = LoopLagMonitor()
+        monitor.max_lag = 0.25
+        monitor.sample_count = 2
+        monitor._total_lag = 0.3  # pylint: disable=W0212
+
+        # Act
+        report = monitor.format_report()
+
+        # Assert
+        assert report == "Event loop lag: average 0.150s, max 0.250s over 2 samples"
@@ -1,5 +1,7 @@
-# pylint: disable=E1123
+# pylint: disable=E1123,W0212,R0904
 from utils.market_api import MarketApi
+from utils.rate_limiter import RequestPriority
+from utils.market_cache_store import MarketCacheStore
 from utils.data.item_meta_data import ItemMetaData
 from utils.data.market_values import MarketValues
 from utils.data.world_data import WorldData
@@ -45,6 +47,12 @@ class TestMarketApi:
         with pytest.raises(ValueError):
             await self.api.get_meta_data("invalid identifier")
 
+    async def test_get_meta_data_misspelled_identifier_suggests_item(self):
+        """Test if a misspelled identifier suggests the closest item name."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Did you mean Tibia Coin \\(Something\\)\\?"):
+            await self.api.get_meta_data("tibai coin")
+
     async def test_get_market_values_valid_identifier(self):
         """Test the get_market_values method with valid identifiers."""
         # Act
@@ -144,6 +152,136 @@ class TestMarketApi:
         assert end_time - start_time >= 1 and end_time - start_time < 2
         assert len(httpx_mock.get_requests(url="https://api.tibiamarket.top:8001/market_values?server=Antica&limit=5000")) == 3
 
+    async def test_send_request_coalesces_identical_requests(self, httpx_mock: HTTPXMock):
+        """Test if concurrent identical requests are sent only once."""
+        # Act
+        responses = await asyncio.gather(*[self.api._send_request("world_data") for _ in range(5)])
+
+        # Assert
+        assert all(response == responses[0] for response in responses)
+        assert len(httpx_mock.get_requests(url="https://api.tibiamarket.top:8001/world_data")) == 1
+        assert self.api.request_coalescer.coalesced_count == 4
+        assert self.api.request_coalescer.in_flight_count == 0
+
+    async def test_send_request_does_not_coalesce_different_parameters(self, httpx_mock: HTTPXMock):
+        """Test if concurrent requests with different parameters are sent separately."""
+        # Act
+        await asyncio.gather(self.api._send_request("item_history", server="Antica", item_id=22118, start_days_ago=7),
+                             self.api._send_request("market_board", server="Antica", item_id=22118))
+
+        # Assert
+        assert len(httpx_mock.get_requests()) == 2
+        assert self.api.request_coalescer.coalesced_count == 0
+
+    async def test_send_request_joining_raises_priority(self, httpx_mock: HTTPXMock):
+        """Test if an interactive caller joining a waiting background request moves it to the interactive lane."""
+        # Arrange
+        self.api.rate_limiter._tokens = 0
+        background_request = asyncio.create_task(self.api._send_request("world_data", RequestPriority.BACKGROUND))
+        await asyncio.sleep(0)
+
+        # Act
+        interactive_request = asyncio.create_task(self.api._send_request("world_data"))
+        await asyncio.sleep(0)
+        interactive_queue_depth = self.api.rate_limiter.get_queue_depth(RequestPriority.INTERACTIVE)
+        background_queue_depth = self.api.rate_limiter.get_queue_depth(RequestPriority.BACKGROUND)
+        responses = await asyncio.gather(background_request, interactive_request)
+
+        # Assert
+        assert interactive_queue_depth == 1 and background_queue_depth == 0
+        assert responses[0] == responses[1]
+        assert len(httpx_mock.get_requests(url="https://api.tibiamarket.top:8001/world_data")) == 1
+        assert not self.api._request_tickets
+
+    async def test_refresh_world_async_failed_reload_raises(self, httpx_mock: HTTPXMock):
+        """Test if a failed reload of a world's market snapshot is raised to the caller."""
+        # Arrange
+        await self.api.get_market_values("Antica", 22118)
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/market_values?server=Antica&limit=5000", status_code=500, text="Error")
+
+        # Act & Assert
+        with pytest.raises(Exception):
+            await self.api.refresh_world_async("Antica", time.time() + 1)
+
+    async def test_get_market_values_stream_responses(self):
+        """Test the get_market_values method when responses are parsed while they are received."""
+        # Arrange
+        self.api = MarketApi("asdf", stream_responses=True, force_new=True)
+
+        # Act
+        market_values = await self.api.get_market_values("Antica", 22118)
+        meta_data = await self.api.get_meta_data("tibia coin")
+
+        # Assert
+        assert market_values.id == 22118
+        assert meta_data.id == 22118
+
+    async def test_get_data_trusted_payloads(self):
+        """Test the get methods when responses are trusted and not fully validated."""
+        # Arrange
+        self.api = MarketApi("asdf", trusted_payloads=True, force_new=True)
+
+        # Act
+        market_values = await self.api.get_market_values("Antica", 22118)
+        history = await self.api.get_history("Antica", 22118, 7)
+        market_board = await self.api.get_market_board("Antica", 22118)
+        meta_data = await self.api.get_meta_data("tibia coin")
+
+        # Assert
+        assert market_values.id == 22118
+        assert len(history) == 3
+        assert market_board.sellers[0].name == "seller"
+        assert meta_data.id == 22118
+        assert self.api.model_builder.schema_drift_count == 0
+
+    async def test_load_caches_async_restores_saved_caches(self, httpx_mock: HTTPXMock, tmp_path):
+        """Test if caches saved by one instance are served by a new instance without sending requests."""
+        # Arrange
+        self.api.cache_store = MarketCacheStore(str(tmp_path))
+        await self.api.get_market_values("Antica", 22118)
+        meta_data_age = self.api.meta_data.age
+        await self.api.save_caches_async()
+        request_count = len(httpx_mock.get_requests())
+
+        # Act
+        self.api = MarketApi("asdf", force_new=True)
+        self.api.cache_store = MarketCacheStore(str(tmp_path))
+        restored_count = await self.api.load_caches_async()
+        market_values = await self.api.get_market_values("Antica", 22118)
+        meta_data = await self.api.get_meta_data("tibia coin")
+
+        # Assert
+        assert restored_count == 3
+        assert market_values.id == 22118
+        assert meta_data.id == 22118
+        assert self.api.meta_data.age >= meta_data_age
+        assert len(httpx_mock.get_requests()) == request_count
+
+    async def test_create_request_context_resolves_once(self, mocker):
+        """Test if a request context reads the world data and meta data once, and serves every get method."""
+        # Arrange
+        world_data_get = mocker.spy(self.api.world_data, "get_async")
+        meta_data_get = mocker.spy(self.api.meta_data, "get_async")
+
+        # Act
+        context = await self.api.create_request_context(" antica", "tibia coin")
+        market_values = await self.api.get_market_values(context=context)
+        history = await self.api.get_history(timespan=7, context=context)
+        market_board = await self.api.get_market_board(context=context)
+        meta_data = await self.api.get_meta_data(context=context)
+
+        # Assert
+        assert context.server == "Antica"
+        assert market_values.id == history[0].id == market_board.id == meta_data.id == 22118
+        assert world_data_get.call_count == 1
+        assert meta_data_get.call_count == 1
+
+    async def test_create_request_context_unknown_world_throws(self):
+        """Test if creating a request context for an unknown world throws."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="World 'Unknown' not found"):
+            await self.api.create_request_context("unknown", "tibia coin")
+
     def _mock_requests(self, httpx_mock: HTTPXMock):
         httpx_mock.reset()
 
@@ -0,0 +1,58 @@
+from utils.market_cache_store import MarketCacheStore
+from utils.data.market_snapshot import MarketSnapshot
+from utils.data.market_values import MarketValues
+import os
+
+
+class TestMarketCacheStore:
+    """Test class for the MarketCacheStore class."""
+
+    def test_save_rows_round_trip(self, tmp_path):
+        """Test if saved rows are loaded with their load time."""
+        # Arrange
+        store = MarketCacheStore(str(tmp_path))
+        rows = [{"id": 1, "name": "tibia coin"}, {"id": 2, "name": None}]
+
+        # Act
+        store.save_rows("meta_data", rows, 123.5)
+        result = store.load_rows("meta_data")
+
+        # Assert
+        assert result == (rows, 123.5)
+
+    def test_load_rows_missing_returns_none(self, tmp_path):
+        """Test if loading rows that were never saved returns None."""
+        # Arrange
+        store = MarketCacheStore(str(tmp_path))
+
+        # Act & Assert
+        assert store.load_rows("meta_data") is None
+
+    def test_load_rows_corrupt_returns_none(self, tmp_path):
+        """Test if loading rows from a corrupt file returns None instead of throwing."""
+        # Arrange
+        store = MarketCacheStore(str(tmp_path))
+
+        with open(os.path.join(tmp_path, "meta_data.json"), mode="w", encoding="utf-8") as f:
+            f.write("{\"load_time\": 1, \"ro")
+
+        # Act & Assert
+        assert store.load_rows("meta_data") is None
+
+    def test_save_snapshot_round_trip(self, tmp_path):
+        """Test if saved snapshots are loaded with their load time."""
+        # Arrange
+        store = MarketCacheStore(str(tmp_path))
+        market_values = [MarketValues(id=20, time=2, sell_offer=200, total_immediate_profit_info="Profit"), MarketValues(id=10, time=1, buy_offer=100)]
+
+        # Act
+        store.save_snapshot("Antica", MarketSnapshot.from_market_values(market_values), 123.5)
+        store.save_snapshot("Secura", MarketSnapshot.from_market_values(market_values[:1]), 456.5)
+        snapshots = store.load_snapshots()
+
+        # Assert
+        assert sorted(snapshots.keys()) == ["Antica", "Secura"]
+        assert [snapshots["Antica"][0][market_value.id] for market_value in market_values] == market_values
+        assert snapshots["Antica"][1] == 123.5
+        assert len(snapshots["Secura"][0]) == 1
+        assert not [name for name in os.listdir(os.path.join(tmp_path, "market_values")) if name.endswith(".tmp")]
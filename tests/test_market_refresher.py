@@ -0,0 +1,52 @@
+# pylint: disable=E1123,W0201
+from datetime import datetime, timedelta
+from pytest_httpx import HTTPXMock
+from utils.market_api import MarketApi
+from utils.market_refresher import MarketRefresher
+from utils.data.item_meta_data import ItemMetaData
+from utils.data.market_values import MarketValues
+from utils.data.market_board import MarketBoard
+from utils.data.world_data import WorldData
+from utils.json_helper import object_to_json
+import pytest
+
+
+class TestMarketRefresher:
+    """Test class for the MarketRefresher class."""
+
+    @pytest.fixture(autouse=True, scope="function")
+    def setup_method(self, httpx_mock: HTTPXMock):
+        """Setup the MarketApi object for testing."""
+        self.world_update = datetime.now() - timedelta(minutes=5)
+        item_metadata_response = [ItemMetaData(id=22118, name="tibia coin", npc_buy=[], npc_sell=[])]
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/item_metadata", text=object_to_json(item_metadata_response), is_optional=True)
+        for _ in range(2):
+            httpx_mock.add_response(url="https://api.tibiamarket.top:8001/world_data", text=object_to_json(self._create_worlds(self.world_update)))
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/market_values?server=Antica&limit=5000", text=object_to_json([MarketValues(id=22118, time=0)]))
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/market_board?server=Antica&item_id=22118", text=object_to_json(MarketBoard(id=22118, update_time=0, sellers=[], buyers=[])))
+        self.api = MarketApi(force_new=True)
+
+    async def test_check_async_refreshes_updated_worlds(self, httpx_mock: HTTPXMock):
+        """Test if only updated worlds are refreshed, reloading their market snapshot and evicting their stale market boards."""
+        # Arrange
+        refresher = MarketRefresher(self.api)
+        await self.api.get_market_values("Antica", 22118)
+        await self.api.get_market_board("Antica", 22118)
+        first_check = await refresher.check_async()
+
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/world_data", text=object_to_json(self._create_worlds(datetime.now(), self.world_update)))
+        httpx_mock.add_response(url="https://api.tibiamarket.top:8001/market_values?server=Antica&limit=5000", text=object_to_json([MarketValues(id=22118, time=1)]))
+
+        # Act
+        second_check = await refresher.check_async()
+        market_values = await self.api.get_market_values("Antica", 22118)
+
+        # Assert
+        assert not first_check
+        assert second_check == ["Antica"]
+        assert refresher.refresh_count == 1
+        assert market_values.time == 1
+        assert "Antica_22118" not in self.api.market_board_cache
+
+    def _create_worlds(self, antica_update: datetime, bona_update: datetime = None):
+        return [WorldData(name="Antica", last_update=antica_update), WorldData(name="Bona", last_update=bona_update if bona_update else self.world_update)]
@@ -0,0 +1,108 @@
+# pylint: disable=W0201
+from utils.data.market_snapshot import MarketSnapshot
+from utils.data.market_values import MarketValues
+import pytest
+
+
+class TestMarketSnapshot:
+    """Test class for the MarketSnapshot class."""
+
+    @pytest.fixture(autouse=True, scope="function")
+    def setup_method(self):
+        """Create a sample snapshot for testing."""
+        self.market_values = [
+            MarketValues(id=30, time=3, sell_offer=300, buy_offer=250, total_immediate_profit_info="Profit"),
+            MarketValues(id=10, time=1, sell_offer=100, buy_offer=-1),
+            MarketValues(id=20, time=2, sell_offer=200, buy_offer=150, is_full_data=True),
+        ]
+        self.snapshot = MarketSnapshot.from_market_values(self.market_values)
+
+    def test_getitem_returns_equal_market_values(self):
+        """Test if the MarketValues views equal the original market values."""
+        # Act
+        views = [self.snapshot[market_values.id] for market_values in self.market_values]
+
+        # Assert
+        assert views == self.market_values
+        assert isinstance(views[0].sell_offer, int)
+
+    def test_from_rows_equals_from_market_values(self):
+        """Test if a snapshot created from raw rows equals one created from models."""
+        # Arrange
+        rows = [market_values.model_dump(exclude_defaults=True) for market_values in self.market_values]
+
+        # Act
+        snapshot = MarketSnapshot.from_rows(rows)
+
+        # Assert
+        assert [snapshot[market_values.id] for market_values in self.market_values] == self.market_values
+
+    def test_getitem_unknown_item_throws(self):
+        """Test if accessing an unknown item raises a KeyError, like a dictionary."""
+        # Act & Assert
+        with pytest.raises(KeyError):
+            _ = self.snapshot[15]
+
+        assert 15 not in self.snapshot
+        assert self.snapshot.get(15) is None
+
+    def test_filter_returns_matching_items(self):
+        """Test if filter only keeps the items matching the mask."""
+        # Act
+        filtered = self.snapshot.filter(self.snapshot.column("buy_offer") > 0)
+
+        # Assert
+        assert list(filtered) == [20, 30]
+        assert filtered[20].is_full_data
+
+    def test_sort_by_returns_sorted_ids(self):
+        """Test if sort_by orders the item ids by a field."""
+        # Act
+        ascending = self.snapshot.sort_by("buy_offer")
+        descending = self.snapshot.sort_by("buy_offer", descending=True)
+
+        # Assert
+        assert list(ascending) == [10, 20, 30]
+        assert list(descending) == [30, 20, 10]
+
+    def test_top_k_returns_highest_values(self):
+        """Test if top_k returns the items with the highest values in order."""
+        # Act
+        top_items = self.snapshot.top_k("sell_offer", 2)
+        bottom_items = self.snapshot.top_k("sell_offer", 5, descending=False)
+
+        # Assert
+        assert [item.id for item in top_items] == [30, 20]
+        assert [item.id for item in bottom_items] == [10, 20, 30]
+
+    def test_top_k_ranks_bool_column(self):
+        """Test if top_k can rank by a bool column, which can't be negated."""
+        # Act
+        top_items = self.snapshot.top_k("is_full_data", 1)
+        bottom_items = self.snapshot.top_k("is_full_data", 1, descending=False)
+
+        # Assert
+        assert [item.id for item in top_items] == [20]
+        assert bottom_items[0].id != 20
+
+    def test_nbytes_is_smaller_than_models(self):
+        """Test if the snapshot needs less memory than the models it was created from."""
+        # Arrange
+        market_values = [MarketValues(id=i, time=i) for i in range(1000)]
+
+        # Act
+        snapshot = MarketSnapshot.from_market_values(market_values)
+
+        # Assert
+        assert len(snapshot) == 1000
+        assert snapshot.nbytes < 1000 * len(MarketValues.model_fields) * 16
+
+    def test_from_arrays_equals_original(self):
+        """Test if a snapshot created from the arrays of another one contains the same market values."""
+        # Act
+        arrays = self.snapshot.to_arrays()
+        snapshot = MarketSnapshot.from_arrays(arrays)
+
+        # Assert
+        assert all(array.dtype != object for array in arrays.values())
+        assert [snapshot[market_values.id] for market_values in self.market_values] == self.market_values
@@ -2,6 +2,9 @@ from utils.data.market_values import MarketValues
 from time import time
 from io import BytesIO
 from typing import List
+import os
+import subprocess
+import sys
 
 
 def get_sample_market_values(sample_size: int) -> List[MarketValues]:
@@ -40,3 +43,14 @@ def test_generate_price_history_plot():
         file.write(bytesio.getbuffer())
 
     assert bytesio is not None
+
+def test_import_does_not_import_matplotlib():
+    """Test that matplotlib is only imported once the first plot is rendered, it is slow to import."""
+    # Arrange
+    code = "import sys; import utils.data.market_values; print('matplotlib' in sys.modules)"
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": "src"})
+
+    # Assert
+    assert result.stdout.strip() == "False"
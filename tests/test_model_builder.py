@@ -0,0 +1,64 @@
+# pylint: disable=E1136
+from utils.model_builder import ModelBuilder, construct_model
+from utils.data.item_meta_data import ItemMetaData, NPCSaleData
+from utils.data.market_values import MarketValues
+from pydantic import ValidationError
+import pytest
+
+
+def get_sample_rows(sample_size: int):
+    """Returns a list of sample item meta data rows, like the API returns them.
+
+    Args:
+        sample_size (int): The number of rows to return.
+
+    Returns:
+        List[Dict]: The sample rows.
+    """
+    npc_sale = {"name": "NPC", "location": "Town", "price": 100, "currency_object_type_id": 0, "currency_quest_flag_display_name": ""}
+
+    return [{"id": i, "name": f"item {i}", "wiki_name": None, "npc_buy": [npc_sale], "npc_sell": []} for i in range(sample_size)]
+
+
+class TestModelBuilder:
+    """Test class for the ModelBuilder class."""
+
+    def test_construct_model_creates_nested_models(self):
+        """Test if construct_model also creates nested models."""
+        # Arrange
+        row = get_sample_rows(1)[0]
+
+        # Act
+        meta_data = construct_model(ItemMetaData, row)
+
+        # Assert
+        assert isinstance(meta_data.npc_buy[0], NPCSaleData)
+        assert meta_data.npc_buy[0].is_gold()
+        assert meta_data.tier == -1
+        assert meta_data == ItemMetaData(**row)
+
+    @pytest.mark.parametrize("trusted", [True, False])
+    def test_build_list_equals_validated_models(self, trusted: bool):
+        """Test if the built models are equal to validated models in both modes."""
+        # Arrange
+        rows = get_sample_rows(50)
+        builder = ModelBuilder(trusted)
+
+        # Act
+        models = builder.build_list(ItemMetaData, rows)
+
+        # Assert
+        assert models == [ItemMetaData(**row) for row in rows]
+        assert builder.schema_drift_count == 0
+
+    def test_build_list_trusted_schema_drift_validates_all(self):
+        """Test if a trusted payload is fully validated if its sample does not match the schema."""
+        # Arrange
+        rows = [{"id": i, "time": "not a time"} for i in range(10)]
+        builder = ModelBuilder(trusted=True)
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            builder.build_list(MarketValues, rows)
+
+        assert builder.schema_drift_count == 1
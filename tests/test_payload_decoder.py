@@ -0,0 +1,93 @@
+from utils.payload_decoder import JsonStreamParser, PayloadDecoder
+import json
+import pytest
+
+
+class TestPayloadDecoder:
+    """Test class for the PayloadDecoder and JsonStreamParser classes."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+    def test_json_stream_parser_array_in_chunks(self, chunk_size: int):
+        """Test if an array is decoded correctly regardless of where the chunks are split."""
+        # Arrange
+        document = [{"id": 1, "name": "tibia coin ä"}, {"id": 2, "values": [1, 2.5, None]}, 12345, "text, with ] brackets", True]
+        content = json.dumps(document).encode()
+        parser = JsonStreamParser()
+
+        # Act
+        for i in range(0, len(content), chunk_size):
+            parser.feed(content[i:i + chunk_size])
+
+        result = parser.close()
+
+        # Assert
+        assert result == document
+
+    @pytest.mark.parametrize("chunks", [[b"[1.", b"5, 2]"], [b"[1e", b"3, 2]"], [b"[1.5e-", b"1 , 2]"], [b"[tr", b"ue, 2]"], [b"[1.5 ", b" , 2]"]])
+    def test_json_stream_parser_scalar_split_between_chunks(self, chunks: list):
+        """Test if scalars split right after a dot, exponent or inside a literal are decoded once the rest arrived."""
+        # Arrange
+        parser = JsonStreamParser()
+        document = json.loads(b"".join(chunks))
+
+        # Act
+        for chunk in chunks:
+            parser.feed(chunk)
+
+        result = parser.close()
+
+        # Assert
+        assert result == document
+
+    @pytest.mark.parametrize("content", [b"[1x, 2]", b"[1,,2]", b"[,1]", b"[1,]", b"[1 , ]"])
+    def test_json_stream_parser_invalid_item_throws(self, content: bytes):
+        """Test if invalid text or misplaced separators raise an error instead of being skipped, like json.loads does."""
+        # Arrange
+        parser = JsonStreamParser()
+        parser.feed(content)
+
+        # Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            parser.close()
+
+    def test_json_stream_parser_object(self):
+        """Test if documents which are not arrays are decoded as a whole."""
+        # Arrange
+        document = {"id": 1, "sellers": [{"name": "seller"}]}
+        content = json.dumps(document).encode()
+        parser = JsonStreamParser()
+
+        # Act
+        parser.feed(content[:5])
+        parser.feed(content[5:])
+        result = parser.close()
+
+        # Assert
+        assert result == document
+
+    def test_json_stream_parser_incomplete_array_throws(self):
+        """Test if an incomplete array raises an error."""
+        # Arrange
+        parser = JsonStreamParser()
+        parser.feed(b'[{"id": 1}, {"id"')
+
+        # Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            parser.close()
+
+    async def test_decode_stream(self):
+        """Test if decode_stream decodes all chunks of an asynchronous stream."""
+        # Arrange
+        decoder = PayloadDecoder()
+        document = [{"id": i} for i in range(100)]
+        content = json.dumps(document).encode()
+
+        async def chunks():
+            for i in range(0, len(content), 64):
+                yield content[i:i + 64]
+
+        # Act
+        result = await decoder.decode_stream(chunks())
+
+        # Assert
+        assert result == document
@@ -0,0 +1,101 @@
+from utils.rate_limiter import RateLimiter, RequestPriority, RequestTicket
+import asyncio
+import time
+
+
+class TestRateLimiter:
+    """Test class for the RateLimiter class."""
+
+    async def test_acquire_within_capacity_does_not_wait(self):
+        """Test if requests within the burst capacity are not delayed."""
+        # Arrange
+        rate_limiter = RateLimiter(capacity=5, refill_per_second=1)
+
+        # Act
+        start_time = time.time()
+        for _ in range(5):
+            await rate_limiter.acquire()
+        end_time = time.time()
+
+        # Assert
+        assert end_time - start_time < 0.1
+        assert rate_limiter.get_max_wait_time(RequestPriority.INTERACTIVE) < 0.1
+
+    async def test_acquire_paces_requests(self):
+        """Test if requests exceeding the capacity are paced by the refill rate."""
+        # Arrange
+        rate_limiter = RateLimiter(capacity=1, refill_per_second=10)
+
+        # Act
+        start_time = time.time()
+        await asyncio.gather(*[rate_limiter.acquire() for _ in range(3)])
+        end_time = time.time()
+
+        # Assert
+        assert end_time - start_time >= 0.15
+        assert rate_limiter.get_queue_depth() == 0
+
+    async def test_acquire_serves_interactive_before_background(self):
+        """Test if waiting interactive requests are served before waiting background requests."""
+        # Arrange
+        rate_limiter = RateLimiter(capacity=1, refill_per_second=20)
+        await rate_limiter.acquire()
+        order = []
+
+        async def acquire(priority: RequestPriority):
+            await rate_limiter.acquire(priority)
+            order.append(priority)
+
+        # Act
+        background_tasks = [asyncio.create_task(acquire(RequestPriority.BACKGROUND)) for _ in range(2)]
+        await asyncio.sleep(0)
+        interactive_tasks = [asyncio.create_task(acquire(RequestPriority.INTERACTIVE)) for _ in range(2)]
+        await asyncio.sleep(0)
+        queue_depth = rate_limiter.get_queue_depth(RequestPriority.BACKGROUND)
+        await asyncio.gather(*background_tasks, *interactive_tasks)
+
+        # Assert
+        assert queue_depth == 2
+        assert order == [RequestPriority.INTERACTIVE, RequestPriority.INTERACTIVE, RequestPriority.BACKGROUND, RequestPriority.BACKGROUND]
+        assert rate_limiter.get_average_wait_time(RequestPriority.BACKGROUND) > rate_limiter.get_average_wait_time(RequestPriority.INTERACTIVE)
+
+    async def test_raise_priority_moves_waiting_request(self):
+        """Test if a waiting request moved to a more urgent lane is served before the requests of its old lane."""
+        # Arrange
+        rate_limiter = RateLimiter(capacity=1, refill_per_second=20)
+        await rate_limiter.acquire()
+        order = []
+        ticket = RequestTicket(RequestPriority.PREFETCH)
+
+        async def acquire(name: str, priority: RequestPriority, request_ticket: RequestTicket = None):
+            await rate_limiter.acquire(priority, ticket=request_ticket)
+            order.append(name)
+
+        tasks = [asyncio.create_task(acquire("background", RequestPriority.BACKGROUND)), asyncio.create_task(acquire("prefetch", RequestPriority.PREFETCH, ticket))]
+        await asyncio.sleep(0)
+
+        # Act
+        rate_limiter.raise_priority(ticket, RequestPriority.INTERACTIVE)
+        rate_limiter.raise_priority(ticket, RequestPriority.BACKGROUND)
+        queue_depth = rate_limiter.get_queue_depth(RequestPriority.INTERACTIVE)
+        await asyncio.gather(*tasks)
+
+        # Assert
+        assert queue_depth == 1
+        assert ticket.priority == RequestPriority.INTERACTIVE
+        assert ticket.waiter is None
+        assert order == ["prefetch", "background"]
+
+    async def test_update_without_remaining_requests_waits_for_reset(self):
+        """Test if requests are held back until the advertised reset when no requests are remaining."""
+        # Arrange
+        rate_limiter = RateLimiter(capacity=10, refill_per_second=10)
+        rate_limiter.update(200, {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": f"{time.time() + 0.3}"})
+
+        # Act
+        start_time = time.time()
+        await rate_limiter.acquire()
+        end_time = time.time()
+
+        # Assert
+        assert end_time - start_time >= 0.25
@@ -0,0 +1,138 @@
+# pylint: disable=W0212
+from utils import database
+from utils.settings_cache import SettingsCache
+from utils.write_behind_queue import WriteBehindQueue
+from utils.async_database import AsyncDatabase
+from utils.data.user import DiscordUser
+import asyncio
+import os
+import pytest
+
+
+class TestSettingsCache:
+    """Test class for the SettingsCache class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Setup a fresh database for each test, and clean it up afterwards."""
+        database.setup_database("test_settings_cache")
+        yield
+        WriteBehindQueue().flush()
+        database.close_database()
+        os.remove(database.database_path)
+
+    def test_get_missing_settings_cached(self, mocker):
+        """Test if missing settings are returned as defaults and not looked up again."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        get_data = mocker.spy(database.get_table(DiscordUser), "get_data")
+
+        # Act
+        first_user, first_exists = cache.get(1)
+        second_user, second_exists = cache.get(1)
+
+        # Assert
+        assert first_user == second_user == DiscordUser(id=1)
+        assert not first_exists and not second_exists
+        assert get_data.call_count == 1
+
+    def test_save_updates_cache(self, mocker):
+        """Test if saved settings are returned from the cache, as copies."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        cache.get(1)
+        get_data = mocker.spy(database.get_table(DiscordUser), "get_data")
+
+        # Act
+        cache.save(DiscordUser(id=1, default_world="Bona"))
+        user, exists = cache.get(1)
+        user.default_world = "Changed"
+
+        # Assert
+        assert exists
+        assert cache.get(1)[0].default_world == "Bona"
+        assert get_data.call_count == 0
+
+    def test_get_database_setup_again_clears_cache(self):
+        """Test if the cache is cleared when the database is set up again."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        cache.save(DiscordUser(id=1, default_world="Bona"))
+        WriteBehindQueue().flush()
+        database.close_database()
+        os.remove(database.database_path)
+        database.setup_database("test_settings_cache")
+
+        # Act
+        user, exists = cache.get(1)
+
+        # Assert
+        assert not exists
+        assert user.default_world == "Antica"
+
+    def test_get_evicted_settings_pending_write(self):
+        """Test if evicted settings which weren't written yet are loaded from the pending writes."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        cache.save(DiscordUser(id=1, default_world="Bona"))
+        cache.clear()
+
+        # Act
+        user, exists = cache.get(1)
+
+        # Assert
+        assert exists
+        assert user.default_world == "Bona"
+
+    async def test_get_async(self):
+        """Test if settings are loaded without blocking the event loop, and cached like the sync ones."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        database.get_table(DiscordUser).insert_data(DiscordUser(id=1, default_world="Bona"))
+
+        # Act
+        user, exists = await cache.get_async(1)
+        cached_user = cache.get(1, copy=False)[0]
+
+        # Assert
+        assert exists
+        assert user == cached_user == DiscordUser(id=1, default_world="Bona")
+        assert user is not cached_user
+
+    async def test_get_async_save_while_reading_keeps_saved_settings(self, mocker):
+        """Test if settings saved while get_async reads the database are not overwritten by the older read."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser)
+        is_read = asyncio.Event()
+        get_data_async = AsyncDatabase().get_data_async
+
+        async def read_slowly(table_type: type, query):
+            data = await get_data_async(table_type, query)
+            await is_read.wait()
+            return data
+
+        mocker.patch.object(AsyncDatabase(), "get_data_async", read_slowly)
+
+        # Act
+        task = asyncio.create_task(cache.get_async(1))
+        await asyncio.sleep(0.05)
+        cache.save(DiscordUser(id=1, default_world="Bona"))
+        is_read.set()
+        loaded_user, _ = await task
+        user, exists = cache.get(1)
+
+        # Assert
+        assert exists
+        assert loaded_user.default_world == user.default_world == "Bona"
+
+    def test_lru_eviction(self):
+        """Test if the least recently used settings are evicted from the cache."""
+        # Arrange
+        cache: SettingsCache[DiscordUser] = SettingsCache(DiscordUser, max_entries=2)
+
+        # Act
+        for user_id in range(3):
+            cache.get(user_id)
+
+        # Assert
+        assert cache._entries.keys() == [1, 2]
@@ -0,0 +1,36 @@
+from utils.startup_timer import StartupTimer
+import time
+
+
+class TestStartupTimer:
+    """Test class for the StartupTimer class."""
+
+    def test_mark_measures_phases(self):
+        """Test if each phase is measured from the end of the previous one."""
+        # Arrange
+        timer = StartupTimer()
+
+        # Act
+        time.sleep(0.02)
+        timer.mark("imports")
+        time.sleep(0.01)
+        timer.mark("login")
+
+        # Assert
+        assert [phase for phase, _ in timer.phases] == ["imports", "login"]
+        assert timer.phases[0][1] >= 0.02
+        assert 0.01 <= timer.phases[1][1] < timer.phases[0][1]
+        assert timer.total_seconds == sum(duration for _, duration in timer.phases)
+
+    def test_format_report(self):
+        """Test if the report lists the total time and every phase."""
+        # Arrange
+        timer = StartupTimer()
+        timer.phases = [("imports", 0.5), ("login", 1.0)]
+        timer._last_time = timer._start_time + 1.5 # pylint: disable=W0212
+
+        # Act
+        report = timer.format_report()
+
+        # Assert
+        assert report == "Startup took 1.50s: imports 0.50s, login 1.00s"
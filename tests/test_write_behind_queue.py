@@ -0,0 +1,103 @@
+# pylint: disable=E1123
+from utils import database
+from utils.write_behind_queue import WriteBehindQueue
+from utils.data.user import DiscordUser
+from utils.data.discord_server import DiscordServer
+from tinydb import Query
+import os
+import time
+import pytest
+
+
+class TestWriteBehindQueue:
+    """Test class for the WriteBehindQueue class."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        """Setup a fresh database for each test, and clean it up afterwards."""
+        database.setup_database("test_write_behind_queue")
+        yield
+        WriteBehindQueue().flush()
+        database.close_database()
+        os.remove(database.database_path)
+
+    def test_enqueue_merges_writes(self):
+        """Test if repeated writes to the same settings are merged, and different settings are kept apart."""
+        # Arrange
+        queue = WriteBehindQueue(flush_interval_seconds=60, force_new=True)
+
+        # Act
+        queue.enqueue(DiscordUser(id=1, default_world="Bona"))
+        queue.enqueue(DiscordUser(id=1, default_world="Celesta"))
+        queue.enqueue(DiscordServer(id=1, default_world="Antica"))
+
+        # Assert
+        assert queue.pending_count == 2
+        assert queue.merged_count == 1
+        assert queue.get_pending(DiscordUser, 1).default_world == "Celesta"
+        assert queue.get_pending(DiscordUser, 2) is None
+
+    def test_flush_writes_batches(self):
+        """Test if a flush writes the latest state of all pending settings to the database."""
+        # Arrange
+        queue = WriteBehindQueue(flush_interval_seconds=60, force_new=True)
+        queue.enqueue(DiscordUser(id=1, default_world="Bona"))
+        queue.enqueue(DiscordUser(id=1, default_world="Celesta"))
+        queue.enqueue(DiscordUser(id=2, default_world="Bona"))
+
+        # Act
+        queue.flush()
+        users = database.get_table(DiscordUser).get_data(Query().default_world.exists())
+
+        # Assert
+        assert queue.pending_count == 0
+        assert queue.write_count == 2
+        assert sorted((user.id, user.default_world) for user in users) == [(1, "Celesta"), (2, "Bona")]
+
+    def test_enqueue_flushes_after_interval_and_size(self):
+        """Test if pending writes are flushed in the background after the interval, or right away once enough are pending."""
+        # Arrange
+        interval_queue = WriteBehindQueue(flush_interval_seconds=0.05, force_new=True)
+        interval_queue.enqueue(DiscordUser(id=1))
+        size_queue = WriteBehindQueue(flush_interval_seconds=60, max_pending=2, force_new=True)
+
+        # Act
+        size_queue.enqueue(DiscordUser(id=2))
+        size_queue.enqueue(DiscordUser(id=3))
+        time.sleep(0.5)
+
+        # Assert
+        assert interval_queue.pending_count == 0
+        assert size_queue.pending_count == 0
+        assert len(database.get_table(DiscordUser).get_data(Query().default_world.exists())) == 3
+
+    def test_flush_failed_batch_is_retried(self, mocker):
+        """Test if a batch that failed to be written is retried in the background, without another write."""
+        # Arrange
+        queue = WriteBehindQueue(flush_interval_seconds=0.05, force_new=True)
+        table = database.get_table(DiscordUser)
+        update_many = table.update_many
+        calls = []
+
+        def fail_once(data, key="id"):
+            calls.append(data)
+
+            if len(calls) == 1:
+                raise RuntimeError("Database is locked")
+
+            return update_many(data, key)
+
+        mocker.patch.object(table, "update_many", side_effect=fail_once)
+        queue.enqueue(DiscordUser(id=1, default_world="Bona"))
+
+        # Act
+        queue.flush()
+        pending_count = queue.pending_count
+        time.sleep(0.5)
+
+        # Assert
+        assert pending_count == 1
+        assert queue.pending_count == 0
+        assert queue.write_count == 1
+        assert len(calls) == 2
+        assert table.get_data(Query().id == 1) == [DiscordUser(id=1, default_world="Bona")]